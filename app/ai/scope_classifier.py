@@ -6,7 +6,11 @@ OPTIMIZED Scope Classifier
 """
 from openai import OpenAI
 import json
-from typing import Dict
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from cachetools import LRUCache
 
 from app.config import OPENAI_API_KEY, CLASSIFICATION_MODEL
 
@@ -146,6 +150,33 @@ def try_rule_based_classification(
     Try to classify using rules
     Returns None if ambiguous (needs AI)
     """
+    match = _match_classification_rule(activity_type, description, category)
+    if match is None:
+        return None
+
+    scope, sub_cat, cat_name, reasoning, confidence = match
+    return {
+        'scope': scope,
+        'sub_category': sub_cat,
+        'category_name': cat_name,
+        'reasoning': reasoning,
+        'confidence': confidence,
+        'method': 'rule_based'
+    }
+
+
+# The same activity types/descriptions recur on every upload (monthly diesel,
+# monthly electricity...), so rule matches are memoized on their inputs
+RULE_MATCH_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=RULE_MATCH_CACHE_SIZE)
+def _match_classification_rule(
+        activity_type: Optional[str],
+        description: Optional[str],
+        category: Optional[str]
+) -> Optional[Tuple[str, str, str, str, float]]:
+    """(scope, sub_category, category_name, reasoning, confidence) of the matching rule, or None"""
 
     # Check explicit activity_type first
     if activity_type:
@@ -154,26 +185,12 @@ def try_rule_based_classification(
         # Direct match
         if activity_lower in SCOPE_CLASSIFICATION_RULES:
             scope, sub_cat, cat_name = SCOPE_CLASSIFICATION_RULES[activity_lower]
-            return {
-                'scope': scope,
-                'sub_category': sub_cat,
-                'category_name': cat_name,
-                'reasoning': f'Rule-based: {activity_type}',
-                'confidence': 0.95,
-                'method': 'rule_based'
-            }
+            return scope, sub_cat, cat_name, f'Rule-based: {activity_type}', 0.95
 
         # Partial match
         for key, (scope, sub_cat, cat_name) in SCOPE_CLASSIFICATION_RULES.items():
             if key in activity_lower or activity_lower in key:
-                return {
-                    'scope': scope,
-                    'sub_category': sub_cat,
-                    'category_name': cat_name,
-                    'reasoning': f'Rule-based: matched {key}',
-                    'confidence': 0.90,
-                    'method': 'rule_based'
-                }
+                return scope, sub_cat, cat_name, f'Rule-based: matched {key}', 0.90
 
     # Check description + category
     combined_text = f"{description} {category}".lower()
@@ -187,33 +204,27 @@ def try_rule_based_classification(
     if len(matches) == 1:
         # Single clear match
         key, scope, sub_cat, cat_name = matches[0]
-        return {
-            'scope': scope,
-            'sub_category': sub_cat,
-            'category_name': cat_name,
-            'reasoning': f'Rule-based: keyword {key}',
-            'confidence': 0.85,
-            'method': 'rule_based'
-        }
+        return scope, sub_cat, cat_name, f'Rule-based: keyword {key}', 0.85
 
     elif len(matches) > 1:
         # Multiple matches - pick most specific
         # Prioritize longer keywords (more specific)
         best_match = max(matches, key=lambda x: len(x[0]))
         key, scope, sub_cat, cat_name = best_match
-        return {
-            'scope': scope,
-            'sub_category': sub_cat,
-            'category_name': cat_name,
-            'reasoning': f'Rule-based: best match {key}',
-            'confidence': 0.80,
-            'method': 'rule_based'
-        }
+        return scope, sub_cat, cat_name, f'Rule-based: best match {key}', 0.80
 
     # No match - needs AI
     return None
 
 
+# Successful AI classifications, keyed on (description, category, unit). The
+# quantity only gives the model context, so it is left out of the key to keep
+# repeat activities hitting the cache. Fallbacks are not cached so failures retry.
+AI_CLASSIFICATION_CACHE_SIZE = 10000
+_ai_classification_cache = LRUCache(maxsize=AI_CLASSIFICATION_CACHE_SIZE)
+_ai_classification_cache_lock = threading.Lock()
+
+
 def classify_with_ai(
         activity_description: str,
         category: str,
@@ -223,6 +234,11 @@ def classify_with_ai(
     """
     AI classification (fallback for ambiguous cases)
     """
+    cache_key = (activity_description, category, unit)
+    with _ai_classification_cache_lock:
+        cached = _ai_classification_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
 
     prompt = f"""
 Classify this emission activity into GHG Protocol scope.
@@ -272,6 +288,8 @@ Return ONLY JSON.
         classification = json.loads(result_text.strip())
         classification['method'] = 'ai'
 
+        with _ai_classification_cache_lock:
+            _ai_classification_cache[cache_key] = dict(classification)
         return classification
 
     except Exception as e:
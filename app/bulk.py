@@ -425,7 +425,7 @@ async def download_template():
     # Save to temp file
     temp_file = "uploads/bulk_import_template.xlsx"
 
-    with pd.ExcelWriter(temp_file, engine='openpyxl') as writer:
+    with pd.ExcelWriter(temp_file, engine='xlsxwriter') as writer:
         # Write sample data
         sample_data.to_excel(writer, sheet_name='Sample Data', index=False)
 
@@ -17,15 +17,21 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict
+import copy
 import json
+import logging
 import re
+import threading
 from datetime import datetime
 import os
+from cachetools import LRUCache
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Try to import RapidFuzz (faster), fallback to FuzzyWuzzy
 try:
     from rapidfuzz import fuzz
@@ -41,6 +47,10 @@ OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
 OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
 AI_ESTIMATION_ENABLED = os.getenv('AI_ESTIMATION_ENABLED', 'true').lower() == 'true'
 
+# Database factor lookups (layers 0-2) depend only on activity, unit and region,
+# so their results are kept per triplet; CO2e is then quantity * factor
+FACTOR_CACHE_SIZE = 10000
+
 
 @dataclass
 class EmissionResult:
@@ -99,6 +109,10 @@ class UnifiedEmissionEngine:
         self.load_databases()
         self._init_classifications()
 
+        # (activity_type, unit, region) -> (stats key, EmissionResult template) or None
+        self._factor_cache = LRUCache(maxsize=FACTOR_CACHE_SIZE)
+        self._factor_cache_lock = threading.Lock()
+
         self.search_stats = {
             'total_searches': 0,
             'india_db_hits': 0,
@@ -287,6 +301,66 @@ class UnifiedEmissionEngine:
 
         return result
 
+    def calculate_emissions_batch(
+            self,
+            activity_types: List[str],
+            quantities: np.ndarray,
+            units: List[str],
+            regions: List[str]
+    ) -> List[EmissionResult]:
+        """
+        calculate_emissions for many rows at once (bulk imports)
+
+        Rows are grouped by (activity_type, unit, region): intent detection and the
+        database factor lookup run once per group, and CO2e for all of a group's
+        rows is one NumPy multiply. Groups without a database factor fall back to
+        calculate_emissions row by row (AI estimation depends on the quantity).
+
+        Returns:
+            One EmissionResult per input row, in input order
+        """
+        quantities = np.asarray(quantities, dtype=np.float64)
+        groups: Dict[Tuple[str, str, str], List[int]] = {}
+        for index, key in enumerate(zip(activity_types, units, regions)):
+            groups.setdefault(key, []).append(index)
+
+        logger.debug("Batch calculation: %d rows, %d factor lookups", len(quantities), len(groups))
+
+        results: List[Optional[EmissionResult]] = [None] * len(quantities)
+        for (activity_type, unit, region), indices in groups.items():
+            try:
+                intent = self._detect_intent(activity_type, unit, "", "")
+                factor = self._cached_factor_lookup(activity_type, unit, region, intent)
+                if factor is None:
+                    for index in indices:
+                        results[index] = self.calculate_emissions(
+                            activity_type=activity_type,
+                            quantity=float(quantities[index]),
+                            unit=unit,
+                            region=region
+                        )
+                    continue
+
+                stats_key, template = factor
+                self.search_stats['total_searches'] += len(indices)
+                self.search_stats[stats_key] += len(indices)
+                co2e = (quantities[indices] * template.emission_factor).tolist()
+                timestamp = datetime.now().isoformat()
+                for index, value in zip(indices, co2e):
+                    result = copy.deepcopy(template)
+                    result.timestamp = timestamp
+                    result.co2e_kg = round(value, 2)
+                    result.scope = intent['scope']
+                    result.category = intent['category']
+                    result.intent_detected = intent['type']
+                    results[index] = result
+            except Exception as e:
+                for index in indices:
+                    if results[index] is None:
+                        results[index] = EmissionResult(success=False, error=str(e))
+
+        return results
+
     def _detect_intent(self, activity: str, unit: str, description: str, context: str) -> Dict:
         """Detect activity intent and classify"""
 
@@ -360,59 +434,99 @@ class UnifiedEmissionEngine:
         Layer 3: AI estimation (NEW)
         """
 
+        # Layers 0-2: database factor lookup (cached per activity/unit/region)
+        factor = self._cached_factor_lookup(activity_type, unit, region, intent)
+        if factor is not None:
+            stats_key, template = factor
+            self.search_stats[stats_key] += 1
+            result = copy.deepcopy(template)
+            result.timestamp = datetime.now().isoformat()
+            result.co2e_kg = round(quantity * result.emission_factor, 2)
+            return result
+
+        # Layer 3: AI Estimation
+        print(f"\n🔍 Layer 3: AI Estimation...")
+        result = self._ai_estimation(activity_type, unit, region, quantity, description, intent)
+        if result.success:
+            self.search_stats['ai_estimation_hits'] += 1
+            result.layer = 3
+            print(f"   🤖 AI Estimated! EF: {result.emission_factor} {result.emission_factor_unit}")
+            print(f"   ⚠️  Confidence: {result.confidence * 100:.0f}%")
+            return result
+        print(f"   ❌ AI estimation unavailable")
+
+        # Final fallback
+        self.search_stats['failures'] += 1
+        return EmissionResult(
+            success=False,
+            error=f'No emission factor found for {activity_type} ({unit})',
+            suggestion='Please provide supplier-specific data or contact support',
+            layer=4
+        )
+
+    def _cached_factor_lookup(
+            self,
+            activity_type: str,
+            unit: str,
+            region: str,
+            intent: Dict
+    ) -> Optional[Tuple[str, EmissionResult]]:
+        """Layers 0-2 for this activity/unit/region, searched once and then served from cache"""
+        key = (activity_type, unit, region)
+        with self._factor_cache_lock:
+            if key in self._factor_cache:
+                factor = self._factor_cache[key]
+                if factor is not None:
+                    logger.debug("Cached factor (Layer %s): %s %s", factor[1].layer,
+                                 factor[1].emission_factor, factor[1].emission_factor_unit)
+                return factor
+
+        factor = self._lookup_factor(activity_type, unit, region, intent)
+        with self._factor_cache_lock:
+            self._factor_cache[key] = factor
+        return factor
+
+    def _lookup_factor(
+            self,
+            activity_type: str,
+            unit: str,
+            region: str,
+            intent: Dict
+    ) -> Optional[Tuple[str, EmissionResult]]:
+        """
+        Search the factor databases (layers 0-2).
+        Returns (search_stats key, result without co2e_kg) or None if nothing matched.
+        """
+
         # Layer 0: India DB
         print(f"\n🔍 Layer 0: India-Specific Database...")
         if not self.india_df.empty:
             result = self._search_india_db(activity_type, unit, region)
             if result.success:
-                self.search_stats['india_db_hits'] += 1
                 result.layer = 0
-                result.co2e_kg = round(quantity * result.emission_factor, 2)
                 print(f"   ✅ Found! EF: {result.emission_factor} {result.emission_factor_unit}")
-                return result
+                return 'india_db_hits', result
         print(f"   ❌ Not found")
 
         # Layer 1: Smart Fuzzy Match
         print(f"\n🔍 Layer 1: Smart Fuzzy Match (IPCC + DEFRA)...")
         result = self._smart_fuzzy_search(activity_type, unit, region, intent)
         if result.success:
-            self.search_stats['layer_1_hits'] += 1
             result.layer = 1
-            result.co2e_kg = round(quantity * result.emission_factor, 2)
             print(f"   ✅ Found! EF: {result.emission_factor} {result.emission_factor_unit}")
-            return result
+            return 'layer_1_hits', result
         print(f"   ❌ Not found")
 
         # Layer 2: Category Proxy
         print(f"\n🔍 Layer 2: Category Proxy Factors...")
         result = self._proxy_factors(activity_type, unit, intent)
         if result.success:
-            self.search_stats['layer_2_hits'] += 1
             result.layer = 2
-            result.co2e_kg = round(quantity * result.emission_factor, 2)
             print(f"   ✅ Found! EF: {result.emission_factor} {result.emission_factor_unit}")
-            return result
+            return 'layer_2_hits', result
         print(f"   ❌ Not found")
 
-        # Layer 3: AI Estimation
-        print(f"\n🔍 Layer 3: AI Estimation...")
-        result = self._ai_estimation(activity_type, unit, region, quantity, description, intent)
-        if result.success:
-            self.search_stats['ai_estimation_hits'] += 1
-            result.layer = 3
-            print(f"   🤖 AI Estimated! EF: {result.emission_factor} {result.emission_factor_unit}")
-            print(f"   ⚠️  Confidence: {result.confidence * 100:.0f}%")
-            return result
-        print(f"   ❌ AI estimation unavailable")
-
-        # Final fallback
-        self.search_stats['failures'] += 1
-        return EmissionResult(
-            success=False,
-            error=f'No emission factor found for {activity_type} ({unit})',
-            suggestion='Please provide supplier-specific data or contact support',
-            layer=4
-        )
+        return None
 
     # ================================================================
     # LAYER 0: INDIA DATABASE
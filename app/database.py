@@ -3,6 +3,8 @@
 Database connection and session management
 Comprehensive emission factor database based on international standards
 """
+import json
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base  # ✅ ADD THIS
 from sqlalchemy.orm import sessionmaker
@@ -13,10 +15,26 @@ Base = declarative_base()
 # SQLite database for development (easy setup, no installation needed)
 DATABASE_URL = "sqlite:///./carbon_accounting.db"
 
+
+def _json_serializer(value) -> str:
+    """JSON columns are encoded with orjson (the DB driver wants text)"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _json_deserializer(text: str):
+    """Decode JSON columns with orjson; rows written by json.dumps with NaN/Infinity fall back to json"""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    connect_args={"check_same_thread": False},  # Needed for SQLite
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer
 )
 
 # Create session factory
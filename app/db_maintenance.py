@@ -85,3 +85,108 @@ def ensure_ai_recommendation_schema():
 
     _ai_schema_checked = True
 
+
+
+_report_indexes_checked = False
+
+
+def ensure_report_indexes():
+    """
+    Create the composite indexes used by the reporting queries on databases
+    that were created before they were declared on the models.
+    (create_all only adds indexes when it creates the table itself.)
+    """
+    global _report_indexes_checked
+
+    if _report_indexes_checked:
+        return
+
+    from sqlalchemy.schema import CreateIndex
+    from app import models  # Local import to avoid cycles
+
+    report_tables = [
+        models.EmissionActivity.__table__,
+        models.WaterUsage.__table__,
+        models.WasteDisposal.__table__,
+    ]
+
+    with engine.begin() as conn:
+        for table in report_tables:
+            for index in table.indexes:
+                # Single-column indexes come from index=True and already exist.
+                # IF NOT EXISTS rather than checkfirst: SQLite reflection skips
+                # expression indexes, so checkfirst would recreate them.
+                if len(index.expressions) > 1:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+
+    _report_indexes_checked = True
+
+
+_emission_rollup_checked = False
+
+
+def rebuild_emission_rollup(conn, company_id=None):
+    """
+    Recompute emission_rollup_daily from emission_activities (all companies,
+    or just one). Use after writes that bypass the ORM flush listeners.
+    """
+    from sqlalchemy import func, select
+    from app import models  # Local import to avoid cycles
+
+    rollup = models.EmissionRollupDaily.__table__
+    activity = models.EmissionActivity.__table__
+
+    day = func.date(activity.c.activity_date)
+    scope_number = func.coalesce(activity.c.scope_number, 0)
+    category = func.coalesce(activity.c.category, "")
+
+    source = select(
+        activity.c.company_id,
+        day,
+        scope_number,
+        category,
+        func.coalesce(func.sum(activity.c.emissions_kgco2e), 0.0),
+        func.count(activity.c.id)
+    ).where(
+        activity.c.company_id.isnot(None),
+        activity.c.activity_date.isnot(None)
+    ).group_by(activity.c.company_id, day, scope_number, category)
+
+    delete = rollup.delete()
+    if company_id is not None:
+        source = source.where(activity.c.company_id == company_id)
+        delete = delete.where(rollup.c.company_id == company_id)
+
+    conn.execute(delete)
+    conn.execute(rollup.insert().from_select(
+        ["company_id", "activity_date", "scope_number", "category", "total_kg", "count"],
+        source
+    ))
+
+
+def ensure_emission_rollup():
+    """
+    Create the daily rollup table if needed and backfill it when it is empty
+    but activities already exist (databases created before the rollup).
+    """
+    global _emission_rollup_checked
+
+    if _emission_rollup_checked:
+        return
+
+    from app import models  # Local import to avoid cycles
+
+    rollup = models.EmissionRollupDaily.__table__
+    Base.metadata.create_all(bind=engine, tables=[rollup])
+
+    with engine.begin() as conn:
+        has_rollup = conn.execute(rollup.select().limit(1)).first() is not None
+        if not has_rollup:
+            has_activities = conn.execute(
+                models.EmissionActivity.__table__.select().limit(1)
+            ).first() is not None
+            if has_activities:
+                rebuild_emission_rollup(conn)
+                print("✅ Emission rollup backfilled from existing activities")
+
+    _emission_rollup_checked = True
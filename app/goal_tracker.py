@@ -160,14 +160,12 @@ def project_future_emissions(
             "error": "Insufficient historical data for projection"
         }
 
-    # Group by month
+    # Group by month ((year, month) keys sort like "YYYY-MM" without strftime per row)
     monthly_totals = {}
     for a in activities:
         if a.activity_date:
-            month_key = a.activity_date.strftime("%Y-%m")
-            if month_key not in monthly_totals:
-                monthly_totals[month_key] = 0
-            monthly_totals[month_key] += a.emissions_kgco2e
+            month_key = (a.activity_date.year, a.activity_date.month)
+            monthly_totals[month_key] = monthly_totals.get(month_key, 0) + a.emissions_kgco2e
 
     # Simple trend analysis
     months = sorted(monthly_totals.keys())
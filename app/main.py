@@ -35,6 +35,7 @@ print("✅ Standard libs imported")
 print("🔹 Importing database...")
 
 from app.database import SessionLocal, engine, Base, get_db, seed_cbam_goods  # ✅ Make sure get_db is here
+from app.db_maintenance import ensure_report_indexes, ensure_emission_rollup
 
 print("✅ Database imported")
 
@@ -1320,6 +1321,18 @@ async def startup_event():
         seed_cbam_goods()
     except Exception as e:
         print(f"⚠️ Error seeding CBAM goods: {e}")
+
+    try:
+        # Composite indexes for report queries on pre-existing databases
+        ensure_report_indexes()
+    except Exception as e:
+        print(f"⚠️ Error creating report indexes: {e}")
+
+    try:
+        # Daily rollup read by the summary/trend reports
+        ensure_emission_rollup()
+    except Exception as e:
+        print(f"⚠️ Error preparing emission rollup: {e}")
     
     print("=" * 70)
     print("🚀 CARBON ACCOUNTING PLATFORM API v3.0")
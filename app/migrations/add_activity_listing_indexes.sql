@@ -0,0 +1,28 @@
+-- Activity listing indexes
+-- The activity listing filters by company + effective date (activity_date,
+-- falling back to created_at) and orders by it newest first, with created_at
+-- and id as tiebreakers. The expression index matches that ORDER BY exactly,
+-- so a page is read off the index instead of sorting every matching row.
+-- Run this script on existing PostgreSQL databases. CONCURRENTLY avoids locking
+-- writes while the index builds, so run it outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_activity_company_effective_date
+    ON emission_activities (company_id, (COALESCE(activity_date, created_at)) DESC, created_at DESC, id DESC);
+
+-- The search box and the category/activity type filters use ILIKE '%term%',
+-- which no btree can serve. Trigram GIN indexes let PostgreSQL answer them
+-- (and the OR across the four search columns) with bitmap index scans.
+-- PostgreSQL only; SQLite keeps scanning the company's rows.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_activity_name_trgm
+    ON emission_activities USING gin (activity_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_activity_type_trgm
+    ON emission_activities USING gin (activity_type gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_activity_description_trgm
+    ON emission_activities USING gin (description gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_activity_category_trgm
+    ON emission_activities USING gin (category gin_trgm_ops);
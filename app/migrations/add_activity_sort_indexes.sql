@@ -0,0 +1,15 @@
+-- Activity sort indexes
+-- The activity listings and exports filter by company + date range and order
+-- by activity_date DESC, emissions_kgco2e DESC; the top-emitter lists order by
+-- emissions_kgco2e DESC alone. Matching index order lets PostgreSQL read the
+-- first rows off the index instead of sorting the whole range.
+-- Run this script on existing PostgreSQL databases. CONCURRENTLY avoids locking
+-- writes while the index builds, so run it outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_activity_company_date_emissions
+    ON emission_activities (company_id, activity_date DESC, emissions_kgco2e DESC)
+    INCLUDE (activity_name, activity_type, scope_number, category);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_activity_company_emissions
+    ON emission_activities (company_id, emissions_kgco2e DESC)
+    WHERE activity_date IS NOT NULL;
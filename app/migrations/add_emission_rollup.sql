@@ -0,0 +1,34 @@
+-- Daily emission rollup
+-- One row per company/day/scope/category, maintained by the EmissionActivity
+-- flush listeners in app/models.py and read by the summary/trend reports.
+-- Run this script on existing PostgreSQL databases.
+
+CREATE TABLE IF NOT EXISTS emission_rollup_daily (
+    id SERIAL PRIMARY KEY,
+    company_id INTEGER NOT NULL REFERENCES companies(id),
+    activity_date DATE NOT NULL,
+    scope_number INTEGER NOT NULL DEFAULT 0,
+    category VARCHAR NOT NULL DEFAULT '',
+    total_kg DOUBLE PRECISION NOT NULL DEFAULT 0,
+    count INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT uq_emission_rollup_daily_key
+        UNIQUE (company_id, activity_date, scope_number, category)
+);
+
+CREATE INDEX IF NOT EXISTS ix_emission_rollup_daily_id
+    ON emission_rollup_daily (id);
+
+-- Backfill from existing activities (no-op once the rollup has rows)
+INSERT INTO emission_rollup_daily
+    (company_id, activity_date, scope_number, category, total_kg, count)
+SELECT company_id,
+       DATE(activity_date),
+       COALESCE(scope_number, 0),
+       COALESCE(category, ''),
+       COALESCE(SUM(emissions_kgco2e), 0),
+       COUNT(id)
+FROM emission_activities
+WHERE company_id IS NOT NULL
+  AND activity_date IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM emission_rollup_daily)
+GROUP BY company_id, DATE(activity_date), COALESCE(scope_number, 0), COALESCE(category, '');
@@ -0,0 +1,15 @@
+-- Report query indexes
+-- Composite indexes for the reporting helpers, which filter by company and
+-- date range (and often scope) before aggregating emissions.
+-- Run this script on existing PostgreSQL databases.
+
+-- Covering index: INCLUDE lets category/emission aggregates run index-only
+CREATE INDEX IF NOT EXISTS ix_emission_activity_company_date_scope
+    ON emission_activities (company_id, activity_date, scope_number)
+    INCLUDE (emissions_kgco2e, category);
+
+CREATE INDEX IF NOT EXISTS ix_water_usage_company_created
+    ON water_usage (company_id, created_at);
+
+CREATE INDEX IF NOT EXISTS ix_waste_disposal_company_created
+    ON waste_disposal (company_id, created_at);
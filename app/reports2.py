@@ -2,25 +2,38 @@
 Reports & Analytics Router
 Generate comprehensive emission reports with PDF and Excel exports
 """
-from fastapi import APIRouter, Depends, HTTPException, Response
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse, JSONResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import func, extract, cast, case, literal, select, union_all, and_, Integer, String
+from typing import Iterable, List, Optional, Dict, Any, Sequence
 from datetime import datetime, date, timedelta
 from pydantic import BaseModel
+import numpy as np
 import pandas as pd
+import asyncio
+import csv
 import io
+import logging
 import json
-from openpyxl.chart import PieChart, BarChart, LineChart, Reference
-from openpyxl.chart.label import DataLabelList
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+import orjson
+import multiprocessing
+import os
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from concurrent.futures.process import BrokenProcessPool
+from cachetools import TTLCache
+import xlsxwriter
 
 # PDF Generation imports
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, PageBreak, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
@@ -29,15 +42,39 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 import matplotlib
 
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
-from app.database import get_db
-from app.models import EmissionActivity, Company, User, Goal, AIRecommendation
+# Faster Agg rendering for long trend lines
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+
+from app.database import get_db, SessionLocal
+from app.models import EmissionActivity, EmissionRollupDaily, Company, User, Goal, AIRecommendation
 from app.routers.auth import get_current_user
 from app.db_maintenance import ensure_ai_recommendation_schema
+from app.services.company_profile import load_company_profile_fields
+from app.services.pdf_generator import (
+    chart_image, render_scope_pie_png, render_scope_bar_png, render_trend_line_png,
+    render_category_bar_png, render_top_emitters_png
+)
 
 router = APIRouter(prefix="/api/v1/reports", tags=["Reports & Analytics"])
 
+logger = logging.getLogger(__name__)
+
+
+class ORJSONReportResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, for endpoints that return plain dicts.
+    Endpoints with a response_model keep FastAPI's default class so Pydantic
+    can serialise them straight to bytes.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 # ==================== PYDANTIC MODELS ====================
 
@@ -124,6 +161,33 @@ class ComprehensiveReportData(BaseModel):
 
 # ==================== HELPER FUNCTIONS ====================
 
+# Rows fetched per round trip when streaming activities into pandas
+REPORT_STREAM_BATCH_SIZE = 1000
+
+
+def activity_date_in_range(start_date: date, end_date: date):
+    """
+    EmissionActivity.activity_date within start_date..end_date by whole day.
+    activity_date is a DateTime, so the end bound is the next midnight
+    (exclusive) — the same days the daily rollup counts.
+    """
+    return and_(
+        EmissionActivity.activity_date >= start_date,
+        EmissionActivity.activity_date < end_date + timedelta(days=1)
+    )
+
+
+def iter_query_frames(db: Session, query, columns: List[str], batch_size: int = REPORT_STREAM_BATCH_SIZE):
+    """
+    Stream a column query in batches as DataFrames. yield_per uses a
+    server-side cursor where the driver supports it, so memory is bounded
+    by the batch size instead of the full result.
+    """
+    result = db.execute(query.statement.execution_options(yield_per=batch_size))
+    for rows in result.partitions():
+        yield pd.DataFrame(rows, columns=columns)
+
+
 def calculate_summary_metrics(
         db: Session,
         company_id: int,
@@ -132,35 +196,47 @@ def calculate_summary_metrics(
         scope: Optional[int] = None,
         category: Optional[str] = None
 ) -> SummaryMetrics:
-    """Calculate summary metrics for a date range"""
-
-    # Base query
-    query = db.query(EmissionActivity).filter(
-        EmissionActivity.company_id == company_id,
-        EmissionActivity.activity_date >= start_date,
-        EmissionActivity.activity_date <= end_date
-    )
-
-    if scope:
-        query = query.filter(EmissionActivity.scope_number == scope)
-    if category:
-        query = query.filter(EmissionActivity.category.ilike(f"%{category}%"))
+    """Calculate summary metrics for a date range (read from the daily rollup)"""
 
-    records = query.all()
-
-    # Calculate totals
-    total_emissions = sum(r.emissions_kgco2e for r in records)
-    scope1 = sum(r.emissions_kgco2e for r in records if r.scope_number == 1)
-    scope2 = sum(r.emissions_kgco2e for r in records if r.scope_number == 2)
-    scope3 = sum(r.emissions_kgco2e for r in records if r.scope_number == 3)
-
-    # Category breakdown
+    def rollup_query(*columns, period_start: date, period_end: date):
+        query = db.query(*columns).filter(
+            EmissionRollupDaily.company_id == company_id,
+            EmissionRollupDaily.activity_date >= period_start,
+            EmissionRollupDaily.activity_date <= period_end
+        )
+        if scope:
+            query = query.filter(EmissionRollupDaily.scope_number == scope)
+        if category:
+            query = query.filter(EmissionRollupDaily.category.ilike(f"%{category}%"))
+        return query
+
+    # One grouped pass over the rollup gives both the scope totals and the top category
+    rows = rollup_query(
+        EmissionRollupDaily.scope_number,
+        EmissionRollupDaily.category,
+        func.sum(EmissionRollupDaily.total_kg),
+        func.sum(EmissionRollupDaily.count),
+        period_start=start_date,
+        period_end=end_date
+    ).group_by(EmissionRollupDaily.scope_number, EmissionRollupDaily.category).all()
+
+    total_emissions = 0.0
+    total_activities = 0
+    scope_totals = {}
     category_totals = {}
-    for r in records:
-        cat = r.category or "Uncategorized"
-        category_totals[cat] = category_totals.get(cat, 0) + r.emissions_kgco2e
-
-    top_category = max(category_totals.items(), key=lambda x: x[1]) if category_totals else ("N/A", 0)
+    for scope_number, category_name, emissions, count in rows:
+        emissions = float(emissions or 0)
+        total_emissions += emissions
+        total_activities += int(count or 0)
+        scope_totals[scope_number] = scope_totals.get(scope_number, 0.0) + emissions
+        label = category_name or "Uncategorized"
+        category_totals[label] = category_totals.get(label, 0.0) + emissions
+    scope_sums = {scope_number: round(total, 2) for scope_number, total in scope_totals.items()}
+
+    if category_totals:
+        top_category = max(category_totals.items(), key=lambda item: item[1])
+    else:
+        top_category = ("N/A", 0)
 
     # Calculate average daily emissions
     days_diff = (end_date - start_date).days + 1
@@ -171,35 +247,84 @@ def calculate_summary_metrics(
     previous_start = start_date - timedelta(days=period_length)
     previous_end = start_date - timedelta(days=1)
 
-    previous_query = db.query(func.sum(EmissionActivity.emissions_kgco2e)).filter(
-        EmissionActivity.company_id == company_id,
-        EmissionActivity.activity_date >= previous_start,
-        EmissionActivity.activity_date <= previous_end
-    )
-
-    if scope:
-        previous_query = previous_query.filter(EmissionActivity.scope_number == scope)
-    if category:
-        previous_query = previous_query.filter(EmissionActivity.category.ilike(f"%{category}%"))
-
-    previous_emissions = previous_query.scalar() or 0
+    previous_emissions = rollup_query(
+        func.sum(EmissionRollupDaily.total_kg), period_start=previous_start, period_end=previous_end
+    ).scalar() or 0
 
     comparison = ((total_emissions - previous_emissions) / previous_emissions * 100) if previous_emissions > 0 else 0
 
-    return SummaryMetrics(
+    # Values are computed here and already typed, so skip validation
+    return SummaryMetrics.model_construct(
         total_emissions_kg=round(total_emissions, 2),
         total_emissions_tons=round(total_emissions / 1000, 2),
-        scope1_emissions=round(scope1, 2),
-        scope2_emissions=round(scope2, 2),
-        scope3_emissions=round(scope3, 2),
-        top_category=top_category[0],
-        top_category_emissions=round(top_category[1], 2),
-        average_daily_emissions=round(avg_daily, 2),
-        total_activities=len(records),
-        comparison_to_previous_period=round(comparison, 2)
+        scope1_emissions=float(scope_sums.get(1, 0.0)),
+        scope2_emissions=float(scope_sums.get(2, 0.0)),
+        scope3_emissions=float(scope_sums.get(3, 0.0)),
+        top_category=str(top_category[0]),
+        top_category_emissions=round(float(top_category[1]), 2),
+        average_daily_emissions=round(float(avg_daily), 2),
+        total_activities=int(total_activities),
+        comparison_to_previous_period=round(float(comparison), 2)
     )
 
 
+def _trend_period_expression(db: Session, group_by: str):
+    """
+    Build a SQL expression that renders the rollup day as the trend period label.
+    Labels match the Python formats used historically (YYYY-MM-DD, YYYY-Www,
+    YYYY-MM, YYYY-Qn, YYYY). Returns None for dialects we don't translate.
+    """
+    dialect = db.bind.dialect.name if db.bind is not None else ""
+    column = EmissionRollupDaily.activity_date
+
+    if dialect == "sqlite":
+        if group_by == "day":
+            return func.strftime("%Y-%m-%d", column, type_=String)
+        if group_by == "week":
+            # Sunday-based week number, same as Python's %U
+            day_of_year = cast(func.strftime("%j", column), Integer)
+            weekday = cast(func.strftime("%w", column), Integer)
+            week = (day_of_year + 6 - weekday) // 7
+            return func.printf("%s-W%02d", func.strftime("%Y", column), week, type_=String)
+        if group_by == "quarter":
+            quarter = (cast(func.strftime("%m", column), Integer) + 2) // 3
+            return func.printf("%s-Q%d", func.strftime("%Y", column), quarter, type_=String)
+        if group_by == "year":
+            return func.strftime("%Y", column, type_=String)
+        return func.strftime("%Y-%m", column, type_=String)
+
+    if dialect == "postgresql":
+        if group_by == "week":
+            day_of_year = cast(extract("doy", column), Integer)
+            weekday = cast(extract("dow", column), Integer)
+            week = (day_of_year + 6 - weekday) // 7
+            return func.concat(
+                func.to_char(column, "YYYY"), "-W", func.lpad(cast(week, String), 2, "0"),
+                type_=String
+            )
+        formats = {
+            "day": "YYYY-MM-DD",
+            "quarter": 'YYYY-"Q"Q',
+            "year": "YYYY",
+        }
+        return func.to_char(column, formats.get(group_by, "YYYY-MM"), type_=String)
+
+    return None
+
+
+def _pandas_period_keys(activity_dates: pd.Series, group_by: str) -> pd.Series:
+    """Period labels for a column of dates (used when the dialect has no SQL mapping)"""
+    if group_by == "day":
+        return activity_dates.dt.strftime("%Y-%m-%d")
+    if group_by == "week":
+        return activity_dates.dt.strftime("%Y-W%U")
+    if group_by == "quarter":
+        return activity_dates.dt.year.astype(str) + "-Q" + activity_dates.dt.quarter.astype(str)
+    if group_by == "year":
+        return activity_dates.dt.year.astype(str)
+    return activity_dates.dt.strftime("%Y-%m")
+
+
 def generate_trend_data(
         db: Session,
         company_id: int,
@@ -209,63 +334,74 @@ def generate_trend_data(
         scope: Optional[int] = None,
         category: Optional[str] = None
 ) -> List[TrendData]:
-    """Generate trend data grouped by specified period"""
-
-    query = db.query(EmissionActivity).filter(
-        EmissionActivity.company_id == company_id,
-        EmissionActivity.activity_date >= start_date,
-        EmissionActivity.activity_date <= end_date
-    )
+    """Generate trend data grouped by specified period (read from the daily rollup)"""
 
+    filters = [
+        EmissionRollupDaily.company_id == company_id,
+        EmissionRollupDaily.activity_date >= start_date,
+        EmissionRollupDaily.activity_date <= end_date
+    ]
     if scope:
-        query = query.filter(EmissionActivity.scope_number == scope)
+        filters.append(EmissionRollupDaily.scope_number == scope)
     if category:
-        query = query.filter(EmissionActivity.category.ilike(f"%{category}%"))
-
-    records = query.all()
-
-    # Group data
-    grouped_data = {}
-
-    for record in records:
-        if not record.activity_date:
-            continue
-
-        if group_by == "day":
-            period_key = record.activity_date.strftime("%Y-%m-%d")
-        elif group_by == "week":
-            period_key = record.activity_date.strftime("%Y-W%U")
-        elif group_by == "month":
-            period_key = record.activity_date.strftime("%Y-%m")
-        elif group_by == "quarter":
-            quarter = (record.activity_date.month - 1) // 3 + 1
-            period_key = f"{record.activity_date.year}-Q{quarter}"
-        elif group_by == "year":
-            period_key = str(record.activity_date.year)
-        else:
-            period_key = record.activity_date.strftime("%Y-%m")
-
-        if period_key not in grouped_data:
-            grouped_data[period_key] = {
-                "emissions": 0,
-                "count": 0
-            }
+        filters.append(EmissionRollupDaily.category.ilike(f"%{category}%"))
+
+    period_expr = _trend_period_expression(db, group_by)
+
+    if period_expr is not None:
+        # Bucket in SQL: one row per period instead of one per day
+        period = period_expr.label('period')
+        rows = db.query(
+            period,
+            func.sum(EmissionRollupDaily.total_kg),
+            func.sum(EmissionRollupDaily.count)
+        ).filter(*filters).group_by(period).order_by(period).all()
+        grouped_data = {p: {"emissions": e or 0, "count": int(c or 0)} for p, e, c in rows}
+    else:
+        column_query = db.query(
+            EmissionRollupDaily.activity_date,
+            EmissionRollupDaily.total_kg,
+            EmissionRollupDaily.count
+        ).filter(*filters)
+
+        grouped_data = {}
+        bucket_labels = {}
+        for df in iter_query_frames(db, column_query, ["activity_date", "emissions", "count"]):
+            # Every period is day-granular, so format each distinct day once and map it back
+            days = pd.to_datetime(df["activity_date"]).dt.normalize()
+            new_days = pd.Series([day for day in days.unique() if day not in bucket_labels])
+            if not new_days.empty:
+                bucket_labels.update(zip(new_days, _pandas_period_keys(new_days, group_by)))
+            periods = days.map(bucket_labels)
+            totals = df[["emissions", "count"]].groupby(periods).sum()
+            for period, row in totals.iterrows():
+                bucket = grouped_data.setdefault(period, {"emissions": 0.0, "count": 0})
+                bucket["emissions"] += float(row["emissions"])
+                bucket["count"] += int(row["count"])
+
+    if not grouped_data:
+        return []
+
+    # Convert to list (averages and rounding done column-wise)
+    frame = pd.DataFrame.from_dict(grouped_data, orient="index").sort_index()
+    frame["average"] = (frame["emissions"] / frame["count"]).where(frame["count"] > 0, 0.0)
+    rounded = frame[["emissions", "average"]].astype("float64").round(2)
+
+    return [
+        TrendData.model_construct(
+            period=str(period),
+            emissions_kg=emissions,
+            activities_count=int(count),
+            average_emission_per_activity=average
+        )
+        for period, emissions, count, average in zip(
+            frame.index, rounded["emissions"].tolist(), frame["count"].tolist(), rounded["average"].tolist()
+        )
+    ]
 
-        grouped_data[period_key]["emissions"] += record.emissions_kgco2e
-        grouped_data[period_key]["count"] += 1
-
-    # Convert to list
-    trends = []
-    for period, data in sorted(grouped_data.items()):
-        avg_emission = data["emissions"] / data["count"] if data["count"] > 0 else 0
-        trends.append(TrendData(
-            period=period,
-            emissions_kg=round(data["emissions"], 2),
-            activities_count=data["count"],
-            average_emission_per_activity=round(avg_emission, 2)
-        ))
 
-    return trends
+# Above this many categories the percentage math is done in one NumPy pass
+CATEGORY_VECTORIZE_THRESHOLD = 100
 
 
 def generate_category_breakdown(
@@ -275,253 +411,499 @@ def generate_category_breakdown(
         end_date: date,
         scope: Optional[int] = None
 ) -> List[CategoryBreakdown]:
-    """Generate category breakdown"""
+    """Generate category breakdown (grouped and sorted by the database)"""
 
+    total_emissions_col = func.coalesce(func.sum(EmissionActivity.emissions_kgco2e), 0)
     query = db.query(
         EmissionActivity.category,
-        func.sum(EmissionActivity.emissions_kgco2e).label('total_emissions'),
+        total_emissions_col.label('total_emissions'),
         func.count(EmissionActivity.id).label('count')
     ).filter(
         EmissionActivity.company_id == company_id,
-        EmissionActivity.activity_date >= start_date,
-        EmissionActivity.activity_date <= end_date
+        activity_date_in_range(start_date, end_date)
     )
 
     if scope:
         query = query.filter(EmissionActivity.scope_number == scope)
 
-    results = query.group_by(EmissionActivity.category).all()
+    # Largest categories first; category name breaks ties so the order is stable
+    results = query.group_by(EmissionActivity.category).order_by(
+        total_emissions_col.desc(), EmissionActivity.category
+    ).all()
 
-    total_emissions = sum(r.total_emissions for r in results)
+    emissions = [float(r.total_emissions or 0) for r in results]
+    total_emissions = sum(emissions)
+    if total_emissions <= 0:
+        percents = [0.0] * len(emissions)
+    elif len(emissions) > CATEGORY_VECTORIZE_THRESHOLD:
+        percents = (np.array(emissions) / total_emissions * 100).tolist()
+    else:
+        percents = [e / total_emissions * 100 for e in emissions]
 
     breakdown = []
-    for category, emissions, count in results:
-        cat = category or "Uncategorized"
-        percent = (emissions / total_emissions * 100) if total_emissions > 0 else 0
-        breakdown.append(CategoryBreakdown(
-            category=cat,
-            emissions_kg=round(emissions, 2),
+    for (category, _, count), kg, percent in zip(results, emissions, percents):
+        breakdown.append(CategoryBreakdown.model_construct(
+            category=category or "Uncategorized",
+            emissions_kg=round(kg, 2),
             emissions_percent=round(percent, 2),
-            activities_count=count
+            activities_count=int(count)
         ))
 
-    # Sort by emissions descending
-    breakdown.sort(key=lambda x: x.emissions_kg, reverse=True)
-
     return breakdown
 
 
-def get_water_metrics(db: Session, company_id: int, start_date: date, end_date: date) -> Dict[str, Any]:
-    """Get water usage metrics from actual WaterUsage data"""
-    from app.models import WaterUsage
-    from sqlalchemy import func
-    
-    try:
-        # Query water usage records within date range
-        water_records = db.query(WaterUsage).filter(
-            WaterUsage.company_id == company_id,
-            WaterUsage.created_at >= datetime.combine(start_date, datetime.min.time()),
-            WaterUsage.created_at <= datetime.combine(end_date, datetime.max.time())
-        ).all()
-        
-        print(f"🔍 Water metrics query: company_id={company_id}, date_range={start_date} to {end_date}, found {len(water_records)} records")
-        
-        if not water_records or len(water_records) == 0:
-            # Return zeros if no data
-            print(f"✅ No water records found for company {company_id}, returning zeros")
-            return {
-                "total_usage": 0.0,
-                "municipal_water": 0.0,
-                "groundwater": 0.0,
-                "rainwater": 0.0,
-                "surface_water": 0.0,
-                "avg_daily": 0.0,
-                "compliance_status": "No Data Available"
-            }
-        
-        # Calculate totals by source
-        total_usage = 0.0
-        municipal_water = 0.0
-        groundwater = 0.0
-        rainwater = 0.0
-        surface_water = 0.0
-        
-        for record in water_records:
-            withdrawal = record.withdrawal_volume or 0.0
-            total_usage += withdrawal
-            
-            # Group by source
-            source = (record.source or "").lower()
-            if "municipal" in source:
-                municipal_water += withdrawal
-            elif "ground" in source:
-                groundwater += withdrawal
-            elif "rain" in source:
-                rainwater += withdrawal
-            elif "surface" in source:
-                surface_water += withdrawal
-            else:
-                # Default to municipal if source is unclear
-                municipal_water += withdrawal
-        
-        # If all values are zero (no actual data), return zeros
-        if total_usage == 0.0:
-            print(f"✅ Water records found but all values are zero, returning zeros")
-            return {
-                "total_usage": 0.0,
-                "municipal_water": 0.0,
-                "groundwater": 0.0,
-                "rainwater": 0.0,
-                "surface_water": 0.0,
-                "avg_daily": 0.0,
-                "compliance_status": "No Data Available"
-            }
-        
-        # Calculate average daily usage
-        days = (end_date - start_date).days + 1
-        avg_daily = total_usage / days if days > 0 else 0.0
-        
-        return {
-            "total_usage": round(total_usage, 2),
-            "municipal_water": round(municipal_water, 2),
-            "groundwater": round(groundwater, 2),
-            "rainwater": round(rainwater, 2),
-            "surface_water": round(surface_water, 2),
-            "avg_daily": round(avg_daily, 2),
-            "compliance_status": "Compliant" if total_usage > 0 else "No Data Available"
+# ==================== REPORT CACHE ====================
+
+# Summary, trends and category breakdown are pure functions of the company's
+# committed activities, so they are cached per request shape and keyed on a
+# cheap data version (latest updated_at + row count, which also catches deletes).
+_report_cache = TTLCache(maxsize=256, ttl=600)
+_report_cache_lock = threading.Lock()
+
+
+def get_activity_data_version(db: Session, company_id: int):
+    """Cheap change marker for a company's emission activities"""
+    latest_update, activity_count = db.query(
+        func.max(EmissionActivity.updated_at),
+        func.count(EmissionActivity.id)
+    ).filter(EmissionActivity.company_id == company_id).one()
+    return (latest_update.isoformat() if latest_update else None, activity_count)
+
+
+def get_report_data_version(db: Session, company_id: int):
+    """Change marker covering activities plus water and waste records (the environmental metrics)"""
+    from app.models import WaterUsage, WasteDisposal
+
+    def table_version(model):
+        return select(func.max(model.updated_at), func.count(model.id)).where(model.company_id == company_id)
+
+    water = db.execute(table_version(WaterUsage)).one()
+    waste = db.execute(table_version(WasteDisposal)).one()
+    return (
+        get_activity_data_version(db, company_id),
+        tuple(value.isoformat() if isinstance(value, datetime) else value for value in (*water, *waste))
+    )
+
+
+def get_cached_report_sections(
+        db: Session,
+        company_id: int,
+        start_date: date,
+        end_date: date,
+        group_by: str,
+        scope: Optional[int] = None,
+        category: Optional[str] = None,
+        version=None
+):
+    """Return (summary, trends, category_breakdown), reusing cached results while the data is unchanged"""
+    if version is None:
+        version = get_activity_data_version(db, company_id)
+    key = (company_id, start_date, end_date, group_by, scope, category, version)
+
+    with _report_cache_lock:
+        cached = _report_cache.get(key)
+
+    if cached is not None:
+        summary_json, trends_json, categories_json = cached
+        return (
+            SummaryMetrics.model_validate_json(summary_json),
+            [TrendData.model_validate_json(t) for t in trends_json],
+            [CategoryBreakdown.model_validate_json(c) for c in categories_json]
+        )
+
+    summary = calculate_summary_metrics(db, company_id, start_date, end_date, scope, category)
+    trends = generate_trend_data(db, company_id, start_date, end_date, group_by, scope, category)
+    category_breakdown = generate_category_breakdown(db, company_id, start_date, end_date, scope)
+
+    with _report_cache_lock:
+        _report_cache[key] = (
+            summary.model_dump_json(),
+            [t.model_dump_json() for t in trends],
+            [c.model_dump_json() for c in category_breakdown]
+        )
+
+    return summary, trends, category_breakdown
+
+
+def get_cached_emission_sources(
+        db: Session,
+        company_id: int,
+        start_date: date,
+        end_date: date,
+        version=None
+):
+    """Return (scope_breakdown, top_sources) for /generate, cached like the report sections"""
+    if version is None:
+        version = get_activity_data_version(db, company_id)
+    key = ("emission_sources", company_id, start_date, end_date, version)
+
+    with _report_cache_lock:
+        cached = _report_cache.get(key)
+
+    if cached is not None:
+        return orjson.loads(cached)
+
+    scope_query = db.query(
+        EmissionActivity.scope_number,
+        func.sum(EmissionActivity.emissions_kgco2e).label('total')
+    ).filter(
+        EmissionActivity.company_id == company_id,
+        activity_date_in_range(start_date, end_date)
+    ).group_by(EmissionActivity.scope_number).all()
+
+    scope_breakdown = {f"Scope {scope}": round(total, 2) for scope, total in scope_query}
+
+    top_sources_query = db.query(
+        EmissionActivity.activity_name,
+        func.sum(EmissionActivity.emissions_kgco2e).label('total'),
+        func.count(EmissionActivity.id).label('count')
+    ).filter(
+        EmissionActivity.company_id == company_id,
+        activity_date_in_range(start_date, end_date)
+    ).group_by(EmissionActivity.activity_name).order_by(func.sum(EmissionActivity.emissions_kgco2e).desc()).limit(
+        10).all()
+
+    top_sources = [
+        {
+            "activity": name,
+            "total_emissions_kg": round(total, 2),
+            "occurrences": count,
+            "average_per_occurrence": round(total / count, 2) if count > 0 else 0
         }
-    except Exception as e:
-        print(f"⚠️ Error fetching water metrics: {e}")
-        # Return zeros on error
-        return {
-            "total_usage": 0.0,
-            "municipal_water": 0.0,
-            "groundwater": 0.0,
-            "rainwater": 0.0,
-            "surface_water": 0.0,
-            "avg_daily": 0.0,
-            "compliance_status": "Error Fetching Data"
+        for name, total, count in top_sources_query
+    ]
+
+    # Stored serialized so callers never share (and mutate) the cached objects
+    with _report_cache_lock:
+        _report_cache[key] = orjson.dumps([scope_breakdown, top_sources])
+
+    return scope_breakdown, top_sources
+
+
+def _empty_water_metrics(compliance_status: str = "No Data Available") -> Dict[str, Any]:
+    return {
+        "total_usage": 0.0,
+        "municipal_water": 0.0,
+        "groundwater": 0.0,
+        "rainwater": 0.0,
+        "surface_water": 0.0,
+        "avg_daily": 0.0,
+        "compliance_status": compliance_status
     }
 
 
-def get_waste_metrics(db: Session, company_id: int, start_date: date, end_date: date) -> Dict[str, Any]:
-    """Get waste management metrics from actual WasteDisposal data"""
-    from app.models import WasteDisposal
-    from sqlalchemy import func
-    
-    try:
-        # Query waste disposal records within date range
-        waste_records = db.query(WasteDisposal).filter(
-            WasteDisposal.company_id == company_id,
-            WasteDisposal.created_at >= datetime.combine(start_date, datetime.min.time()),
-            WasteDisposal.created_at <= datetime.combine(end_date, datetime.max.time())
-        ).all()
-        
-        print(f"🔍 Waste metrics query: company_id={company_id}, date_range={start_date} to {end_date}, found {len(waste_records)} records")
-        
-        if not waste_records or len(waste_records) == 0:
-            # Return zeros if no data
-            print(f"✅ No waste records found for company {company_id}, returning zeros")
-            return {
-                "total_waste": 0.0,
-                "recycled": 0.0,
-                "landfill": 0.0,
-                "incinerated": 0.0,
-                "composted": 0.0,
-                "recycling_rate": 0.0,
-                "compliance_status": "No Data Available"
-            }
-        
-        # Calculate totals by disposal method
-        total_waste = 0.0
-        recycled = 0.0
-        landfill = 0.0
-        incinerated = 0.0
-        composted = 0.0
-        
-        for record in waste_records:
-            quantity = record.quantity or 0.0
-            total_waste += quantity
-            
-            # Group by disposal method
-            method = (record.disposal_method or "").lower()
-            if "recycl" in method:
-                recycled += quantity
-            elif "landfill" in method or "dump" in method:
-                landfill += quantity
-            elif "incinerat" in method or "burn" in method:
-                incinerated += quantity
-            elif "compost" in method:
-                composted += quantity
-            else:
-                # Default to landfill if method is unclear
-                landfill += quantity
-        
-        # If all values are zero (no actual data), return zeros
-        if total_waste == 0.0:
-            print(f"✅ Waste records found but all values are zero, returning zeros")
-            return {
-                "total_waste": 0.0,
-                "recycled": 0.0,
-                "landfill": 0.0,
-                "incinerated": 0.0,
-                "composted": 0.0,
-                "recycling_rate": 0.0,
-                "compliance_status": "No Data Available"
-            }
-        
-        # Calculate recycling rate
-        recycling_rate = (recycled / total_waste * 100) if total_waste > 0 else 0.0
-        
-        return {
-            "total_waste": round(total_waste, 2),
-            "recycled": round(recycled, 2),
-            "landfill": round(landfill, 2),
-            "incinerated": round(incinerated, 2),
-            "composted": round(composted, 2),
-            "recycling_rate": round(recycling_rate, 2),
-            "compliance_status": "Compliant" if total_waste > 0 else "No Data Available"
-        }
-    except Exception as e:
-        print(f"⚠️ Error fetching waste metrics: {e}")
-        # Return zeros on error
-        return {
-            "total_waste": 0.0,
-            "recycled": 0.0,
-            "landfill": 0.0,
-            "incinerated": 0.0,
-            "composted": 0.0,
-            "recycling_rate": 0.0,
-            "compliance_status": "Error Fetching Data"
+def _empty_waste_metrics(compliance_status: str = "No Data Available") -> Dict[str, Any]:
+    return {
+        "total_waste": 0.0,
+        "recycled": 0.0,
+        "landfill": 0.0,
+        "incinerated": 0.0,
+        "composted": 0.0,
+        "recycling_rate": 0.0,
+        "compliance_status": compliance_status
     }
 
 
-def get_scope3_metrics(db: Session, company_id: int, start_date: date, end_date: date) -> Dict[str, Any]:
-    """Get Scope 3 breakdown metrics"""
+def _water_metrics_from_buckets(company_id: int, start_date: date, end_date: date,
+                                buckets: Dict[str, tuple]) -> Dict[str, Any]:
+    """Water usage metrics from {source bucket: (total, count)}"""
+    record_count = sum(count for _, count in buckets.values())
+    logger.debug("Water metrics query: company_id=%s, date_range=%s to %s, found %s records",
+                 company_id, start_date, end_date, record_count)
+
+    if record_count == 0:
+        # Return zeros if no data
+        logger.debug("No water records found for company %s, returning zeros", company_id)
+        return _empty_water_metrics()
+
+    # Totals by source
+    municipal_water = buckets.get("municipal_water", (0.0, 0))[0]
+    groundwater = buckets.get("groundwater", (0.0, 0))[0]
+    rainwater = buckets.get("rainwater", (0.0, 0))[0]
+    surface_water = buckets.get("surface_water", (0.0, 0))[0]
+    total_usage = municipal_water + groundwater + rainwater + surface_water
+
+    # If all values are zero (no actual data), return zeros
+    if total_usage == 0.0:
+        logger.debug("Water records found but all values are zero, returning zeros")
+        return _empty_water_metrics()
+
+    # Calculate average daily usage
+    days = (end_date - start_date).days + 1
+    avg_daily = total_usage / days if days > 0 else 0.0
+
+    return {
+        "total_usage": round(total_usage, 2),
+        "municipal_water": round(municipal_water, 2),
+        "groundwater": round(groundwater, 2),
+        "rainwater": round(rainwater, 2),
+        "surface_water": round(surface_water, 2),
+        "avg_daily": round(avg_daily, 2),
+        "compliance_status": "Compliant" if total_usage > 0 else "No Data Available"
+    }
 
-    query = db.query(EmissionActivity).filter(
+
+def _waste_metrics_from_buckets(company_id: int, start_date: date, end_date: date,
+                                buckets: Dict[str, tuple]) -> Dict[str, Any]:
+    """Waste management metrics from {disposal bucket: (total, count)}"""
+    record_count = sum(count for _, count in buckets.values())
+    logger.debug("Waste metrics query: company_id=%s, date_range=%s to %s, found %s records",
+                 company_id, start_date, end_date, record_count)
+
+    if record_count == 0:
+        # Return zeros if no data
+        logger.debug("No waste records found for company %s, returning zeros", company_id)
+        return _empty_waste_metrics()
+
+    # Totals by disposal method
+    recycled = buckets.get("recycled", (0.0, 0))[0]
+    landfill = buckets.get("landfill", (0.0, 0))[0]
+    incinerated = buckets.get("incinerated", (0.0, 0))[0]
+    composted = buckets.get("composted", (0.0, 0))[0]
+    total_waste = recycled + landfill + incinerated + composted
+
+    # If all values are zero (no actual data), return zeros
+    if total_waste == 0.0:
+        logger.debug("Waste records found but all values are zero, returning zeros")
+        return _empty_waste_metrics()
+
+    # Calculate recycling rate
+    recycling_rate = (recycled / total_waste * 100) if total_waste > 0 else 0.0
+
+    return {
+        "total_waste": round(total_waste, 2),
+        "recycled": round(recycled, 2),
+        "landfill": round(landfill, 2),
+        "incinerated": round(incinerated, 2),
+        "composted": round(composted, 2),
+        "recycling_rate": round(recycling_rate, 2),
+        "compliance_status": "Compliant" if total_waste > 0 else "No Data Available"
+    }
+
+
+def get_environmental_metrics(db: Session, company_id: int, start_date: date, end_date: date):
+    """
+    Water, waste and Scope 3 metrics in one round trip.
+    The three grouped aggregates are combined with UNION ALL as (section, bucket, total, count)
+    rows. Returns (water_data, waste_data, scope3_data).
+    """
+    from app.models import WaterUsage, WasteDisposal
+
+    range_start = datetime.combine(start_date, datetime.min.time())
+    range_end = datetime.combine(end_date, datetime.max.time())
+
+    # Classify sources in SQL (first match wins, unclear sources count as municipal)
+    source_bucket = case(
+        (WaterUsage.source.ilike("%municipal%"), "municipal_water"),
+        (WaterUsage.source.ilike("%ground%"), "groundwater"),
+        (WaterUsage.source.ilike("%rain%"), "rainwater"),
+        (WaterUsage.source.ilike("%surface%"), "surface_water"),
+        else_="municipal_water"
+    )
+    water = select(
+        literal("water").label("section"),
+        source_bucket.label("bucket"),
+        func.sum(func.coalesce(WaterUsage.withdrawal_volume, 0.0)).label("total"),
+        func.count(WaterUsage.id).label("records")
+    ).where(
+        WaterUsage.company_id == company_id,
+        WaterUsage.created_at >= range_start,
+        WaterUsage.created_at <= range_end
+    ).group_by(source_bucket)
+
+    # Classify disposal methods in SQL (first match wins, unclear methods count as landfill)
+    method_bucket = case(
+        (WasteDisposal.disposal_method.ilike("%recycl%"), "recycled"),
+        (WasteDisposal.disposal_method.ilike("%landfill%"), "landfill"),
+        (WasteDisposal.disposal_method.ilike("%dump%"), "landfill"),
+        (WasteDisposal.disposal_method.ilike("%incinerat%"), "incinerated"),
+        (WasteDisposal.disposal_method.ilike("%burn%"), "incinerated"),
+        (WasteDisposal.disposal_method.ilike("%compost%"), "composted"),
+        else_="landfill"
+    )
+    waste = select(
+        literal("waste").label("section"),
+        method_bucket.label("bucket"),
+        func.sum(func.coalesce(WasteDisposal.quantity, 0.0)).label("total"),
+        func.count(WasteDisposal.id).label("records")
+    ).where(
+        WasteDisposal.company_id == company_id,
+        WasteDisposal.created_at >= range_start,
+        WasteDisposal.created_at <= range_end
+    ).group_by(method_bucket)
+
+    # Scope 3 emissions per category
+    scope3 = select(
+        literal("scope3").label("section"),
+        EmissionActivity.category.label("bucket"),
+        func.sum(EmissionActivity.emissions_kgco2e).label("total"),
+        func.count(EmissionActivity.id).label("records")
+    ).where(
         EmissionActivity.company_id == company_id,
         EmissionActivity.scope_number == 3,
-        EmissionActivity.activity_date >= start_date,
-        EmissionActivity.activity_date <= end_date
+        activity_date_in_range(start_date, end_date)
+    ).group_by(EmissionActivity.category)
+
+    try:
+        rows = db.execute(union_all(water, waste, scope3)).all()
+    except Exception as e:
+        print(f"⚠️ Error fetching environmental metrics: {e}")
+        return _empty_water_metrics("Error Fetching Data"), _empty_waste_metrics("Error Fetching Data"), {}
+
+    sections = {"water": {}, "waste": {}}
+    scope3_data = {}
+    for section, bucket, total, records in rows:
+        if section == "scope3":
+            # Missing and empty categories are both reported as "Other"
+            cat = bucket or "Other"
+            scope3_data[cat] = scope3_data.get(cat, 0) + (total or 0)
+        else:
+            sections[section][bucket] = (float(total or 0.0), int(records))
+
+    water_data = _water_metrics_from_buckets(company_id, start_date, end_date, sections["water"])
+    waste_data = _waste_metrics_from_buckets(company_id, start_date, end_date, sections["waste"])
+    return water_data, waste_data, scope3_data
+
+
+def fetch_company_and_cached_recommendation(db: Session, company_id: int):
+    """
+    (company, latest active AIRecommendation or None) in one outer-join round
+    trip instead of two queries. Falls back to the company alone if the
+    recommendation lookup fails.
+    """
+    ensure_ai_recommendation_schema()
+    try:
+        row = db.query(Company, AIRecommendation).options(raiseload('*')).outerjoin(
+            AIRecommendation,
+            and_(AIRecommendation.company_id == Company.id, AIRecommendation.is_active == True)
+        ).filter(Company.id == company_id).order_by(AIRecommendation.generated_at.desc()).first()
+    except Exception as e:
+        print(f"⚠️ Error fetching AI recommendations: {e}")
+        db.rollback()
+        company = db.query(Company).options(raiseload('*')).filter(Company.id == company_id).first()
+        return company, None
+
+    if row is None:
+        return None, None
+    return row[0], row[1]
+
+
+def cached_recommendation_list(cached_rec: AIRecommendation) -> List[Any]:
+    """Recommendations stored on a cached AIRecommendation row ([] when expired)"""
+    is_expired = getattr(cached_rec, 'is_expired', None)
+    if is_expired is not None and is_expired():
+        return []
+    return cached_rec.normalized_recommendations
+
+
+def recommendation_export_row(rec) -> tuple:
+    """(title, priority, estimated savings kg, description) of a cached recommendation for the exports"""
+    if isinstance(rec, dict):
+        return (
+            rec.get('title', 'N/A'),
+            rec.get('priority', 'Medium'),
+            rec.get('estimated_savings_kg', 0),
+            rec.get('description', rec.get('detailed_analysis', 'N/A'))
+        )
+    return (str(rec), "Medium", 0, str(rec))
+
+
+GOAL_EXPORT_HEADER = ['title', 'target_emissions', 'current_emissions', 'target_year', 'status']
+
+
+def fetch_goal_export_rows(db: Session, user_id: int) -> List[tuple]:
+    """Goals as (title, target, current, target year, status) tuples for the CSV/Excel exports"""
+    rows = db.query(
+        Goal.title, Goal.target_emissions, Goal.current_emissions, Goal.target_year, Goal.status
+    ).filter(Goal.user_id == user_id).all()
+    return [
+        (title, target, current or 0, target_year, status.replace("_", " ").title() if status else "On Track")
+        for title, target, current, target_year, status in rows
+    ]
+
+
+def _run_with_session(fn, *args):
+    """Run a report helper on its own session (sessions are not thread-safe)"""
+    session = SessionLocal()
+    try:
+        return fn(session, *args)
+    finally:
+        session.close()
+
+
+def _dump_report_metrics(metrics) -> bytes:
+    summary, water_data, waste_data, scope3_data, trends, category_breakdown = metrics
+    return orjson.dumps([
+        summary.model_dump(), water_data, waste_data, scope3_data,
+        [t.model_dump() for t in trends], [c.model_dump() for c in category_breakdown]
+    ])
+
+
+def _load_report_metrics(dumped: bytes):
+    summary, water_data, waste_data, scope3_data, trends, category_breakdown = orjson.loads(dumped)
+    return (
+        SummaryMetrics.model_validate(summary), water_data, waste_data, scope3_data,
+        [TrendData.model_validate(t) for t in trends],
+        [CategoryBreakdown.model_validate(c) for c in category_breakdown]
     )
 
-    records = query.all()
 
-    # Group by category
-    breakdown = {}
-    for r in records:
-        cat = r.category or "Other"
-        breakdown[cat] = breakdown.get(cat, 0) + r.emissions_kgco2e
+async def gather_report_metrics(company_id: int, start_date: date, end_date: date, group_by: str):
+    """
+    Fetch the independent report sections concurrently in the threadpool.
+    Returns (summary, water_data, waste_data, scope3_data, trends, category_breakdown).
+    The whole set is cached until the company's activities/water/waste data changes,
+    so back-to-back CSV/Excel/PDF exports of the same period aggregate once.
+    """
+    version = await run_in_threadpool(_run_with_session, get_report_data_version, company_id)
+    key = ("report_metrics", company_id, start_date, end_date, group_by, version)
+
+    with _report_cache_lock:
+        cached = _report_cache.get(key)
+    if cached is not None:
+        return _load_report_metrics(cached)
+
+    summary, environmental, trends, category_breakdown = await asyncio.gather(
+        run_in_threadpool(_run_with_session, calculate_summary_metrics, company_id, start_date, end_date),
+        run_in_threadpool(_run_with_session, get_environmental_metrics, company_id, start_date, end_date),
+        run_in_threadpool(_run_with_session, generate_trend_data, company_id, start_date, end_date, group_by),
+        run_in_threadpool(_run_with_session, generate_category_breakdown, company_id, start_date, end_date)
+    )
+    water_data, waste_data, scope3_data = environmental
+    metrics = (summary, water_data, waste_data, scope3_data, trends, category_breakdown)
 
-    return breakdown
+    with _report_cache_lock:
+        _report_cache[key] = _dump_report_metrics(metrics)
+    return metrics
+
+
+# Report charts reuse one Figure per chart type (object API, no pyplot state).
+# The lock keeps concurrent requests from drawing on the same figure.
+_EMISSIONS_FIG = Figure(figsize=(6, 4))
+FigureCanvasAgg(_EMISSIONS_FIG)
+_TREND_FIG = Figure(figsize=(8, 4))
+FigureCanvasAgg(_TREND_FIG)
+_chart_lock = threading.Lock()
 
 
 def generate_emissions_chart(data: Dict[str, Any]) -> io.BytesIO:
     """Generate emissions breakdown pie chart"""
 
-    fig, ax = plt.subplots(figsize=(6, 4))
+    with _chart_lock:
+        _EMISSIONS_FIG.clear()
+        ax = _EMISSIONS_FIG.add_subplot(111)
+        _draw_emissions_chart(ax, data)
+
+        # Save to bytes
+        buf = io.BytesIO()
+        _EMISSIONS_FIG.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+        buf.seek(0)
 
+    return buf
+
+
+def _draw_emissions_chart(ax, data: Dict[str, Any]):
+    """Draw the scope pie onto ax"""
     scopes = ['Scope 1', 'Scope 2', 'Scope 3']
     values = [
         data.get('scope1_emissions', 0),
@@ -537,20 +919,24 @@ def generate_emissions_chart(data: Dict[str, Any]) -> io.BytesIO:
     else:
         ax.text(0.5, 0.5, 'No emission data', ha='center', va='center')
 
-    # Save to bytes
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close()
-
-    return buf
-
 
 def generate_trend_chart(trends: List[Dict[str, Any]]) -> io.BytesIO:
     """Generate emissions trend line chart"""
 
-    fig, ax = plt.subplots(figsize=(8, 4))
+    with _chart_lock:
+        _TREND_FIG.clear()
+        ax = _TREND_FIG.add_subplot(111)
+        _draw_trend_chart(ax, trends)
+
+        buf = io.BytesIO()
+        _TREND_FIG.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+        buf.seek(0)
 
+    return buf
+
+
+def _draw_trend_chart(ax, trends: List[Dict[str, Any]]):
+    """Draw the emissions trend line onto ax"""
     if trends and len(trends) > 0:
         periods = [t['period'] for t in trends]
         emissions = [t['emissions_kg'] for t in trends]
@@ -563,22 +949,518 @@ def generate_trend_chart(trends: List[Dict[str, Any]]) -> io.BytesIO:
 
         # Rotate x labels if many periods
         if len(periods) > 6:
-            plt.xticks(rotation=45, ha='right')
+            for label in ax.get_xticklabels():
+                label.set_rotation(45)
+                label.set_horizontalalignment('right')
     else:
         ax.text(0.5, 0.5, 'No trend data', ha='center', va='center', transform=ax.transAxes)
 
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    plt.close()
 
-    return buf
+# The PDF's matplotlib charts are rendered in worker processes: they are pure
+# CPU work on pyplot's global state, so threads would serialize on the GIL and
+# race on the current figure. "spawn" keeps workers clear of the server's
+# threads and open connections. Processes start on first use; on a single
+# core there is nothing to overlap, so charts are rendered inline instead.
+CHART_POOL_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _new_chart_pool():
+    if CHART_POOL_WORKERS < 2:
+        return None
+    return ProcessPoolExecutor(
+        max_workers=CHART_POOL_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+_CHART_POOL = _new_chart_pool()
+
+
+def submit_chart_jobs(jobs: Dict[str, tuple]) -> Dict[str, Any]:
+    """
+    Start rendering {name: (render_fn, *args)} in the chart pool.
+    Returns {name: Future or None}; None means render inline (pool unavailable).
+    """
+    global _CHART_POOL
+
+    futures = {}
+    for name, (render_fn, *args) in jobs.items():
+        if _CHART_POOL is None:
+            futures[name] = None
+            continue
+        try:
+            futures[name] = _CHART_POOL.submit(render_fn, *args)
+        except (BrokenProcessPool, RuntimeError):
+            # Replace the broken pool for the next report; this one renders inline
+            logger.warning("Chart pool unavailable, rendering %s inline", name, exc_info=True)
+            _CHART_POOL = _new_chart_pool()
+            futures[name] = None
+    return futures
+
+
+def chart_result(jobs: Dict[str, tuple], futures: Dict[str, Any], name: str) -> Optional[bytes]:
+    """PNG bytes for a submitted chart, falling back to inline rendering if the worker died"""
+    future = futures.get(name)
+    if future is not None:
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            logger.warning("Chart worker failed, rendering %s inline", name, exc_info=True)
+    render_fn, *args = jobs[name]
+    return render_fn(*args)
+
+
+# Exports are built into a spooled temp file (kept in memory while small,
+# moved to disk past the threshold) and streamed back in fixed-size chunks
+REPORT_SPOOL_MAX_SIZE = 5 * 1024 * 1024
+REPORT_CHUNK_SIZE = 64 * 1024
+
+
+def report_date_tag() -> str:
+    """YYYYMMDD stamp for export filenames"""
+    return date.today().strftime('%Y%m%d')
+
+
+def new_report_buffer():
+    """Binary file object to build a PDF/Excel export into"""
+    return tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_SIZE)
+
+
+def iter_report_chunks(buffer, chunk_size: int = REPORT_CHUNK_SIZE):
+    """Yield a finished export in chunks for StreamingResponse, closing it afterwards"""
+    try:
+        buffer.seek(0)
+        while True:
+            chunk = buffer.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        buffer.close()
+
+
+ACTIVITIES_CSV_HEADER = (
+    "Activity Name", "Activity Type", "Description", "Quantity", "Unit", "Emissions (kg CO2e)",
+    "Emissions (tons CO2e)", "Scope", "Scope Number", "Category", "Subcategory", "Location",
+    "Activity Date", "Reporting Period", "Source Document", "Created At"
+)
+
+
+# One shared label string per scope instead of a fresh f-string per activity row
+_SCOPE_LABELS = {n: f"Scope {n}" for n in (1, 2, 3)}
+
+
+def scope_label(scope_number) -> str:
+    """'Scope N' label for an activity's scope_number"""
+    return _SCOPE_LABELS.get(scope_number) or f"Scope {scope_number}"
+
+
+def new_csv_writer(buffer):
+    """csv.writer for the report exports (quotes/escapes fields as needed, '\\n' line endings)"""
+    return csv.writer(buffer, lineterminator="\n")
+
+
+# Columns the activity exports read; querying them directly returns plain rows
+# instead of hydrating (and identity-mapping) full EmissionActivity objects
+ACTIVITY_EXPORT_COLUMNS = (
+    EmissionActivity.activity_name, EmissionActivity.activity_type, EmissionActivity.description,
+    EmissionActivity.quantity, EmissionActivity.unit, EmissionActivity.emissions_kgco2e,
+    EmissionActivity.scope_number, EmissionActivity.category, EmissionActivity.subcategory,
+    EmissionActivity.location, EmissionActivity.activity_date, EmissionActivity.reporting_period,
+    EmissionActivity.source_document, EmissionActivity.created_at
+)
+
+
+def _activity_export_row(a) -> tuple:
+    """One activity (a row of ACTIVITY_EXPORT_COLUMNS) as a row of the ALL ACTIVITIES CSV section / Excel sheet"""
+    return (
+        a.activity_name or a.activity_type or "Unnamed Activity",
+        a.activity_type or "N/A",
+        a.description or "",
+        a.quantity or 0,
+        a.unit or "N/A",
+        round(a.emissions_kgco2e, 2),
+        round(a.emissions_kgco2e / 1000, 3),
+        scope_label(a.scope_number),
+        a.scope_number or 0,
+        a.category or "Uncategorized",
+        a.subcategory or "",
+        a.location or "N/A",
+        a.activity_date.date().isoformat() if a.activity_date else "N/A",
+        a.reporting_period or "N/A",
+        a.source_document or "",
+        a.created_at.isoformat(" ", "seconds") if a.created_at else "N/A"
+    )
+
+
+def iter_activities_csv(company_id: int, start_date: date, end_date: date,
+                        batch_size: int = REPORT_STREAM_BATCH_SIZE):
+    """
+    Yield the ALL ACTIVITIES rows of the comprehensive CSV, one chunk per batch.
+    Runs on its own session since it is consumed after the endpoint has returned.
+    """
+    session = SessionLocal()
+    written = 0
+    try:
+        activities = session.query(*ACTIVITY_EXPORT_COLUMNS).filter(
+            EmissionActivity.company_id == company_id,
+            activity_date_in_range(start_date, end_date)
+        ).order_by(
+            EmissionActivity.activity_date.desc(), EmissionActivity.emissions_kgco2e.desc()
+        ).yield_per(batch_size)
+
+        chunk = io.StringIO()
+        writer = new_csv_writer(chunk)
+        for activity in activities:
+            if written == 0:
+                writer.writerow(ACTIVITIES_CSV_HEADER)
+            writer.writerow(_activity_export_row(activity))
+            written += 1
+            if written % batch_size == 0:
+                yield chunk.getvalue()
+                chunk.seek(0)
+                chunk.truncate(0)
+        if chunk.tell():
+            yield chunk.getvalue()
+        if written == 0:
+            yield "No activities found for this reporting period\n"
+    except Exception:
+        logger.exception("Error streaming activities for company %s", company_id)
+        raise
+    finally:
+        session.close()
+
+
+def iter_activity_export_rows(query, batch_size: int = REPORT_STREAM_BATCH_SIZE):
+    """Yield export rows straight from an activities query, loading batch_size ORM objects at a time"""
+    for activity in query.yield_per(batch_size):
+        yield _activity_export_row(activity)
+
+
+def records_to_rows(records: List[Dict[str, Any]], columns: Optional[List[str]] = None):
+    """Turn a list of dicts into (headers, rows) for streamed sheets"""
+    if columns is None:
+        columns = []
+        for record in records:
+            for key in record:
+                if key not in columns:
+                    columns.append(key)
+    rows = [[record.get(column) for column in columns] for record in records]
+    return columns, rows
+
+
+def scope_breakdown_rows(summary: SummaryMetrics) -> List[list]:
+    """Emissions Breakdown sheet rows; tons and shares for all three scopes come from one array op"""
+    scope_kg = np.array(
+        [summary.scope1_emissions, summary.scope2_emissions, summary.scope3_emissions], dtype=np.float64
+    )
+    total_kg = summary.total_emissions_kg if summary.total_emissions_kg > 0 else 1
+    rows = [
+        [scope_label(n), kg, tons, round(percent, 1)]
+        for n, kg, tons, percent in zip(
+            (1, 2, 3), scope_kg.tolist(), (scope_kg / 1000).tolist(), (scope_kg / total_kg * 100).tolist()
+        )
+    ]
+    rows.append(['TOTAL', summary.total_emissions_kg, summary.total_emissions_tons, 100.0])
+    return rows
+
+
+CATEGORY_SHEET_HEADER = ['category', 'emissions_kg', 'emissions_tons', 'emissions_percent', 'activities_count']
+
+
+def category_breakdown_rows(category_breakdown: List[CategoryBreakdown]) -> List[list]:
+    """Category Breakdown sheet rows straight from the models; kg -> tons is a single NumPy pass"""
+    emissions = np.fromiter(
+        (c.emissions_kg for c in category_breakdown), dtype=np.float64, count=len(category_breakdown)
+    )
+    return [
+        [c.category, c.emissions_kg, tons, c.emissions_percent, c.activities_count]
+        for c, tons in zip(category_breakdown, (emissions / 1000).tolist())
+    ]
+
+
+def new_excel_workbook(output):
+    """
+    xlsxwriter workbook in constant_memory mode: each row is flushed to a temp
+    file once the next row starts, so the Python heap stays flat for large
+    activity exports. Cell text is written literally (no formula/URL parsing).
+    """
+    return xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'in_memory': False,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+        'nan_inf_to_errors': True
+    })
+
+
+# Widest a column is sized to; once a column's values reach it, it is no longer measured
+EXCEL_MAX_COLUMN_WIDTH = 50
+
+
+def write_excel_sheet(workbook, title: str, headers: List[str], rows: Iterable[Sequence[Any]], header_format=None):
+    """
+    Write a header row plus data rows to a new worksheet, top to bottom as
+    constant_memory requires. rows may be a generator; it is consumed once.
+    Column widths are sized from the values (capped at EXCEL_MAX_COLUMN_WIDTH)
+    and applied after the rows, which xlsxwriter allows since columns are
+    written on close.
+    """
+    sheet = workbook.add_worksheet(title)
+    write_row = sheet.write_row
+
+    widths = [len(str(header)) for header in headers]
+    width_cap = EXCEL_MAX_COLUMN_WIDTH - 2
+
+    # Only columns still below the cap are measured (str() per cell is the hot part)
+    open_columns = [index for index, width in enumerate(widths) if width < width_cap]
 
+    row_index = 0
+    if headers:
+        write_row(row_index, 0, headers, header_format)
+        row_index += 1
 
-def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
-    """Generate comprehensive PDF report"""
+    for row in rows:
+        if open_columns:
+            row_length = len(row)
+            saturated = False
+            for index in open_columns:
+                if index < row_length:
+                    value = row[index]
+                    if value is not None:
+                        length = len(str(value))
+                        if length > widths[index]:
+                            widths[index] = length
+                            saturated = saturated or length >= width_cap
+            if saturated:
+                open_columns = [index for index in open_columns if widths[index] < width_cap]
+        write_row(row_index, 0, row)
+        row_index += 1
 
-    buffer = io.BytesIO()
+    for index, width in enumerate(widths):
+        sheet.set_column(index, index, min(width + 2, EXCEL_MAX_COLUMN_WIDTH))
+
+    return sheet
+
+
+# Data rows that fit on one worksheet under Excel's 1,048,576-row limit (one row is the header)
+EXCEL_MAX_DATA_ROWS = 1048575
+
+
+def write_excel_sheets(workbook, title: str, headers: List[str], rows: Iterable[Sequence[Any]],
+                       header_format=None, max_rows: int = EXCEL_MAX_DATA_ROWS):
+    """
+    write_excel_sheet for row streams that may not fit on one worksheet: rows
+    past max_rows continue on "<title> 2", "<title> 3"... with the same headers.
+    The first sheet is always written, even when rows is empty.
+    """
+    rows = iter(rows)
+    sheets = [write_excel_sheet(workbook, title, headers, islice(rows, max_rows), header_format)]
+    for first_row in rows:
+        sheets.append(write_excel_sheet(
+            workbook, f"{title} {len(sheets) + 1}", headers,
+            chain((first_row,), islice(rows, max_rows - 1)), header_format
+        ))
+    return sheets
+
+
+# PDF table styles, built once at import and shared by every report
+_METRICS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
+])
+
+_EMISSIONS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#f3f4f6')),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, colors.HexColor('#f9fafb')])
+])
+
+_CATEGORY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0fdf4')])
+])
+
+_WATER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#eff6ff')])
+])
+
+_WASTE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0fdf4')])
+])
+
+_GOALS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8b5cf6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#faf5ff')])
+])
+
+_ACTIVITIES_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f59e0b')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fffbeb')])
+])
+
+# Header row of both PDF category tables
+_CATEGORY_TABLE_HEADER = ('Category', 'Emissions (tons CO2e)', 'Percentage', 'Activities')
+
+# Recommendation title colors (anything other than High/Medium renders as Low)
+_PRIORITY_COLORS = {'High': '#dc2626', 'Medium': '#f59e0b', 'Low': '#10b981'}
+
+# Paragraph markup for one recommendation in the PDF
+_REC_TEMPLATE = (
+    "<b><font size=12 color={color}>{idx}. {title}</font></b><br/>"
+    "<font size=9 color=#6b7280>Priority: {priority} | Estimated Savings: {savings:.2f} tons CO2e</font><br/><br/>"
+    "{desc}"
+)
+
+
+def _truncate(text: str, limit: int = 400) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + '…'
+
+
+# Fixed explanatory blurbs in the PDF; parsed once, see static_paragraph()
+_SCOPE_EMISSIONS_CONTEXT = (
+    "<b>Understanding Scope Emissions:</b> The GHG Protocol categorizes emissions into three scopes. "
+    "Scope 1 includes direct emissions from sources owned or controlled by the company (e.g., fuel combustion, company vehicles). "
+    "Scope 2 covers indirect emissions from purchased electricity, heat, or steam. "
+    "Scope 3 includes all other indirect emissions that occur in the value chain (e.g., business travel, purchased goods, waste disposal)."
+)
+
+_SCOPE_BREAKDOWN_CONTEXT = (
+    "<b>Understanding Scope Breakdown:</b> This chart shows the distribution of emissions across the three GHG Protocol scopes. "
+    "Scope 1 represents direct emissions from owned or controlled sources. Scope 2 covers indirect emissions from purchased energy. "
+    "Scope 3 includes all other indirect emissions in the value chain. Understanding this breakdown helps identify the most significant "
+    "emission sources and prioritize reduction efforts."
+)
+
+_TREND_CONTEXT = (
+    "<b>Trend Analysis:</b> This chart shows how emissions have changed over the reporting period. "
+    "Understanding trends helps identify patterns, seasonal variations, and the effectiveness of reduction initiatives. "
+    "A downward trend indicates successful emission reduction efforts, while an upward trend may signal increased activity "
+    "or the need for additional reduction measures."
+)
+
+_CATEGORY_CONTEXT = (
+    "<b>Category Analysis:</b> This chart identifies the emission categories contributing most to your total footprint. "
+    "Categories are based on GHG Protocol classifications and help prioritize reduction efforts. "
+    "Focus on the top categories for maximum impact on overall emissions reduction."
+)
+
+_TOP_EMITTERS_CONTEXT = (
+    "<b>Top Emitters Analysis:</b> This chart highlights the individual activities with the highest emissions. "
+    "These activities represent the greatest opportunities for emission reductions. "
+    "Consider implementing targeted reduction strategies for these high-impact activities."
+)
+
+_RECOMMENDATIONS_INTRO = (
+    "The following recommendations are generated using advanced AI analysis of your emission data, "
+    "industry best practices, and sustainability standards. Each recommendation includes priority level, "
+    "estimated impact, and implementation guidance."
+)
+
+_NO_EMISSIONS_TEXT = "<i>No emissions data available for this reporting period.</i>"
+
+# Paragraph styles, built once at import like the table styles
+_PDF_STYLES = getSampleStyleSheet()
+_NORMAL_STYLE = _PDF_STYLES['Normal']
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_PDF_STYLES['Heading1'],
+    fontSize=28,
+    textColor=colors.HexColor('#1f2937'),
+    spaceAfter=20,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_PDF_STYLES['Heading2'],
+    fontSize=18,
+    textColor=colors.HexColor('#374151'),
+    spaceAfter=12,
+    spaceBefore=20,
+    fontName='Helvetica-Bold'
+)
+
+
+@lru_cache(maxsize=None)
+def _static_paragraph_frags(text: str):
+    """Parse a fixed Normal-style markup string once"""
+    return Paragraph(text, _NORMAL_STYLE).frags
+
+
+def static_paragraph(text: str) -> Paragraph:
+    """Fresh Normal-style Paragraph for fixed markup, reusing the parsed fragments.
+
+    Only the parse is shared: platypus keeps per-document layout state on the
+    flowable itself, so every story still gets its own Paragraph.
+    """
+    return Paragraph(text, _NORMAL_STYLE, frags=_static_paragraph_frags(text))
+
+
+def generate_pdf_report(report_data: ComprehensiveReportData, buffer=None):
+    """Generate comprehensive PDF report into buffer (a new spooled report buffer if not given)"""
+
+    if buffer is None:
+        buffer = new_report_buffer()
     doc = SimpleDocTemplate(
         buffer, 
         pagesize=A4, 
@@ -588,34 +1470,41 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
         rightMargin=0.75 * inch
     )
     story = []
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=28,
-        textColor=colors.HexColor('#1f2937'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
+    normal_style = _NORMAL_STYLE
+    title_style = _TITLE_STYLE
+    heading_style = _HEADING_STYLE
 
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=18,
-        textColor=colors.HexColor('#374151'),
-        spaceAfter=12,
-        spaceBefore=20,
-        fontName='Helvetica-Bold'
-    )
+    # Start the charts now so they render while the text pages are laid out
+    summary = report_data.summary_metrics
+    s1, s2, s3 = (summary.get(key, 0) for key in ('scope1_emissions', 'scope2_emissions', 'scope3_emissions'))
+    emissions_dict = {'scope1': s1, 'scope2': s2, 'scope3': s3}
+    # Charts of all-zero data are skipped; those sections show _NO_EMISSIONS_TEXT instead
+    chart_jobs = {}
+    if s1 + s2 + s3 > 0:
+        chart_jobs['scope_pie'] = (render_scope_pie_png, emissions_dict)
+        chart_jobs['scope_bar'] = (render_scope_bar_png, emissions_dict)
+    if report_data.trends:
+        chart_jobs['trend'] = (render_trend_line_png, report_data.trends)
+    if report_data.category_breakdown and any(c.get('emissions_kg', 0) > 0 for c in report_data.category_breakdown):
+        chart_jobs['category'] = (render_category_bar_png, report_data.category_breakdown)
+    if report_data.activities and report_data.activities[0].get('emissions_kg', 0) > 0:
+        top_emitters_data = [
+            {
+                'activity': act.get('activity_name', 'N/A'),
+                'total_emissions_kg': act.get('emissions_kg', 0)
+            }
+            for act in report_data.activities[:8]
+        ]
+        chart_jobs['top_emitters'] = (render_top_emitters_png, top_emitters_data)
+    chart_futures = submit_chart_jobs(chart_jobs)
 
     # ==================== PAGE 1: COVER PAGE ====================
 
-    story.append(Spacer(1, 1.5 * inch))
-    story.append(Paragraph("COMPREHENSIVE SUSTAINABILITY REPORT", title_style))
-    story.append(Spacer(1, 0.5 * inch))
+    story.extend([
+        Spacer(1, 1.5 * inch),
+        Paragraph("COMPREHENSIVE SUSTAINABILITY REPORT", title_style),
+        Spacer(1, 0.5 * inch)
+    ])
 
     # Company info
     company = report_data.company_profile
@@ -629,8 +1518,7 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
     <font size=11>Phone: {company.phone}</font>
     </para>
     """
-    story.append(Paragraph(company_info, styles['Normal']))
-    story.append(Spacer(1, 0.5 * inch))
+    story.extend([Paragraph(company_info, normal_style), Spacer(1, 0.5 * inch)])
 
     # Reporting period
     period_text = f"""
@@ -638,11 +1526,10 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
     <b><font size=12>Reporting Period:</font></b><br/>
     <font size=11>{report_data.summary_metrics['reporting_period_start']} to {report_data.summary_metrics['reporting_period_end']}</font><br/><br/>
     <b><font size=12>Generated:</font></b><br/>
-    <font size=11>{report_data.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</font>
+    <font size=11>{report_data.generated_at.isoformat(' ', 'seconds')}</font>
     </para>
     """
-    story.append(Paragraph(period_text, styles['Normal']))
-    story.append(Spacer(1, 0.3 * inch))
+    story.extend([Paragraph(period_text, normal_style), Spacer(1, 0.3 * inch)])
 
     # Standards compliance badge
     standards_text = """
@@ -651,15 +1538,11 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
     <font size=9>Aligned with ISO 14064 and GRI Standards</font>
     </para>
     """
-    story.append(Paragraph(standards_text, styles['Normal']))
-    story.append(PageBreak())
+    story.extend([Paragraph(standards_text, normal_style), PageBreak()])
 
     # ==================== PAGE 2: EXECUTIVE SUMMARY ====================
 
-    story.append(Paragraph("EXECUTIVE SUMMARY", heading_style))
-    story.append(Spacer(1, 0.2 * inch))
-
-    summary = report_data.summary_metrics
+    story.extend([Paragraph("EXECUTIVE SUMMARY", heading_style), Spacer(1, 0.2 * inch)])
 
     exec_summary = f"""
     This comprehensive sustainability report provides a detailed overview of environmental performance 
@@ -669,17 +1552,16 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
     <br/><br/>
     <b>Key Performance Indicators:</b><br/>
     • Total GHG Emissions: <b>{summary.get('total_emissions_tons', 0):.2f} tons CO2e</b><br/>
-    • Scope 1 (Direct): {summary.get('scope1_emissions', 0) / 1000:.2f} tons CO2e<br/>
-    • Scope 2 (Indirect - Energy): {summary.get('scope2_emissions', 0) / 1000:.2f} tons CO2e<br/>
-    • Scope 3 (Value Chain): {summary.get('scope3_emissions', 0) / 1000:.2f} tons CO2e<br/>
+    • Scope 1 (Direct): {s1 / 1000:.2f} tons CO2e<br/>
+    • Scope 2 (Indirect - Energy): {s2 / 1000:.2f} tons CO2e<br/>
+    • Scope 3 (Value Chain): {s3 / 1000:.2f} tons CO2e<br/>
     • Total Water Usage: <b>{summary.get('total_water_usage_m3', 0):,.2f} m³</b><br/>
     • Total Waste Generated: <b>{summary.get('total_waste_kg', 0):,.2f} kg</b><br/>
     • Waste Recycling Rate: <b>{summary.get('recycling_rate', 0):.1f}%</b><br/>
     • Total Activities Tracked: <b>{summary.get('total_activities', 0)}</b><br/>
     • Reporting Period: <b>{summary.get('reporting_period_days', 0)} days</b>
     """
-    story.append(Paragraph(exec_summary, styles['Normal']))
-    story.append(Spacer(1, 0.3 * inch))
+    story.extend([Paragraph(exec_summary, normal_style), Spacer(1, 0.3 * inch)])
 
     # Key metrics table
     metrics_data = [
@@ -692,309 +1574,190 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
     ]
 
     metrics_table = Table(metrics_data, colWidths=[3.5 * inch, 2 * inch, 1.5 * inch])
-    metrics_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('TOPPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
-    ]))
-    story.append(metrics_table)
-    story.append(PageBreak())
+    metrics_table.setStyle(_METRICS_TABLE_STYLE)
+    story.extend([metrics_table, PageBreak()])
 
     # ==================== PAGE 3: EMISSIONS BREAKDOWN ====================
 
-    story.append(Paragraph("GREENHOUSE GAS EMISSIONS ANALYSIS", heading_style))
-    story.append(Spacer(1, 0.2 * inch))
+    story.extend([Paragraph("GREENHOUSE GAS EMISSIONS ANALYSIS", heading_style), Spacer(1, 0.2 * inch)])
 
     # Emissions table
     total_emissions_kg = summary.get('total_emissions_kg', 0)
-    emissions_data = [
-        ['Scope', 'Emissions (kg CO2e)', 'Emissions (tons CO2e)', 'Percentage'],
-        ['Scope 1 (Direct Emissions)', f"{summary.get('scope1_emissions', 0):,.2f}",
-         f"{summary.get('scope1_emissions', 0) / 1000:.2f}",
-         f"{(summary.get('scope1_emissions', 0) / total_emissions_kg * 100 if total_emissions_kg > 0 else 0):.1f}%"],
-        ['Scope 2 (Indirect - Energy)', f"{summary.get('scope2_emissions', 0):,.2f}",
-         f"{summary.get('scope2_emissions', 0) / 1000:.2f}",
-         f"{(summary.get('scope2_emissions', 0) / total_emissions_kg * 100 if total_emissions_kg > 0 else 0):.1f}%"],
-        ['Scope 3 (Value Chain)', f"{summary.get('scope3_emissions', 0):,.2f}",
-         f"{summary.get('scope3_emissions', 0) / 1000:.2f}",
-         f"{(summary.get('scope3_emissions', 0) / total_emissions_kg * 100 if total_emissions_kg > 0 else 0):.1f}%"],
+    emissions_data = [['Scope', 'Emissions (kg CO2e)', 'Emissions (tons CO2e)', 'Percentage']]
+    for label, value in (('Scope 1 (Direct Emissions)', s1), ('Scope 2 (Indirect - Energy)', s2), ('Scope 3 (Value Chain)', s3)):
+        percent = value / total_emissions_kg * 100 if total_emissions_kg > 0 else 0
+        emissions_data.append([label, f"{value:,.2f}", f"{value / 1000:.2f}", f"{percent:.1f}%"])
+    emissions_data.append(
         ['TOTAL', f"<b>{total_emissions_kg:,.2f}</b>", f"<b>{summary.get('total_emissions_tons', 0):.2f}</b>", '100.0%']
-    ]
+    )
 
-    emissions_table = Table(emissions_data, colWidths=[2.5 * inch, 1.8 * inch, 1.8 * inch, 1.2 * inch])
-    emissions_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('TOPPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#f3f4f6')),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, colors.HexColor('#f9fafb')])
-    ]))
-
-    story.append(emissions_table)
-    story.append(Spacer(1, 0.3 * inch))
+    emissions_table = LongTable(emissions_data, colWidths=[2.5 * inch, 1.8 * inch, 1.8 * inch, 1.2 * inch], repeatRows=1)
+    emissions_table.setStyle(_EMISSIONS_TABLE_STYLE)
+
+    story.extend([emissions_table, Spacer(1, 0.3 * inch)])
 
     # Add enhanced emissions chart with context
     story.append(Spacer(1, 0.1 * inch))
-    context_text = """
-    <b>Understanding Scope Emissions:</b> The GHG Protocol categorizes emissions into three scopes. 
-    Scope 1 includes direct emissions from sources owned or controlled by the company (e.g., fuel combustion, company vehicles). 
-    Scope 2 covers indirect emissions from purchased electricity, heat, or steam. 
-    Scope 3 includes all other indirect emissions that occur in the value chain (e.g., business travel, purchased goods, waste disposal).
-    """
-    story.append(Paragraph(context_text, styles['Normal']))
-    story.append(Spacer(1, 0.15 * inch))
-    try:
-        from app.services.pdf_generator import PDFReportGenerator
-        pdf_gen = PDFReportGenerator()
-        emissions_dict = {
-            'scope1': summary.get('scope1_emissions', 0),
-            'scope2': summary.get('scope2_emissions', 0),
-            'scope3': summary.get('scope3_emissions', 0)
-        }
-        chart_img = pdf_gen._create_scope_pie_chart(emissions_dict)
-        if chart_img:
-            story.append(chart_img)
-    except Exception as e:
-        story.append(Paragraph(f"<i>Chart generation error: {str(e)}</i>", styles['Normal']))
+    story.extend([static_paragraph(_SCOPE_EMISSIONS_CONTEXT), Spacer(1, 0.15 * inch)])
+    if 'scope_pie' in chart_jobs:
+        try:
+            chart_img = chart_image(chart_result(chart_jobs, chart_futures, 'scope_pie'), 5.5 * inch, 4 * inch)
+            if chart_img:
+                story.append(chart_img)
+        except Exception as e:
+            story.append(Paragraph(f"<i>Chart generation error: {str(e)}</i>", normal_style))
+    else:
+        story.append(static_paragraph(_NO_EMISSIONS_TEXT))
 
     story.append(Spacer(1, 0.2 * inch))
 
-    # Category breakdown
-    story.append(Paragraph("Emissions by Category", heading_style))
-    story.append(Spacer(1, 0.1 * inch))
-    if report_data.category_breakdown and len(report_data.category_breakdown) > 0:
-        category_data = [['Category', 'Emissions (tons CO2e)', 'Percentage', 'Activities']]
-        for cat in report_data.category_breakdown[:8]:  # Top 8 categories
-            category_data.append([
-                cat.get('category', 'Uncategorized'),
-                f"{cat.get('emissions_kg', 0) / 1000:.2f}",
-                f"{cat.get('emissions_percent', 0):.1f}%",
-                str(cat.get('activities_count', 0))
-            ])
-
-        category_table = Table(category_data, colWidths=[2.5 * inch, 1.5 * inch, 1.2 * inch, 1.2 * inch])
-        category_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0fdf4')])
-        ]))
+    # Category breakdown (rows are shared with the "EMISSIONS BY CATEGORY" table at the end)
+    story.extend([Paragraph("Emissions by Category", heading_style), Spacer(1, 0.1 * inch)])
+    category_rows = [
+        (
+            cat.get('category', 'Uncategorized'),
+            f"{cat.get('emissions_kg', 0) / 1000:.2f}",
+            f"{cat.get('emissions_percent', 0):.1f}%",
+            str(cat.get('activities_count', 0))
+        )
+        for cat in report_data.category_breakdown[:8]  # Top 8 categories
+    ]
+    if category_rows:
+        category_data = [_CATEGORY_TABLE_HEADER, *category_rows]
+        category_table = LongTable(category_data, colWidths=[2.5 * inch, 1.5 * inch, 1.2 * inch, 1.2 * inch], repeatRows=1)
+        category_table.setStyle(_CATEGORY_TABLE_STYLE)
         story.append(category_table)
     else:
-        story.append(Paragraph("<i>No category breakdown available. No activities recorded for this reporting period.</i>", styles['Normal']))
+        story.append(Paragraph("<i>No category breakdown available. No activities recorded for this reporting period.</i>", normal_style))
 
     story.append(PageBreak())
 
     # ==================== PAGE 4: WATER & WASTE MANAGEMENT ====================
 
-    story.append(Paragraph("WATER MANAGEMENT", heading_style))
-    story.append(Spacer(1, 0.1 * inch))
+    story.extend([Paragraph("WATER MANAGEMENT", heading_style), Spacer(1, 0.1 * inch)])
 
     water_data = report_data.water_data
+    total_usage, municipal, groundwater, avg_daily, water_status = (
+        water_data.get(key, default) for key, default in (
+            ('total_usage', 0), ('municipal_water', 0), ('groundwater', 0),
+            ('avg_daily', 0), ('compliance_status', 'N/A')
+        )
+    )
 
     water_table_data = [
         ['Metric', 'Value', 'Unit'],
-        ['Total Water Usage', f"{water_data.get('total_usage', 0):,.2f}", 'm³'],
-        ['Municipal Water', f"{water_data.get('municipal_water', 0):,.2f}", 'm³'],
-        ['Groundwater', f"{water_data.get('groundwater', 0):,.2f}", 'm³'],
-        ['Average Daily Usage', f"{water_data.get('avg_daily', 0):.2f}", 'm³/day'],
-        ['Compliance Status', water_data.get('compliance_status', 'N/A'), '-']
+        ['Total Water Usage', f"{total_usage:,.2f}", 'm³'],
+        ['Municipal Water', f"{municipal:,.2f}", 'm³'],
+        ['Groundwater', f"{groundwater:,.2f}", 'm³'],
+        ['Average Daily Usage', f"{avg_daily:.2f}", 'm³/day'],
+        ['Compliance Status', water_status, '-']
     ]
 
     water_table = Table(water_table_data, colWidths=[3 * inch, 2.5 * inch, 1.5 * inch])
-    water_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#eff6ff')])
-    ]))
-
-    story.append(water_table)
-    story.append(Spacer(1, 0.4 * inch))
-
-    story.append(Paragraph("WASTE MANAGEMENT", heading_style))
-    story.append(Spacer(1, 0.1 * inch))
+    water_table.setStyle(_WATER_TABLE_STYLE)
+
+    story.extend([water_table, Spacer(1, 0.4 * inch)])
+
+    story.extend([Paragraph("WASTE MANAGEMENT", heading_style), Spacer(1, 0.1 * inch)])
 
     waste_data = report_data.waste_data
+    total_waste, recycled, landfill, incinerated, recycling_rate, waste_status = (
+        waste_data.get(key, default) for key, default in (
+            ('total_waste', 0), ('recycled', 0), ('landfill', 0), ('incinerated', 0),
+            ('recycling_rate', 0), ('compliance_status', 'N/A')
+        )
+    )
 
     waste_table_data = [
         ['Metric', 'Value', 'Unit'],
-        ['Total Waste Generated', f"{waste_data.get('total_waste', 0):,.2f}", 'kg'],
-        ['Recycled Waste', f"{waste_data.get('recycled', 0):,.2f}", 'kg'],
-        ['Landfill Waste', f"{waste_data.get('landfill', 0):,.2f}", 'kg'],
-        ['Incinerated Waste', f"{waste_data.get('incinerated', 0):,.2f}", 'kg'],
-        ['Recycling Rate', f"{waste_data.get('recycling_rate', 0):.1f}", '%'],
-        ['Compliance Status', waste_data.get('compliance_status', 'N/A'), '-']
+        ['Total Waste Generated', f"{total_waste:,.2f}", 'kg'],
+        ['Recycled Waste', f"{recycled:,.2f}", 'kg'],
+        ['Landfill Waste', f"{landfill:,.2f}", 'kg'],
+        ['Incinerated Waste', f"{incinerated:,.2f}", 'kg'],
+        ['Recycling Rate', f"{recycling_rate:.1f}", '%'],
+        ['Compliance Status', waste_status, '-']
     ]
 
     waste_table = Table(waste_table_data, colWidths=[3 * inch, 2.5 * inch, 1.5 * inch])
-    waste_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0fdf4')])
-    ]))
-
-    story.append(waste_table)
-    story.append(Spacer(1, 0.3 * inch))
+    waste_table.setStyle(_WASTE_TABLE_STYLE)
+
+    story.extend([waste_table, Spacer(1, 0.3 * inch)])
 
     # ==================== ENHANCED CHARTS SECTION ====================
-    story.append(PageBreak())
-    story.append(Paragraph("VISUAL ANALYTICS & INSIGHTS", heading_style))
-    story.append(Spacer(1, 0.2 * inch))
-    
-    # Use enhanced PDF generator for high-quality charts
-    from app.services.pdf_generator import PDFReportGenerator
-    pdf_gen = PDFReportGenerator()
-    
-    # Emissions data for charts
-    emissions_dict = {
-        'scope1': report_data.summary_metrics.get('scope1_emissions', 0),
-        'scope2': report_data.summary_metrics.get('scope2_emissions', 0),
-        'scope3': report_data.summary_metrics.get('scope3_emissions', 0)
-    }
+    story.extend([PageBreak(), Paragraph("VISUAL ANALYTICS & INSIGHTS", heading_style), Spacer(1, 0.2 * inch)])
     
+    # High-quality charts from the enhanced PDF generator (rendered in the chart pool above)
     # 1. Scope Breakdown Pie Chart (Enhanced)
-    story.append(Paragraph("📊 Emissions by Scope", heading_style))
-    story.append(Spacer(1, 0.1 * inch))
-    context_text = """
-    <b>Understanding Scope Breakdown:</b> This chart shows the distribution of emissions across the three GHG Protocol scopes. 
-    Scope 1 represents direct emissions from owned or controlled sources. Scope 2 covers indirect emissions from purchased energy. 
-    Scope 3 includes all other indirect emissions in the value chain. Understanding this breakdown helps identify the most significant 
-    emission sources and prioritize reduction efforts.
-    """
-    story.append(Paragraph(context_text, styles['Normal']))
-    story.append(Spacer(1, 0.15 * inch))
-    try:
-        scope_pie = pdf_gen._create_scope_pie_chart(emissions_dict)
-        if scope_pie:
-            story.append(scope_pie)
-    except Exception as e:
-        story.append(Paragraph(f"<i>Chart generation error: {str(e)}</i>", styles['Normal']))
-    story.append(Spacer(1, 0.3 * inch))
-    
-    # 2. Scope Breakdown Bar Chart
-    story.append(Paragraph("📊 Scope Comparison (Bar Chart)", heading_style))
-    story.append(Spacer(1, 0.1 * inch))
-    try:
-        scope_bar = pdf_gen._create_scope_bar_chart(emissions_dict)
-        if scope_bar:
-            story.append(scope_bar)
-    except Exception as e:
-        story.append(Paragraph(f"<i>Chart generation error: {str(e)}</i>", styles['Normal']))
+    story.extend([Paragraph("📊 Emissions by Scope", heading_style), Spacer(1, 0.1 * inch)])
+    if 'scope_pie' in chart_jobs:
+        story.extend([static_paragraph(_SCOPE_BREAKDOWN_CONTEXT), Spacer(1, 0.15 * inch)])
+        try:
+            scope_pie = chart_image(chart_result(chart_jobs, chart_futures, 'scope_pie'), 5.5 * inch, 4 * inch)
+            if scope_pie:
+                story.append(scope_pie)
+        except Exception as e:
+            story.append(Paragraph(f"<i>Chart generation error: {str(e)}</i>", normal_style))
+        story.append(Spacer(1, 0.3 * inch))
+
+        # 2. Scope Breakdown Bar Chart
+        story.extend([Paragraph("📊 Scope Comparison (Bar Chart)", heading_style), Spacer(1, 0.1 * inch)])
+        try:
+            scope_bar = chart_image(chart_result(chart_jobs, chart_futures, 'scope_bar'), 5.5 * inch, 4 * inch)
+            if scope_bar:
+                story.append(scope_bar)
+        except Exception as e:
+            story.append(Paragraph(f"<i>Chart generation error: {str(e)}</i>", normal_style))
+    else:
+        story.append(static_paragraph(_NO_EMISSIONS_TEXT))
     story.append(Spacer(1, 0.3 * inch))
     
     # 3. Trends Line Chart (Enhanced)
     if report_data.trends and len(report_data.trends) > 0:
-        story.append(Paragraph("📈 Emissions Trend Over Time", heading_style))
-        story.append(Spacer(1, 0.1 * inch))
-        context_text = """
-        <b>Trend Analysis:</b> This chart shows how emissions have changed over the reporting period. 
-        Understanding trends helps identify patterns, seasonal variations, and the effectiveness of reduction initiatives. 
-        A downward trend indicates successful emission reduction efforts, while an upward trend may signal increased activity 
-        or the need for additional reduction measures.
-        """
-        story.append(Paragraph(context_text, styles['Normal']))
-        story.append(Spacer(1, 0.15 * inch))
+        story.extend([Paragraph("📈 Emissions Trend Over Time", heading_style), Spacer(1, 0.1 * inch)])
+        story.extend([static_paragraph(_TREND_CONTEXT), Spacer(1, 0.15 * inch)])
         try:
-            trend_chart = pdf_gen._create_trend_line_chart(report_data.trends)
+            trend_chart = chart_image(chart_result(chart_jobs, chart_futures, 'trend'), 6 * inch, 4 * inch)
             if trend_chart:
                 story.append(trend_chart)
         except Exception as e:
-            story.append(Paragraph(f"<i>Trend chart generation error: {str(e)}</i>", styles['Normal']))
+            story.append(Paragraph(f"<i>Trend chart generation error: {str(e)}</i>", normal_style))
         story.append(Spacer(1, 0.3 * inch))
     
     # 4. Category Breakdown Chart
     if report_data.category_breakdown and len(report_data.category_breakdown) > 0:
-        story.append(Paragraph("📦 Top Emission Categories", heading_style))
-        story.append(Spacer(1, 0.1 * inch))
-        context_text = """
-        <b>Category Analysis:</b> This chart identifies the emission categories contributing most to your total footprint. 
-        Categories are based on GHG Protocol classifications and help prioritize reduction efforts. 
-        Focus on the top categories for maximum impact on overall emissions reduction.
-        """
-        story.append(Paragraph(context_text, styles['Normal']))
-        story.append(Spacer(1, 0.15 * inch))
-        try:
-            category_chart = pdf_gen._create_category_bar_chart(report_data.category_breakdown)
-            if category_chart:
-                story.append(category_chart)
-        except Exception as e:
-            story.append(Paragraph(f"<i>Category chart generation error: {str(e)}</i>", styles['Normal']))
+        story.extend([Paragraph("📦 Top Emission Categories", heading_style), Spacer(1, 0.1 * inch)])
+        if 'category' in chart_jobs:
+            story.extend([static_paragraph(_CATEGORY_CONTEXT), Spacer(1, 0.15 * inch)])
+            try:
+                category_chart = chart_image(chart_result(chart_jobs, chart_futures, 'category'), 6 * inch, 4.5 * inch)
+                if category_chart:
+                    story.append(category_chart)
+            except Exception as e:
+                story.append(Paragraph(f"<i>Category chart generation error: {str(e)}</i>", normal_style))
+        else:
+            story.append(static_paragraph(_NO_EMISSIONS_TEXT))
         story.append(Spacer(1, 0.3 * inch))
     
     # 5. Top Emitters Chart
     if report_data.activities and len(report_data.activities) > 0:
-        story.append(Paragraph("🔥 Top Emission Sources", heading_style))
-        story.append(Spacer(1, 0.1 * inch))
-        context_text = """
-        <b>Top Emitters Analysis:</b> This chart highlights the individual activities with the highest emissions. 
-        These activities represent the greatest opportunities for emission reductions. 
-        Consider implementing targeted reduction strategies for these high-impact activities.
-        """
-        story.append(Paragraph(context_text, styles['Normal']))
-        story.append(Spacer(1, 0.15 * inch))
-        try:
-            top_emitters_data = [
-                {
-                    'activity': act.get('activity_name', 'N/A'),
-                    'total_emissions_kg': act.get('emissions_kg', 0)
-                }
-                for act in report_data.activities[:8]
-            ]
-            top_emitters_chart = pdf_gen._create_top_emitters_chart(top_emitters_data)
-            if top_emitters_chart:
-                story.append(top_emitters_chart)
-        except Exception as e:
-            story.append(Paragraph(f"<i>Top emitters chart generation error: {str(e)}</i>", styles['Normal']))
+        story.extend([Paragraph("🔥 Top Emission Sources", heading_style), Spacer(1, 0.1 * inch)])
+        if 'top_emitters' in chart_jobs:
+            story.extend([static_paragraph(_TOP_EMITTERS_CONTEXT), Spacer(1, 0.15 * inch)])
+            try:
+                top_emitters_chart = chart_image(chart_result(chart_jobs, chart_futures, 'top_emitters'), 6 * inch, 4 * inch)
+                if top_emitters_chart:
+                    story.append(top_emitters_chart)
+            except Exception as e:
+                story.append(Paragraph(f"<i>Top emitters chart generation error: {str(e)}</i>", normal_style))
+        else:
+            story.append(static_paragraph(_NO_EMISSIONS_TEXT))
         story.append(Spacer(1, 0.3 * inch))
 
     # ==================== PAGE 5: AI RECOMMENDATIONS ====================
 
-    story.append(PageBreak())
-    story.append(Paragraph("AI-POWERED RECOMMENDATIONS", heading_style))
-    story.append(Spacer(1, 0.2 * inch))
+    story.extend([PageBreak(), Paragraph("AI-POWERED RECOMMENDATIONS", heading_style), Spacer(1, 0.2 * inch)])
 
-    intro_text = """
-    The following recommendations are generated using advanced AI analysis of your emission data, 
-    industry best practices, and sustainability standards. Each recommendation includes priority level, 
-    estimated impact, and implementation guidance.
-    """
-    story.append(Paragraph(intro_text, styles['Normal']))
-    story.append(Spacer(1, 0.2 * inch))
+    story.extend([static_paragraph(_RECOMMENDATIONS_INTRO), Spacer(1, 0.2 * inch)])
 
     # Handle recommendations - show message if empty
     if report_data.recommendations and len(report_data.recommendations) > 0:
@@ -1006,20 +1769,20 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
                 rec_desc = rec.get('description', rec.get('detailed_analysis', 'No description available.'))
                 rec_savings = rec.get('estimated_savings_kg', 0)
                 
-                # Priority color
-                priority_color = '#dc2626' if rec_priority == 'High' else '#f59e0b' if rec_priority == 'Medium' else '#10b981'
-                
-                rec_text = f"""
-                <b><font size=12 color={priority_color}>{idx}. {rec_title}</font></b><br/>
-                <font size=9 color=#6b7280>Priority: {rec_priority} | Estimated Savings: {rec_savings / 1000:.2f} tons CO2e</font><br/><br/>
-                {rec_desc[:400]}{'...' if len(rec_desc) > 400 else ''}
-                """
-                story.append(Paragraph(rec_text, styles['Normal']))
+                rec_text = _REC_TEMPLATE.format(
+                    color=_PRIORITY_COLORS.get(rec_priority, '#10b981'),
+                    idx=idx,
+                    title=rec_title,
+                    priority=rec_priority,
+                    savings=rec_savings / 1000,
+                    desc=_truncate(rec_desc)
+                )
+                story.append(Paragraph(rec_text, normal_style))
             else:
-                story.append(Paragraph(f"{idx}. {rec}", styles['Normal']))
+                story.append(Paragraph(f"{idx}. {rec}", normal_style))
             story.append(Spacer(1, 0.15 * inch))
     else:
-        story.append(Paragraph("<i>No AI recommendations available at this time. Recommendations will appear as more data is collected and analyzed.</i>", styles['Normal']))
+        story.append(Paragraph("<i>No AI recommendations available at this time. Recommendations will appear as more data is collected and analyzed.</i>", normal_style))
 
     story.append(PageBreak())
 
@@ -1027,67 +1790,48 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
 
     # Goals section
     if report_data.goals:
-        story.append(Paragraph("GOALS & TARGETS", heading_style))
-        story.append(Spacer(1, 0.1 * inch))
+        story.extend([Paragraph("GOALS & TARGETS", heading_style), Spacer(1, 0.1 * inch)])
         
         goals_data = [['Goal', 'Target', 'Current', 'Deadline', 'Status']]
-        for goal in report_data.goals[:5]:
-            goals_data.append([
+        goals_data.extend(
+            (
                 goal.get('title', 'N/A'),
                 str(goal.get('target_value', 0)),
                 str(goal.get('current_value', 0)),
                 goal.get('deadline', 'N/A'),
                 goal.get('status', 'N/A')
-            ])
-        
+            )
+            for goal in report_data.goals[:5]
+        )
+
         goals_table = Table(goals_data, colWidths=[2 * inch, 1 * inch, 1 * inch, 1.2 * inch, 1.2 * inch])
-        goals_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8b5cf6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#faf5ff')])
-        ]))
-        story.append(goals_table)
-        story.append(Spacer(1, 0.3 * inch))
+        goals_table.setStyle(_GOALS_TABLE_STYLE)
+        story.extend([goals_table, Spacer(1, 0.3 * inch)])
 
     # Top Activities
-    story.append(Paragraph("TOP EMISSION ACTIVITIES", heading_style))
-    story.append(Spacer(1, 0.1 * inch))
+    story.extend([Paragraph("TOP EMISSION ACTIVITIES", heading_style), Spacer(1, 0.1 * inch)])
     if report_data.activities and len(report_data.activities) > 0:
         activities_data = [['Activity', 'Type', 'Emissions (kg CO2e)', 'Scope', 'Date']]
-        for act in report_data.activities[:8]:
-            activities_data.append([
+        activities_data.extend(
+            (
                 act.get('activity_name', 'N/A')[:30],
                 act.get('activity_type', 'N/A')[:20],
                 f"{act.get('emissions_kg', 0):,.2f}",
                 act.get('scope', 'N/A'),
                 act.get('date', 'N/A')
-            ])
-        
-        activities_table = Table(activities_data, colWidths=[2 * inch, 1.5 * inch, 1.2 * inch, 0.8 * inch, 1 * inch])
-        activities_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f59e0b')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fffbeb')])
-        ]))
+            )
+            for act in report_data.activities[:8]
+        )
+
+        activities_table = LongTable(activities_data, colWidths=[2 * inch, 1.5 * inch, 1.2 * inch, 0.8 * inch, 1 * inch], repeatRows=1)
+        activities_table.setStyle(_ACTIVITIES_TABLE_STYLE)
         story.append(activities_table)
     else:
-        story.append(Paragraph("<i>No activities recorded for this reporting period.</i>", styles['Normal']))
+        story.append(Paragraph("<i>No activities recorded for this reporting period.</i>", normal_style))
     story.append(Spacer(1, 0.3 * inch))
 
     # Compliance & Standards
-    story.append(Paragraph("COMPLIANCE & STANDARDS", heading_style))
-    story.append(Spacer(1, 0.1 * inch))
+    story.extend([Paragraph("COMPLIANCE & STANDARDS", heading_style), Spacer(1, 0.1 * inch)])
     compliance = report_data.compliance_info
     compliance_text = f"""
     <b>Reporting Framework:</b> {compliance.get('reporting_framework', 'GHG Protocol Corporate Standard')}<br/>
@@ -1098,36 +1842,15 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
     <b>Data Quality:</b> {compliance.get('data_quality', 'High')}<br/>
     <b>Assurance Level:</b> {compliance.get('assurance_level', 'Limited Assurance')}
     """
-    story.append(Paragraph(compliance_text, styles['Normal']))
-    story.append(Spacer(1, 0.3 * inch))
+    story.extend([Paragraph(compliance_text, normal_style), Spacer(1, 0.3 * inch)])
 
     # Category breakdown if not already shown
-    if report_data.category_breakdown and len(report_data.category_breakdown) > 0:
-        story.append(Paragraph("EMISSIONS BY CATEGORY", heading_style))
-        story.append(Spacer(1, 0.1 * inch))
-        category_data = [['Category', 'Emissions (tons CO2e)', 'Percentage', 'Activities']]
-        for cat in report_data.category_breakdown[:8]:
-            category_data.append([
-                cat.get('category', 'Uncategorized'),
-                f"{cat.get('emissions_kg', 0) / 1000:.2f}",
-                f"{cat.get('emissions_percent', 0):.1f}%",
-                str(cat.get('activities_count', 0))
-            ])
-
-        category_table = Table(category_data, colWidths=[2.5 * inch, 1.5 * inch, 1.2 * inch, 1.2 * inch])
-        category_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0fdf4')])
-        ]))
-        story.append(category_table)
-        story.append(Spacer(1, 0.2 * inch))
+    if category_rows:
+        story.extend([Paragraph("EMISSIONS BY CATEGORY", heading_style), Spacer(1, 0.1 * inch)])
+        category_data = [_CATEGORY_TABLE_HEADER, *category_rows]
+        category_table = LongTable(category_data, colWidths=[2.5 * inch, 1.5 * inch, 1.2 * inch, 1.2 * inch], repeatRows=1)
+        category_table.setStyle(_CATEGORY_TABLE_STYLE)
+        story.extend([category_table, Spacer(1, 0.2 * inch)])
 
     # ==================== FOOTER ====================
 
@@ -1137,11 +1860,11 @@ def generate_pdf_report(report_data: ComprehensiveReportData) -> io.BytesIO:
     <font size=9 color=#6b7280>
     <i>This report is generated by AI-Powered Carbon Accounting Platform<br/>
     For questions or additional information, contact {company.reporting_officer} at {company.email}<br/>
-    Report generated on {report_data.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</i>
+    Report generated on {report_data.generated_at.isoformat(' ', 'seconds')}</i>
     </font>
     </para>
     """
-    story.append(Paragraph(footer_text, styles['Normal']))
+    story.append(Paragraph(footer_text, normal_style))
 
     # Build PDF
     doc.build(story)
@@ -1164,75 +1887,35 @@ async def generate_report(
     if config.date_range.start_date > config.date_range.end_date:
         raise HTTPException(
             status_code=400,
-            detail="Start date must be before end date"
-        )
-
-    # Calculate summary metrics
-    summary = calculate_summary_metrics(
-        db,
-        current_user.company_id,
-        config.date_range.start_date,
-        config.date_range.end_date,
-        config.scope,
-        config.category
-    )
-
-    # Generate trend data
-    trends = generate_trend_data(
-        db,
-        current_user.company_id,
-        config.date_range.start_date,
-        config.date_range.end_date,
-        config.group_by,
-        config.scope,
-        config.category
-    )
-
-    # Generate category breakdown
-    category_breakdown = generate_category_breakdown(
-        db,
-        current_user.company_id,
-        config.date_range.start_date,
-        config.date_range.end_date,
-        config.scope
-    )
-
-    # Scope breakdown
-    scope_query = db.query(
-        EmissionActivity.scope_number,
-        func.sum(EmissionActivity.emissions_kgco2e).label('total')
-    ).filter(
-        EmissionActivity.company_id == current_user.company_id,
-        EmissionActivity.activity_date >= config.date_range.start_date,
-        EmissionActivity.activity_date <= config.date_range.end_date
-    ).group_by(EmissionActivity.scope_number).all()
-
-    scope_breakdown = {f"Scope {scope}": round(total, 2) for scope, total in scope_query}
-
-    # Top emission sources
-    top_sources_query = db.query(
-        EmissionActivity.activity_name,
-        func.sum(EmissionActivity.emissions_kgco2e).label('total'),
-        func.count(EmissionActivity.id).label('count')
-    ).filter(
-        EmissionActivity.company_id == current_user.company_id,
-        EmissionActivity.activity_date >= config.date_range.start_date,
-        EmissionActivity.activity_date <= config.date_range.end_date
-    ).group_by(EmissionActivity.activity_name).order_by(func.sum(EmissionActivity.emissions_kgco2e).desc()).limit(
-        10).all()
+            detail="Start date must be before end date"
+        )
 
-    top_sources = [
-        {
-            "activity": name,
-            "total_emissions_kg": round(total, 2),
-            "occurrences": count,
-            "average_per_occurrence": round(total / count, 2) if count > 0 else 0
-        }
-        for name, total, count in top_sources_query
-    ]
+    # Everything derived from activities is cached until they change (one version query)
+    version = get_activity_data_version(db, current_user.company_id)
+
+    # Summary metrics, trend data and category breakdown
+    summary, trends, category_breakdown = get_cached_report_sections(
+        db,
+        current_user.company_id,
+        config.date_range.start_date,
+        config.date_range.end_date,
+        config.group_by,
+        config.scope,
+        config.category,
+        version=version
+    )
+
+    # Scope breakdown and top emission sources
+    scope_breakdown, top_sources = get_cached_emission_sources(
+        db,
+        current_user.company_id,
+        config.date_range.start_date,
+        config.date_range.end_date,
+        version=version
+    )
 
     # Goals progress
-    goals = db.query(Goal).filter(Goal.user_id == current_user.id).all()
+    goals = db.query(Goal).options(raiseload('*')).filter(Goal.user_id == current_user.id).all()
     goals_progress = [
         {
             "goal_title": goal.title,
@@ -1272,229 +1955,141 @@ async def generate_comprehensive_csv_report(
 
     try:
         # Get company info
-        company = db.query(Company).filter(Company.id == current_user.company_id).first()
+        company, cached_rec = fetch_company_and_cached_recommendation(db, current_user.company_id)
 
-        # Calculate all metrics
-        summary = calculate_summary_metrics(
-            db,
+        # Calculate all metrics (independent queries, run concurrently)
+        (
+            summary, water_data, waste_data, scope3_data, trends_obj, category_breakdown_obj
+        ) = await gather_report_metrics(
             current_user.company_id,
             config.date_range.start_date,
-            config.date_range.end_date
-        )
-
-        water_data = get_water_metrics(db, current_user.company_id, config.date_range.start_date,
-                                       config.date_range.end_date)
-        waste_data = get_waste_metrics(db, current_user.company_id, config.date_range.start_date,
-                                       config.date_range.end_date)
-        scope3_data = get_scope3_metrics(db, current_user.company_id, config.date_range.start_date,
-                                         config.date_range.end_date)
-
-        trends_obj = generate_trend_data(
-            db, current_user.company_id, config.date_range.start_date, config.date_range.end_date, config.group_by
+            config.date_range.end_date,
+            config.group_by
         )
 
-        # Get ALL activities (not just top 10)
-        all_activities = []
-        try:
-            activities_query = db.query(EmissionActivity).filter(
-                EmissionActivity.company_id == current_user.company_id,
-                EmissionActivity.activity_date >= config.date_range.start_date,
-                EmissionActivity.activity_date <= config.date_range.end_date
-            ).order_by(EmissionActivity.activity_date.desc(), EmissionActivity.emissions_kgco2e.desc()).all()
-            
-            all_activities = [
-                {
-                    "activity_name": a.activity_name or a.activity_type or "Unnamed Activity",
-                    "activity_type": a.activity_type or "N/A",
-                    "description": a.description or "",
-                    "quantity": a.quantity or 0,
-                    "unit": a.unit or "N/A",
-                    "emissions_kg": round(a.emissions_kgco2e, 2),
-                    "emissions_tons": round(a.emissions_kgco2e / 1000, 3),
-                    "scope": f"Scope {a.scope_number}",
-                    "scope_number": a.scope_number or 0,
-                    "category": a.category or "Uncategorized",
-                    "subcategory": a.subcategory or "",
-                    "location": a.location or "N/A",
-                    "activity_date": a.activity_date.strftime("%Y-%m-%d") if a.activity_date else "N/A",
-                    "reporting_period": a.reporting_period or "N/A",
-                    "source_document": a.source_document or "",
-                    "created_at": a.created_at.strftime("%Y-%m-%d %H:%M:%S") if a.created_at else "N/A"
-                }
-                for a in activities_query
-            ]
-        except Exception as e:
-            print(f"⚠️ Error fetching all activities: {e}")
-
-        # Get category breakdown
-        category_breakdown_obj = generate_category_breakdown(
-            db, current_user.company_id, config.date_range.start_date, config.date_range.end_date
-        )
-        category_breakdown = [
-            {
-                "category": c.category,
-                "emissions_kg": c.emissions_kg,
-                "emissions_tons": c.emissions_kg / 1000,
-                "emissions_percent": c.emissions_percent,
-                "activities_count": c.activities_count
-            }
-            for c in category_breakdown_obj
-        ]
+        # Category breakdown rows
+        category_rows = category_breakdown_rows(category_breakdown_obj)
 
-        # Fetch AI Recommendations
-        ensure_ai_recommendation_schema()
+        # AI Recommendations (fetched together with the company above)
         ai_recommendations = []
-        try:
-            cached_rec = db.query(AIRecommendation).filter(
-                AIRecommendation.company_id == current_user.company_id,
-                AIRecommendation.is_active == True
-            ).order_by(AIRecommendation.generated_at.desc()).first()
-            
-            if cached_rec:
-                try:
-                    if hasattr(cached_rec, 'is_expired') and cached_rec.is_expired():
-                        pass
-                    else:
-                        recs_json = cached_rec.recommendations_json
-                        if recs_json:
-                            if isinstance(recs_json, list):
-                                ai_recommendations = recs_json
-                            elif isinstance(recs_json, dict) and 'recommendations' in recs_json:
-                                ai_recommendations = recs_json.get('recommendations', [])
-                except Exception as rec_error:
-                    print(f"⚠️ Error processing cached recommendations: {rec_error}")
-        except Exception as e:
-            print(f"⚠️ Error fetching AI recommendations: {e}")
+        if cached_rec:
+            try:
+                ai_recommendations = cached_recommendation_list(cached_rec)
+            except Exception as rec_error:
+                print(f"⚠️ Error processing cached recommendations: {rec_error}")
 
         # Fetch Goals
         goals = []
         try:
-            goals_query = db.query(Goal).filter(
-                Goal.user_id == current_user.id
-            ).all()
-            goals = [
-                {
-                    "title": g.title,
-                    "target_emissions": g.target_emissions,
-                    "current_emissions": g.current_emissions or 0,
-                    "target_year": g.target_year,
-                    "status": g.status.replace("_", " ").title() if g.status else "On Track"
-                }
-                for g in goals_query
-            ]
+            goals = fetch_goal_export_rows(db, current_user.id)
         except Exception as e:
             print(f"⚠️ Error fetching goals: {e}")
 
         # Create comprehensive CSV with all data
-        # Combine all data into a single comprehensive CSV
-        csv_rows = []
-        
-        # Header section
-        csv_rows.append("=== SUSTAINABILITY REPORT ===")
-        csv_rows.append(f"Company: {getattr(company, 'name', 'Your Company') if company else 'Your Company'}")
-        csv_rows.append(f"Reporting Period: {config.date_range.start_date} to {config.date_range.end_date}")
-        csv_rows.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        csv_rows.append("")
-        
-        # Summary Metrics
-        csv_rows.append("=== SUMMARY METRICS ===")
-        csv_rows.append("Metric,Value")
-        csv_rows.append(f"Total Emissions (kg CO2e),{summary.total_emissions_kg}")
-        csv_rows.append(f"Total Emissions (tons CO2e),{summary.total_emissions_tons}")
-        csv_rows.append(f"Scope 1 Emissions,{summary.scope1_emissions}")
-        csv_rows.append(f"Scope 2 Emissions,{summary.scope2_emissions}")
-        csv_rows.append(f"Scope 3 Emissions,{summary.scope3_emissions}")
-        csv_rows.append(f"Total Water Usage (m³),{water_data.get('total_usage', 0)}")
-        csv_rows.append(f"Total Waste (kg),{waste_data.get('total_waste', 0)}")
-        csv_rows.append(f"Recycled Waste (kg),{waste_data.get('recycled', 0)}")
-        csv_rows.append(f"Recycling Rate (%),{waste_data.get('recycling_rate', 0)}")
-        csv_rows.append(f"Total Activities Tracked,{summary.total_activities}")
-        csv_rows.append("")
-        
-        # Emissions Breakdown
-        csv_rows.append("=== EMISSIONS BREAKDOWN ===")
-        csv_rows.append("Scope,Emissions (kg CO2e),Emissions (tons CO2e),Percentage (%)")
+        # Sections are written row by row through csv.writer, which handles quoting
+        csv_buffer = io.StringIO()
+        writer = new_csv_writer(csv_buffer)
+        writerow, writerows = writer.writerow, writer.writerows
+        company_name = getattr(company, 'name', 'Your Company') if company else 'Your Company'
+        s1, s2, s3 = summary.scope1_emissions, summary.scope2_emissions, summary.scope3_emissions
         total_kg = summary.total_emissions_kg if summary.total_emissions_kg > 0 else 1
-        csv_rows.append(f"Scope 1,{summary.scope1_emissions},{summary.scope1_emissions / 1000},{round(summary.scope1_emissions / total_kg * 100, 1)}")
-        csv_rows.append(f"Scope 2,{summary.scope2_emissions},{summary.scope2_emissions / 1000},{round(summary.scope2_emissions / total_kg * 100, 1)}")
-        csv_rows.append(f"Scope 3,{summary.scope3_emissions},{summary.scope3_emissions / 1000},{round(summary.scope3_emissions / total_kg * 100, 1)}")
-        csv_rows.append(f"TOTAL,{summary.total_emissions_kg},{summary.total_emissions_tons},100.0")
-        csv_rows.append("")
-        
+
+        # Header, summary metrics and emissions breakdown
+        writerows([
+            ["=== SUSTAINABILITY REPORT ==="],
+            [f"Company: {company_name}"],
+            [f"Reporting Period: {config.date_range.start_date} to {config.date_range.end_date}"],
+            [f"Generated: {datetime.now().isoformat(' ', 'seconds')}"],
+            [],
+            ["=== SUMMARY METRICS ==="],
+            ["Metric", "Value"],
+            ["Total Emissions (kg CO2e)", summary.total_emissions_kg],
+            ["Total Emissions (tons CO2e)", summary.total_emissions_tons],
+            ["Scope 1 Emissions", s1],
+            ["Scope 2 Emissions", s2],
+            ["Scope 3 Emissions", s3],
+            ["Total Water Usage (m³)", water_data.get('total_usage', 0)],
+            ["Total Waste (kg)", waste_data.get('total_waste', 0)],
+            ["Recycled Waste (kg)", waste_data.get('recycled', 0)],
+            ["Recycling Rate (%)", waste_data.get('recycling_rate', 0)],
+            ["Total Activities Tracked", summary.total_activities],
+            [],
+            ["=== EMISSIONS BREAKDOWN ==="],
+            ["Scope", "Emissions (kg CO2e)", "Emissions (tons CO2e)", "Percentage (%)"],
+            ["Scope 1", s1, s1 / 1000, round(s1 / total_kg * 100, 1)],
+            ["Scope 2", s2, s2 / 1000, round(s2 / total_kg * 100, 1)],
+            ["Scope 3", s3, s3 / 1000, round(s3 / total_kg * 100, 1)],
+            ["TOTAL", summary.total_emissions_kg, summary.total_emissions_tons, 100.0],
+            [],
+        ])
+
         # Category Breakdown
-        if category_breakdown:
-            csv_rows.append("=== CATEGORY BREAKDOWN ===")
-            csv_rows.append("Category,Emissions (kg CO2e),Emissions (tons CO2e),Percentage (%),Activities Count")
-            for cat in category_breakdown:
-                csv_rows.append(f"{cat['category']},{cat['emissions_kg']},{cat['emissions_tons']},{cat['emissions_percent']},{cat['activities_count']}")
-            csv_rows.append("")
-        
+        if category_rows:
+            writerow(["=== CATEGORY BREAKDOWN ==="])
+            writerow(["Category", "Emissions (kg CO2e)", "Emissions (tons CO2e)", "Percentage (%)", "Activities Count"])
+            writerows(category_rows)
+            writerow([])
+
         # Trends
         if trends_obj:
-            csv_rows.append("=== TRENDS ===")
-            csv_rows.append("Period,Emissions (kg CO2e),Activities Count")
-            for trend in trends_obj:
-                csv_rows.append(f"{trend.period},{trend.emissions_kg},{trend.activities_count}")
-            csv_rows.append("")
-        
-        # Water Usage
-        csv_rows.append("=== WATER USAGE ===")
-        csv_rows.append("Source,Usage (m³)")
-        csv_rows.append(f"Municipal Water,{water_data.get('municipal_water', 0)}")
-        csv_rows.append(f"Groundwater,{water_data.get('groundwater', 0)}")
-        csv_rows.append(f"Rainwater,{water_data.get('rainwater', 0)}")
-        csv_rows.append(f"TOTAL,{water_data.get('total_usage', 0)}")
-        csv_rows.append("")
-        
-        # Waste Management
-        csv_rows.append("=== WASTE MANAGEMENT ===")
-        csv_rows.append("Disposal Method,Weight (kg)")
-        csv_rows.append(f"Recycled,{waste_data.get('recycled', 0)}")
-        csv_rows.append(f"Landfill,{waste_data.get('landfill', 0)}")
-        csv_rows.append(f"Incinerated,{waste_data.get('incinerated', 0)}")
-        csv_rows.append(f"TOTAL,{waste_data.get('total_waste', 0)}")
-        csv_rows.append("")
-        
-        # All Activities
-        csv_rows.append("=== ALL ACTIVITIES ===")
-        if all_activities:
-            csv_rows.append("Activity Name,Activity Type,Description,Quantity,Unit,Emissions (kg CO2e),Emissions (tons CO2e),Scope,Scope Number,Category,Subcategory,Location,Activity Date,Reporting Period,Source Document,Created At")
-            for act in all_activities:
-                csv_rows.append(f'"{act["activity_name"]}","{act["activity_type"]}","{act["description"]}",{act["quantity"]},"{act["unit"]}",{act["emissions_kg"]},{act["emissions_tons"]},"{act["scope"]}",{act["scope_number"]},"{act["category"]}","{act["subcategory"]}","{act["location"]}",{act["activity_date"]},"{act["reporting_period"]}","{act["source_document"]}",{act["created_at"]}')
-        else:
-            csv_rows.append("No activities found for this reporting period")
-        csv_rows.append("")
-        
+            writerow(["=== TRENDS ==="])
+            writerow(["Period", "Emissions (kg CO2e)", "Activities Count"])
+            writerows((trend.period, trend.emissions_kg, trend.activities_count) for trend in trends_obj)
+            writerow([])
+
+        # Water Usage and Waste Management
+        writerows([
+            ["=== WATER USAGE ==="],
+            ["Source", "Usage (m³)"],
+            ["Municipal Water", water_data.get('municipal_water', 0)],
+            ["Groundwater", water_data.get('groundwater', 0)],
+            ["Rainwater", water_data.get('rainwater', 0)],
+            ["TOTAL", water_data.get('total_usage', 0)],
+            [],
+            ["=== WASTE MANAGEMENT ==="],
+            ["Disposal Method", "Weight (kg)"],
+            ["Recycled", waste_data.get('recycled', 0)],
+            ["Landfill", waste_data.get('landfill', 0)],
+            ["Incinerated", waste_data.get('incinerated', 0)],
+            ["TOTAL", waste_data.get('total_waste', 0)],
+            [],
+        ])
+
+        # All Activities (rows are streamed from the database below)
+        writerow(["=== ALL ACTIVITIES ==="])
+        csv_head = csv_buffer.getvalue()
+
+        # Everything after the activities goes into a second buffer
+        csv_buffer = io.StringIO()
+        writer = new_csv_writer(csv_buffer)
+        writerow, writerows = writer.writerow, writer.writerows
+
         # AI Recommendations
         if ai_recommendations:
-            csv_rows.append("=== AI RECOMMENDATIONS ===")
-            csv_rows.append("Title,Priority,Estimated Savings (kg CO2e),Description")
-            for rec in ai_recommendations:
-                if isinstance(rec, dict):
-                    title = rec.get('title', 'N/A').replace('"', '""')
-                    desc = rec.get('description', rec.get('detailed_analysis', 'N/A')).replace('"', '""')
-                    csv_rows.append(f'"{title}","{rec.get("priority", "Medium")}",{rec.get("estimated_savings_kg", 0)},"{desc}"')
-                else:
-                    rec_str = str(rec).replace('"', '""')
-                    csv_rows.append(f'"{rec_str}","Medium",0,"{rec_str}"')
-            csv_rows.append("")
-        
+            writerows([[], ["=== AI RECOMMENDATIONS ==="], ["Title", "Priority", "Estimated Savings (kg CO2e)", "Description"]])
+            writerows(map(recommendation_export_row, ai_recommendations))
+
         # Goals
         if goals:
-            csv_rows.append("=== GOALS & TARGETS ===")
-            csv_rows.append("Title,Target Emissions,Current Emissions,Target Year,Status")
-            for goal in goals:
-                title = goal.get('title', 'N/A').replace('"', '""')
-                csv_rows.append(f'"{title}",{goal.get("target_emissions", 0)},{goal.get("current_emissions", 0)},{goal.get("target_year", "N/A")},"{goal.get("status", "On Track")}"')
-            csv_rows.append("")
+            writerows([[], ["=== GOALS & TARGETS ==="], ["Title", "Target Emissions", "Current Emissions", "Target Year", "Status"]])
+            writerows(goals)
 
-        # Combine all rows
-        csv_content = "\n".join(csv_rows)
+        csv_tail = csv_buffer.getvalue()
 
-        filename = f"sustainability_report_{datetime.now().strftime('%Y%m%d')}.csv"
+        def csv_chunks():
+            yield csv_head
+            yield from iter_activities_csv(
+                current_user.company_id,
+                config.date_range.start_date,
+                config.date_range.end_date
+            )
+            if csv_tail:
+                yield csv_tail
+
+        filename = f"sustainability_report_{report_date_tag()}.csv"
 
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            csv_chunks(),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -1507,6 +2102,65 @@ async def generate_comprehensive_csv_report(
         raise HTTPException(status_code=500, detail=f"Error generating CSV report: {str(e)}")
 
 
+def build_report_workbook(report: DetailedReport):
+    """Write the multi-sheet export of a DetailedReport and return the finished buffer"""
+
+    # Create Excel file (rows are streamed, not kept as cell objects)
+    output = new_report_buffer()
+    workbook = new_excel_workbook(output)
+    header_format = workbook.add_format({'bold': True, 'align': 'center', 'valign': 'vcenter'})
+
+    # Summary sheet
+    summary_rows = [
+        ["Total Emissions (kg)", report.summary.total_emissions_kg],
+        ["Total Emissions (tons)", report.summary.total_emissions_tons],
+        ["Scope 1 Emissions", report.summary.scope1_emissions],
+        ["Scope 2 Emissions", report.summary.scope2_emissions],
+        ["Scope 3 Emissions", report.summary.scope3_emissions],
+        ["Top Category", report.summary.top_category],
+        ["Top Category Emissions", report.summary.top_category_emissions],
+        ["Average Daily Emissions", report.summary.average_daily_emissions],
+        ["Total Activities", report.summary.total_activities],
+        ["Comparison to Previous Period (%)", report.summary.comparison_to_previous_period]
+    ]
+    write_excel_sheet(workbook, 'Summary', ["Metric", "Value"], summary_rows, header_format)
+
+    # Trends sheet
+    trends_rows = [
+        [t.period, t.emissions_kg, t.activities_count, t.average_emission_per_activity]
+        for t in report.trends
+    ]
+    write_excel_sheet(
+        workbook, 'Trends',
+        ["Period", "Emissions (kg)", "Activities", "Avg per Activity"] if trends_rows else [],
+        trends_rows, header_format
+    )
+
+    # Category breakdown sheet
+    category_rows = [
+        [c.category, c.emissions_kg, c.emissions_percent, c.activities_count]
+        for c in report.category_breakdown
+    ]
+    write_excel_sheet(
+        workbook, 'Categories',
+        ["Category", "Emissions (kg)", "Percentage", "Activities"] if category_rows else [],
+        category_rows, header_format
+    )
+
+    # Top sources sheet
+    if report.top_emission_sources:
+        headers, rows = records_to_rows(report.top_emission_sources)
+        write_excel_sheet(workbook, 'Top Sources', headers, rows, header_format)
+
+    # Goals progress sheet
+    if report.goals_progress:
+        headers, rows = records_to_rows(report.goals_progress)
+        write_excel_sheet(workbook, 'Goals', headers, rows, header_format)
+
+    workbook.close()
+    return output
+
+
 @router.post("/export/excel")
 async def export_report_excel(
         config: ReportConfig,
@@ -1518,76 +2172,19 @@ async def export_report_excel(
     # Generate report data
     report = await generate_report(config, current_user, db)
 
-    # Create Excel file in memory
-    output = io.BytesIO()
-
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Summary sheet
-        summary_data = {
-            "Metric": [
-                "Total Emissions (kg)",
-                "Total Emissions (tons)",
-                "Scope 1 Emissions",
-                "Scope 2 Emissions",
-                "Scope 3 Emissions",
-                "Top Category",
-                "Top Category Emissions",
-                "Average Daily Emissions",
-                "Total Activities",
-                "Comparison to Previous Period (%)"
-            ],
-            "Value": [
-                report.summary.total_emissions_kg,
-                report.summary.total_emissions_tons,
-                report.summary.scope1_emissions,
-                report.summary.scope2_emissions,
-                report.summary.scope3_emissions,
-                report.summary.top_category,
-                report.summary.top_category_emissions,
-                report.summary.average_daily_emissions,
-                report.summary.total_activities,
-                report.summary.comparison_to_previous_period
-            ]
-        }
-        pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
-
-        # Trends sheet
-        trends_data = [{
-            "Period": t.period,
-            "Emissions (kg)": t.emissions_kg,
-            "Activities": t.activities_count,
-            "Avg per Activity": t.average_emission_per_activity
-        } for t in report.trends]
-        pd.DataFrame(trends_data).to_excel(writer, sheet_name='Trends', index=False)
-
-        # Category breakdown sheet
-        category_data = [{
-            "Category": c.category,
-            "Emissions (kg)": c.emissions_kg,
-            "Percentage": c.emissions_percent,
-            "Activities": c.activities_count
-        } for c in report.category_breakdown]
-        pd.DataFrame(category_data).to_excel(writer, sheet_name='Categories', index=False)
-
-        # Top sources sheet
-        pd.DataFrame(report.top_emission_sources).to_excel(writer, sheet_name='Top Sources', index=False)
-
-        # Goals progress sheet
-        if report.goals_progress:
-            pd.DataFrame(report.goals_progress).to_excel(writer, sheet_name='Goals', index=False)
-
-    output.seek(0)
+    # Writing the workbook is CPU-bound, keep it off the event loop
+    output = await run_in_threadpool(build_report_workbook, report)
 
     return StreamingResponse(
-        io.BytesIO(output.getvalue()),
+        iter_report_chunks(output),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
-            "Content-Disposition": f"attachment; filename=emissions_report_{datetime.now().strftime('%Y%m%d')}.xlsx"
+            "Content-Disposition": f"attachment; filename=emissions_report_{report_date_tag()}.xlsx"
         }
     )
 
 
-@router.get("/dashboard")
+@router.get("/dashboard", response_class=ORJSONReportResponse)
 async def get_dashboard_data(
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
@@ -1604,28 +2201,20 @@ async def get_dashboard_data(
     # Last 12 months
     last_12_months_start = date.today() - timedelta(days=365)
 
-    # Current month summary
-    current_month_summary = calculate_summary_metrics(
-        db, current_user.company_id, current_month_start, current_month_end
-    )
-
-    # Last 30 days trend
-    last_30_days_trend = generate_trend_data(
-        db, current_user.company_id, last_30_days_start, date.today(), "day"
-    )
-
-    # Last 12 months trend
-    last_12_months_trend = generate_trend_data(
-        db, current_user.company_id, last_12_months_start, date.today(), "month"
-    )
-
-    # Category breakdown (last 30 days)
-    category_breakdown = generate_category_breakdown(
-        db, current_user.company_id, last_30_days_start, date.today()
+    # Current month summary, last 30 days / 12 months trends and the last 30 days
+    # category breakdown are independent, so they run concurrently on their own sessions
+    company_id = current_user.company_id
+    (
+        current_month_summary, last_30_days_trend, last_12_months_trend, category_breakdown
+    ) = await asyncio.gather(
+        run_in_threadpool(_run_with_session, calculate_summary_metrics, company_id, current_month_start, current_month_end),
+        run_in_threadpool(_run_with_session, generate_trend_data, company_id, last_30_days_start, date.today(), "day"),
+        run_in_threadpool(_run_with_session, generate_trend_data, company_id, last_12_months_start, date.today(), "month"),
+        run_in_threadpool(_run_with_session, generate_category_breakdown, company_id, last_30_days_start, date.today())
     )
 
     # Active goals
-    active_goals = db.query(Goal).filter(
+    active_goals = db.query(Goal).options(raiseload('*')).filter(
         Goal.user_id == current_user.id,
         Goal.status.in_(["on_track", "at_risk"])
     ).all()
@@ -1641,7 +2230,14 @@ async def get_dashboard_data(
     ]
 
     # Recent activities
-    recent_activities = db.query(EmissionActivity).filter(
+    recent_activities = db.query(
+        EmissionActivity.id,
+        EmissionActivity.activity_date,
+        EmissionActivity.activity_name,
+        EmissionActivity.emissions_kgco2e,
+        EmissionActivity.category,
+        EmissionActivity.scope_number
+    ).filter(
         EmissionActivity.company_id == current_user.company_id
     ).order_by(EmissionActivity.activity_date.desc()).limit(10).all()
 
@@ -1657,6 +2253,12 @@ async def get_dashboard_data(
         for r in recent_activities
     ]
 
+    # Lifetime totals in one query
+    lifetime_emissions, lifetime_activities = db.query(
+        func.sum(EmissionActivity.emissions_kgco2e),
+        func.count(EmissionActivity.id)
+    ).filter(EmissionActivity.company_id == current_user.company_id).one()
+
     return {
         "current_month": {
             "total_emissions_kg": current_month_summary.total_emissions_kg,
@@ -1689,19 +2291,15 @@ async def get_dashboard_data(
         "active_goals": goals_summary,
         "recent_activities": recent_list,
         "quick_stats": {
-            "total_lifetime_emissions": db.query(func.sum(EmissionActivity.emissions_kgco2e)).filter(
-                EmissionActivity.company_id == current_user.company_id
-            ).scalar() or 0,
-            "total_activities_tracked": db.query(func.count(EmissionActivity.id)).filter(
-                EmissionActivity.company_id == current_user.company_id
-            ).scalar() or 0,
+            "total_lifetime_emissions": lifetime_emissions or 0,
+            "total_activities_tracked": lifetime_activities or 0,
             "active_goals_count": len(active_goals),
             "days_tracking": (date.today() - current_user.created_at.date()).days if current_user.created_at else 0
         }
     }
 
 
-@router.get("/comparison/{year}")
+@router.get("/comparison/{year}", response_class=ORJSONReportResponse)
 async def get_year_comparison(
         year: int,
         current_user: User = Depends(get_current_user),
@@ -1717,17 +2315,30 @@ async def get_year_comparison(
     years_to_compare = [year - 1, year, year + 1] if year < current_year else [year - 2, year - 1, year]
     years_to_compare = [y for y in years_to_compare if y <= current_year and y >= 2020]
 
-    comparison_data = []
+    # One independent summary per year, run concurrently on their own sessions
+    summaries = await asyncio.gather(*(
+        run_in_threadpool(
+            _run_with_session, calculate_summary_metrics, current_user.company_id,
+            date(y, 1, 1), date(y, 12, 31) if y < current_year else date.today()
+        )
+        for y in years_to_compare
+    ))
 
-    for y in years_to_compare:
-        start = date(y, 1, 1)
-        end = date(y, 12, 31) if y < current_year else date.today()
+    comparison_data = []
+    best, worst, total = None, None, 0
 
-        summary = calculate_summary_metrics(db, current_user.company_id, start, end)
+    # Best/worst year and the running total are tracked while building the rows
+    for y, summary in zip(years_to_compare, summaries):
+        emissions = summary.total_emissions_kg
+        if best is None or emissions < best[1]:
+            best = (y, emissions)
+        if worst is None or emissions > worst[1]:
+            worst = (y, emissions)
+        total += emissions
 
         comparison_data.append({
             "year": y,
-            "total_emissions_kg": summary.total_emissions_kg,
+            "total_emissions_kg": emissions,
             "scope1": summary.scope1_emissions,
             "scope2": summary.scope2_emissions,
             "scope3": summary.scope3_emissions,
@@ -1737,12 +2348,9 @@ async def get_year_comparison(
     return {
         "comparison": comparison_data,
         "analysis": {
-            "best_year": min(comparison_data, key=lambda x: x["total_emissions_kg"])[
-                "year"] if comparison_data else None,
-            "worst_year": max(comparison_data, key=lambda x: x["total_emissions_kg"])[
-                "year"] if comparison_data else None,
-            "average_emissions": sum(d["total_emissions_kg"] for d in comparison_data) / len(
-                comparison_data) if comparison_data else 0
+            "best_year": best[0] if best else None,
+            "worst_year": worst[0] if worst else None,
+            "average_emissions": total / len(comparison_data) if comparison_data else 0
         }
     }
 
@@ -1759,7 +2367,7 @@ async def generate_comprehensive_pdf_report(
 
     try:
         # Get company info
-        company = db.query(Company).filter(Company.id == current_user.company_id).first()
+        company, cached_rec = fetch_company_and_cached_recommendation(db, current_user.company_id)
 
         # Get company attributes with fallbacks
         company_name = getattr(company, 'name', 'Your Company') if company else "Your Company"
@@ -1778,32 +2386,21 @@ async def generate_comprehensive_pdf_report(
             website=company_website
         )
 
-        # Calculate all metrics
-        summary = calculate_summary_metrics(
-            db,
+        # Calculate all metrics (independent queries, run concurrently)
+        (
+            summary, water_data, waste_data, scope3_data, trends_obj, category_breakdown_obj
+        ) = await gather_report_metrics(
             current_user.company_id,
             config.date_range.start_date,
-            config.date_range.end_date
-        )
-
-        # Get water, waste, scope3 metrics
-        water_data = get_water_metrics(db, current_user.company_id, config.date_range.start_date,
-                                       config.date_range.end_date)
-        waste_data = get_waste_metrics(db, current_user.company_id, config.date_range.start_date,
-                                       config.date_range.end_date)
-        scope3_data = get_scope3_metrics(db, current_user.company_id, config.date_range.start_date,
-                                         config.date_range.end_date)
-
-        # Get trends
-        trends_obj = generate_trend_data(
-            db, current_user.company_id, config.date_range.start_date, config.date_range.end_date, config.group_by
+            config.date_range.end_date,
+            config.group_by
         )
         trends = [{"period": t.period, "emissions_kg": t.emissions_kg} for t in trends_obj]
 
         # Summary metrics dict
         summary_metrics = {
-            "reporting_period_start": config.date_range.start_date.strftime("%Y-%m-%d"),
-            "reporting_period_end": config.date_range.end_date.strftime("%Y-%m-%d"),
+            "reporting_period_start": config.date_range.start_date.isoformat(),
+            "reporting_period_end": config.date_range.end_date.isoformat(),
             "total_emissions_kg": summary.total_emissions_kg,
             "total_emissions_tons": summary.total_emissions_tons,
             "scope1_emissions": summary.scope1_emissions,
@@ -1825,34 +2422,13 @@ async def generate_comprehensive_pdf_report(
             "total_emissions_kg": summary.total_emissions_kg
         }
 
-        # Fetch AI Recommendations from database
-        ensure_ai_recommendation_schema()
+        # AI Recommendations (fetched together with the company above)
         ai_recommendations = []
-        try:
-            cached_rec = db.query(AIRecommendation).filter(
-                AIRecommendation.company_id == current_user.company_id,
-                AIRecommendation.is_active == True
-            ).order_by(AIRecommendation.generated_at.desc()).first()
-            
-            if cached_rec:
-                # Check if expired (if method exists)
-                try:
-                    if hasattr(cached_rec, 'is_expired') and cached_rec.is_expired():
-                        pass  # Skip expired recommendations
-                    else:
-                        recs_json = cached_rec.recommendations_json
-                        if recs_json:
-                            if isinstance(recs_json, list):
-                                ai_recommendations = recs_json[:6]  # Get up to 6 recommendations
-                            elif isinstance(recs_json, dict) and 'recommendations' in recs_json:
-                                # Handle case where recommendations_json is a dict with 'recommendations' key
-                                ai_recommendations = recs_json.get('recommendations', [])[:6]
-                except Exception as rec_error:
-                    print(f"⚠️ Error processing cached recommendations: {rec_error}")
-        except Exception as e:
-            print(f"⚠️ Error fetching AI recommendations: {e}")
-            import traceback
-            print(traceback.format_exc())
+        if cached_rec:
+            try:
+                ai_recommendations = cached_recommendation_list(cached_rec)[:6]  # Get up to 6 recommendations
+            except Exception as rec_error:
+                print(f"⚠️ Error processing cached recommendations: {rec_error}")
         
         # If no AI recommendations, return empty list (no fallback data)
         # The PDF will show "No recommendations available" if empty
@@ -1860,7 +2436,7 @@ async def generate_comprehensive_pdf_report(
         # Fetch Goals from database
         goals = []
         try:
-            goals_query = db.query(Goal).filter(
+            goals_query = db.query(Goal).options(raiseload('*')).filter(
                 Goal.user_id == current_user.id
             ).all()
             goals = [
@@ -1881,10 +2457,15 @@ async def generate_comprehensive_pdf_report(
         # Get top activities
         top_activities = []
         try:
-            activities_query = db.query(EmissionActivity).filter(
+            activities_query = db.query(
+                EmissionActivity.activity_name,
+                EmissionActivity.activity_type,
+                EmissionActivity.emissions_kgco2e,
+                EmissionActivity.scope_number,
+                EmissionActivity.activity_date
+            ).filter(
                 EmissionActivity.company_id == current_user.company_id,
-                EmissionActivity.activity_date >= config.date_range.start_date,
-                EmissionActivity.activity_date <= config.date_range.end_date
+                activity_date_in_range(config.date_range.start_date, config.date_range.end_date)
             ).order_by(EmissionActivity.emissions_kgco2e.desc()).limit(10).all()
             
             top_activities = [
@@ -1892,8 +2473,8 @@ async def generate_comprehensive_pdf_report(
                     "activity_name": a.activity_name or a.activity_type or "Unnamed Activity",
                     "activity_type": a.activity_type or "N/A",
                     "emissions_kg": round(a.emissions_kgco2e, 2),
-                    "scope": f"Scope {a.scope_number}",
-                    "date": a.activity_date.strftime("%Y-%m-%d") if a.activity_date else "N/A"
+                    "scope": scope_label(a.scope_number),
+                    "date": a.activity_date.date().isoformat() if a.activity_date else "N/A"
                 }
                 for a in activities_query
             ]
@@ -1901,9 +2482,6 @@ async def generate_comprehensive_pdf_report(
             print(f"⚠️ Error fetching activities: {e}")
 
         # Get category breakdown
-        category_breakdown_obj = generate_category_breakdown(
-            db, current_user.company_id, config.date_range.start_date, config.date_range.end_date
-        )
         category_breakdown = [
             {
                 "category": c.category,
@@ -1942,17 +2520,15 @@ async def generate_comprehensive_pdf_report(
             generated_at=datetime.now()
         )
 
-        # Generate PDF
-        pdf_buffer = generate_pdf_report(report_data)
+        # Generate PDF (ReportLab writes the file at the end of build, so the
+        # finished document is spooled and streamed back in chunks). The build is
+        # CPU-bound, so it runs in the threadpool instead of on the event loop.
+        pdf_buffer = await run_in_threadpool(generate_pdf_report, report_data)
 
-        filename = f"sustainability_report_{company_profile.company_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf"
+        filename = f"sustainability_report_{company_profile.company_name.replace(' ', '_')}_{report_date_tag()}.pdf"
 
-        # Reset buffer position to start
-        pdf_buffer.seek(0)
-        
-        # Return the buffer content as bytes
-        return Response(
-            content=pdf_buffer.getvalue(),
+        return StreamingResponse(
+            iter_report_chunks(pdf_buffer),
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -1965,414 +2541,255 @@ async def generate_comprehensive_pdf_report(
         raise HTTPException(status_code=500, detail=f"Error generating PDF report: {str(e)}")
 
 
-@router.post("/generate-comprehensive-excel")
-async def generate_comprehensive_excel_report(
+def build_comprehensive_workbook(
         config: ReportConfig,
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        current_user: User,
+        company,
+        summary: SummaryMetrics,
+        water_data: Dict[str, Any],
+        waste_data: Dict[str, Any],
+        trends_obj: List[TrendData],
+        category_rows: List[list],
+        activities_query,
+        ai_recommendations: List[Any],
+        goals: List[tuple]
 ):
-    """Generate comprehensive Excel report with all metrics"""
+    """
+    Write the comprehensive Excel workbook from prefetched data and return the
+    finished buffer. Plain sync code, so the endpoint runs it in the threadpool.
+    """
+    # Create Excel file. constant_memory flushes each row as it is written,
+    # so memory stays flat for large activity lists.
+    output = new_report_buffer()
+    workbook = new_excel_workbook(output)
+
+    header_format = workbook.add_format({
+        'bold': True,
+        'font_color': '#FFFFFF',
+        'bg_color': '#366092',
+        'align': 'center',
+        'valign': 'vcenter'
+    })
+
+    def add_sheet(title, headers, rows):
+        return write_excel_sheet(workbook, title, headers, rows, header_format)
+
+    # Summary sheet
+    summary_rows = [
+        ['Reporting Period Start', config.date_range.start_date.isoformat()],
+        ['Reporting Period End', config.date_range.end_date.isoformat()],
+        ['Total Emissions (kg CO2e)', summary.total_emissions_kg],
+        ['Total Emissions (tons CO2e)', summary.total_emissions_tons],
+        ['Scope 1 Emissions', summary.scope1_emissions],
+        ['Scope 2 Emissions', summary.scope2_emissions],
+        ['Scope 3 Emissions', summary.scope3_emissions],
+        ['Total Water Usage (m³)', water_data.get('total_usage', 0)],
+        ['Total Waste (kg)', waste_data.get('total_waste', 0)],
+        ['Recycled Waste (kg)', waste_data.get('recycled', 0)],
+        ['Recycling Rate (%)', waste_data.get('recycling_rate', 0)],
+        ['Total Activities Tracked', summary.total_activities]
+    ]
+    summary_sheet = add_sheet('Summary', ['Metric', 'Value'], summary_rows)
 
-    try:
-        # Get company info
-        company = db.query(Company).filter(Company.id == current_user.company_id).first()
+    # Emissions breakdown
+    emissions_sheet = add_sheet(
+        'Emissions Breakdown',
+        ['Scope', 'Emissions (kg CO2e)', 'Emissions (tons CO2e)', 'Percentage (%)'],
+        scope_breakdown_rows(summary)
+    )
 
-        # Calculate all metrics
-        summary = calculate_summary_metrics(
-            db,
-            current_user.company_id,
-            config.date_range.start_date,
-            config.date_range.end_date
+    # Water usage
+    water_rows = [
+        ['Municipal Water', water_data.get('municipal_water', 0)],
+        ['Groundwater', water_data.get('groundwater', 0)],
+        ['Rainwater', water_data.get('rainwater', 0)],
+        ['TOTAL', water_data.get('total_usage', 0)]
+    ]
+    add_sheet('Water Usage', ['Source', 'Usage (m³)'], water_rows)
+
+    # Waste management
+    waste_rows = [
+        ['Recycled', waste_data.get('recycled', 0)],
+        ['Landfill', waste_data.get('landfill', 0)],
+        ['Incinerated', waste_data.get('incinerated', 0)],
+        ['TOTAL', waste_data.get('total_waste', 0)]
+    ]
+    add_sheet('Waste Management', ['Disposal Method', 'Weight (kg)'], waste_rows)
+
+    # Trends
+    trends_data = [[t.period, t.emissions_kg, t.activities_count] for t in trends_obj]
+    trends_sheet = None
+    if trends_data:
+        trends_sheet = add_sheet('Trends', ['Period', 'Emissions (kg CO2e)', 'Activities'], trends_data)
+
+    # ALL Activities - Detailed Sheet (headers are kept even when empty; very
+    # large tenants continue on "All Activities 2"... past Excel's row limit)
+    write_excel_sheets(workbook, 'All Activities', [
+        'activity_name', 'activity_type', 'description', 'quantity', 'unit',
+        'emissions_kg', 'emissions_tons', 'scope', 'scope_number', 'category',
+        'subcategory', 'location', 'activity_date', 'reporting_period',
+        'source_document', 'created_at'
+    ], iter_activity_export_rows(activities_query), header_format)
+
+    # Category Breakdown Sheet
+    category_sheet = add_sheet('Category Breakdown', CATEGORY_SHEET_HEADER, category_rows)
+
+    # AI Recommendations Sheet (skipped when there are none, like the CSV section)
+    if ai_recommendations:
+        recommendations_data = [
+            (title, priority, savings_kg, round(savings_kg / 1000, 2), description)
+            for title, priority, savings_kg, description in map(recommendation_export_row, ai_recommendations)
+        ]
+        add_sheet(
+            'AI Recommendations',
+            ['Title', 'Priority', 'Estimated Savings (kg CO2e)', 'Estimated Savings (tons CO2e)', 'Description'],
+            recommendations_data
         )
 
-        water_data = get_water_metrics(db, current_user.company_id, config.date_range.start_date,
-                                       config.date_range.end_date)
-        waste_data = get_waste_metrics(db, current_user.company_id, config.date_range.start_date,
-                                       config.date_range.end_date)
-        scope3_data = get_scope3_metrics(db, current_user.company_id, config.date_range.start_date,
-                                         config.date_range.end_date)
+    # Goals Sheet
+    if goals:
+        add_sheet('Goals & Targets', GOAL_EXPORT_HEADER, goals)
 
-        trends_obj = generate_trend_data(
-            db, current_user.company_id, config.date_range.start_date, config.date_range.end_date, config.group_by
-        )
+    # Company info
+    company_rows = [
+        ['Company Name', getattr(company, 'name', 'Your Company') if company else "Your Company"],
+        ['Reporting Officer', getattr(current_user, 'full_name', current_user.email)],
+        ['Email', current_user.email],
+        ['Report Generated', datetime.now().isoformat(' ', 'seconds')]
+    ]
+    add_sheet('Company Info', ['Field', 'Value'], company_rows)
 
-        # Get ALL activities (not just top 10)
-        all_activities = []
-        try:
-            activities_query = db.query(EmissionActivity).filter(
-                EmissionActivity.company_id == current_user.company_id,
-                EmissionActivity.activity_date >= config.date_range.start_date,
-                EmissionActivity.activity_date <= config.date_range.end_date
-            ).order_by(EmissionActivity.activity_date.desc(), EmissionActivity.emissions_kgco2e.desc()).all()
-            
-            all_activities = [
-                {
-                    "activity_name": a.activity_name or a.activity_type or "Unnamed Activity",
-                    "activity_type": a.activity_type or "N/A",
-                    "description": a.description or "",
-                    "quantity": a.quantity or 0,
-                    "unit": a.unit or "N/A",
-                    "emissions_kg": round(a.emissions_kgco2e, 2),
-                    "emissions_tons": round(a.emissions_kgco2e / 1000, 3),
-                    "scope": f"Scope {a.scope_number}",
-                    "scope_number": a.scope_number or 0,
-                    "category": a.category or "Uncategorized",
-                    "subcategory": a.subcategory or "",
-                    "location": a.location or "N/A",
-                    "activity_date": a.activity_date.strftime("%Y-%m-%d") if a.activity_date else "N/A",
-                    "reporting_period": a.reporting_period or "N/A",
-                    "source_document": a.source_document or "",
-                    "created_at": a.created_at.strftime("%Y-%m-%d %H:%M:%S") if a.created_at else "N/A"
-                }
-                for a in activities_query
-            ]
-        except Exception as e:
-            print(f"⚠️ Error fetching all activities: {e}")
-            import traceback
-            print(traceback.format_exc())
+    # Add charts to appropriate sheets (charts are written out on close)
+    try:
+        # Chart 1: Emissions by Scope (Pie Chart) - Add to Summary sheet
+        # Data for pie chart (from Emissions Breakdown sheet, skip header row)
+        pie_chart = workbook.add_chart({'type': 'pie'})
+        pie_chart.add_series({
+            'categories': ['Emissions Breakdown', 1, 0, 3, 0],
+            'values': ['Emissions Breakdown', 1, 1, 3, 1],
+            'data_labels': {'percentage': True}
+        })
+        pie_chart.set_title({'name': 'Emissions by Scope'})
+        pie_chart.set_size({'width': 378, 'height': 265})
+        summary_sheet.insert_chart('D2', pie_chart)
+
+        # Chart 2: Emissions Trend (Line Chart) - Add to Trends sheet if data exists
+        if trends_sheet is not None:
+            line_chart = workbook.add_chart({'type': 'line'})
+            line_chart.add_series({
+                'categories': ['Trends', 1, 0, len(trends_data), 0],
+                'values': ['Trends', 1, 1, len(trends_data), 1]
+            })
+            line_chart.set_title({'name': 'Emissions Trend Over Time'})
+            line_chart.set_style(10)
+            line_chart.set_y_axis({'name': 'Emissions (kg CO2e)'})
+            line_chart.set_x_axis({'name': 'Period'})
+            line_chart.set_legend({'none': True})
+            line_chart.set_size({'width': 567, 'height': 265})
+            trends_sheet.insert_chart('E2', line_chart)
+
+        # Chart 3: Category Breakdown (Bar Chart) - Add to Category Breakdown sheet
+        if category_rows:
+            last_row = min(len(category_rows), 19)
+            bar_chart = workbook.add_chart({'type': 'column'})
+            bar_chart.add_series({
+                'categories': ['Category Breakdown', 1, 0, last_row, 0],
+                'values': ['Category Breakdown', 1, 2, last_row, 2]
+            })
+            bar_chart.set_title({'name': 'Emissions by Category'})
+            bar_chart.set_style(10)
+            bar_chart.set_y_axis({'name': 'Emissions (tons CO2e)'})
+            bar_chart.set_x_axis({'name': 'Category'})
+            bar_chart.set_legend({'none': True})
+            bar_chart.set_size({'width': 567, 'height': 265})
+            category_sheet.insert_chart('F2', bar_chart)
+
+        # Chart 4: Scope Breakdown (Bar Chart) - Add to Emissions Breakdown sheet
+        scope_bar = workbook.add_chart({'type': 'column'})
+        scope_bar.add_series({
+            'categories': ['Emissions Breakdown', 1, 0, 3, 0],
+            'values': ['Emissions Breakdown', 1, 1, 3, 1]
+        })
+        scope_bar.set_title({'name': 'Emissions by Scope'})
+        scope_bar.set_style(10)
+        scope_bar.set_y_axis({'name': 'Emissions (kg CO2e)'})
+        scope_bar.set_x_axis({'name': 'Scope'})
+        scope_bar.set_legend({'none': True})
+        scope_bar.set_size({'width': 378, 'height': 265})
+        emissions_sheet.insert_chart('E2', scope_bar)
+
+    except Exception as chart_error:
+        print(f"⚠️ Error adding charts to Excel: {chart_error}")
+        import traceback
+        print(traceback.format_exc())
 
-        # Get category breakdown
-        category_breakdown_obj = generate_category_breakdown(
-            db, current_user.company_id, config.date_range.start_date, config.date_range.end_date
-        )
-        category_breakdown = [
-            {
-                "category": c.category,
-                "emissions_kg": c.emissions_kg,
-                "emissions_tons": c.emissions_kg / 1000,
-                "emissions_percent": c.emissions_percent,
-                "activities_count": c.activities_count
-            }
-            for c in category_breakdown_obj
-        ]
+    workbook.close()
 
-        # Fetch AI Recommendations
-        ensure_ai_recommendation_schema()
-        ai_recommendations = []
-        try:
-            cached_rec = db.query(AIRecommendation).filter(
-                AIRecommendation.company_id == current_user.company_id,
-                AIRecommendation.is_active == True
-            ).order_by(AIRecommendation.generated_at.desc()).first()
-            
-            if cached_rec:
-                try:
-                    if hasattr(cached_rec, 'is_expired') and cached_rec.is_expired():
-                        pass
-                    else:
-                        recs_json = cached_rec.recommendations_json
-                        if recs_json:
-                            if isinstance(recs_json, list):
-                                ai_recommendations = recs_json
-                            elif isinstance(recs_json, dict) and 'recommendations' in recs_json:
-                                ai_recommendations = recs_json.get('recommendations', [])
-                except Exception as rec_error:
-                    print(f"⚠️ Error processing cached recommendations: {rec_error}")
-        except Exception as e:
-            print(f"⚠️ Error fetching AI recommendations: {e}")
+    return output
 
-        # Fetch Goals
-        goals = []
+
+async def build_comprehensive_excel(config: ReportConfig, current_user: User, db: Session):
+    """Fetch everything the comprehensive Excel report needs and return the finished workbook buffer"""
+
+    # Get company info
+    company, cached_rec = fetch_company_and_cached_recommendation(db, current_user.company_id)
+
+    # Calculate all metrics (independent queries, run concurrently)
+    (
+        summary, water_data, waste_data, scope3_data, trends_obj, category_breakdown_obj
+    ) = await gather_report_metrics(
+        current_user.company_id,
+        config.date_range.start_date,
+        config.date_range.end_date,
+        config.group_by
+    )
+
+    # ALL activities (not just top 10); rows are streamed into the sheet below
+    activities_query = db.query(*ACTIVITY_EXPORT_COLUMNS).filter(
+        EmissionActivity.company_id == current_user.company_id,
+        activity_date_in_range(config.date_range.start_date, config.date_range.end_date)
+    ).order_by(EmissionActivity.activity_date.desc(), EmissionActivity.emissions_kgco2e.desc())
+
+    # Category breakdown rows
+    category_rows = category_breakdown_rows(category_breakdown_obj)
+
+    # AI Recommendations (fetched together with the company above)
+    ai_recommendations = []
+    if cached_rec:
         try:
-            goals_query = db.query(Goal).filter(
-                Goal.user_id == current_user.id
-            ).all()
-            goals = [
-                {
-                    "title": g.title,
-                    "target_emissions": g.target_emissions,
-                    "current_emissions": g.current_emissions or 0,
-                    "target_year": g.target_year,
-                    "status": g.status.replace("_", " ").title() if g.status else "On Track"
-                }
-                for g in goals_query
-            ]
-        except Exception as e:
-            print(f"⚠️ Error fetching goals: {e}")
+            ai_recommendations = cached_recommendation_list(cached_rec)
+        except Exception as rec_error:
+            print(f"⚠️ Error processing cached recommendations: {rec_error}")
 
-        # Create Excel file in memory
-        output = io.BytesIO()
-
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-
-            # Summary sheet
-            summary_data = {
-                'Metric': [
-                    'Reporting Period Start',
-                    'Reporting Period End',
-                    'Total Emissions (kg CO2e)',
-                    'Total Emissions (tons CO2e)',
-                    'Scope 1 Emissions',
-                    'Scope 2 Emissions',
-                    'Scope 3 Emissions',
-                    'Total Water Usage (m³)',
-                    'Total Waste (kg)',
-                    'Recycled Waste (kg)',
-                    'Recycling Rate (%)',
-                    'Total Activities Tracked'
-                ],
-                'Value': [
-                    config.date_range.start_date.strftime("%Y-%m-%d"),
-                    config.date_range.end_date.strftime("%Y-%m-%d"),
-                    summary.total_emissions_kg,
-                    summary.total_emissions_tons,
-                    summary.scope1_emissions,
-                    summary.scope2_emissions,
-                    summary.scope3_emissions,
-                    water_data.get('total_usage', 0),
-                    waste_data.get('total_waste', 0),
-                    waste_data.get('recycled', 0),
-                    waste_data.get('recycling_rate', 0),
-                    summary.total_activities
-                ]
-            }
-            pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
-
-            # Emissions breakdown
-            total_kg = summary.total_emissions_kg if summary.total_emissions_kg > 0 else 1
-            emissions_breakdown = {
-                'Scope': ['Scope 1', 'Scope 2', 'Scope 3', 'TOTAL'],
-                'Emissions (kg CO2e)': [
-                    summary.scope1_emissions,
-                    summary.scope2_emissions,
-                    summary.scope3_emissions,
-                    summary.total_emissions_kg
-                ],
-                'Emissions (tons CO2e)': [
-                    summary.scope1_emissions / 1000,
-                    summary.scope2_emissions / 1000,
-                    summary.scope3_emissions / 1000,
-                    summary.total_emissions_tons
-                ],
-                'Percentage (%)': [
-                    round(summary.scope1_emissions / total_kg * 100, 1),
-                    round(summary.scope2_emissions / total_kg * 100, 1),
-                    round(summary.scope3_emissions / total_kg * 100, 1),
-                    100.0
-                ]
-            }
-            pd.DataFrame(emissions_breakdown).to_excel(writer, sheet_name='Emissions Breakdown', index=False)
-
-            # Water usage
-            water_usage = {
-                'Source': ['Municipal Water', 'Groundwater', 'Rainwater', 'TOTAL'],
-                'Usage (m³)': [
-                    water_data.get('municipal_water', 0),
-                    water_data.get('groundwater', 0),
-                    water_data.get('rainwater', 0),
-                    water_data.get('total_usage', 0)
-                ]
-            }
-            pd.DataFrame(water_usage).to_excel(writer, sheet_name='Water Usage', index=False)
-
-            # Waste management
-            waste_management = {
-                'Disposal Method': ['Recycled', 'Landfill', 'Incinerated', 'TOTAL'],
-                'Weight (kg)': [
-                    waste_data.get('recycled', 0),
-                    waste_data.get('landfill', 0),
-                    waste_data.get('incinerated', 0),
-                    waste_data.get('total_waste', 0)
-                ]
-            }
-            pd.DataFrame(waste_management).to_excel(writer, sheet_name='Waste Management', index=False)
-
-            # Trends
-            trends_data = [{
-                'Period': t.period,
-                'Emissions (kg CO2e)': t.emissions_kg,
-                'Activities': t.activities_count
-            } for t in trends_obj]
-            if trends_data:
-                pd.DataFrame(trends_data).to_excel(writer, sheet_name='Trends', index=False)
-
-            # ALL Activities - Detailed Sheet
-            if all_activities:
-                activities_df = pd.DataFrame(all_activities)
-                activities_df.to_excel(writer, sheet_name='All Activities', index=False)
-            else:
-                # Create empty sheet with headers
-                empty_activities = pd.DataFrame(columns=[
-                    'activity_name', 'activity_type', 'description', 'quantity', 'unit',
-                    'emissions_kg', 'emissions_tons', 'scope', 'scope_number', 'category',
-                    'subcategory', 'location', 'activity_date', 'reporting_period',
-                    'source_document', 'created_at'
-                ])
-                empty_activities.to_excel(writer, sheet_name='All Activities', index=False)
-
-            # Category Breakdown Sheet
-            if category_breakdown:
-                category_df = pd.DataFrame(category_breakdown)
-                category_df.to_excel(writer, sheet_name='Category Breakdown', index=False)
-            else:
-                empty_category = pd.DataFrame(columns=['category', 'emissions_kg', 'emissions_tons', 'emissions_percent', 'activities_count'])
-                empty_category.to_excel(writer, sheet_name='Category Breakdown', index=False)
-
-            # AI Recommendations Sheet
-            if ai_recommendations:
-                recommendations_data = []
-                for rec in ai_recommendations:
-                    if isinstance(rec, dict):
-                        recommendations_data.append({
-                            'Title': rec.get('title', 'N/A'),
-                            'Priority': rec.get('priority', 'Medium'),
-                            'Estimated Savings (kg CO2e)': rec.get('estimated_savings_kg', 0),
-                            'Estimated Savings (tons CO2e)': round(rec.get('estimated_savings_kg', 0) / 1000, 2),
-                            'Description': rec.get('description', rec.get('detailed_analysis', 'N/A'))
-                        })
-                    else:
-                        recommendations_data.append({
-                            'Title': str(rec),
-                            'Priority': 'Medium',
-                            'Estimated Savings (kg CO2e)': 0,
-                            'Estimated Savings (tons CO2e)': 0,
-                            'Description': str(rec)
-                        })
-                rec_df = pd.DataFrame(recommendations_data)
-                rec_df.to_excel(writer, sheet_name='AI Recommendations', index=False)
-            else:
-                empty_rec = pd.DataFrame(columns=['Title', 'Priority', 'Estimated Savings (kg CO2e)', 'Estimated Savings (tons CO2e)', 'Description'])
-                empty_rec.to_excel(writer, sheet_name='AI Recommendations', index=False)
+    # Fetch Goals
+    goals = []
+    try:
+        goals = fetch_goal_export_rows(db, current_user.id)
+    except Exception as e:
+        print(f"⚠️ Error fetching goals: {e}")
 
-            # Goals Sheet
-            if goals:
-                goals_df = pd.DataFrame(goals)
-                goals_df.to_excel(writer, sheet_name='Goals & Targets', index=False)
-            else:
-                empty_goals = pd.DataFrame(columns=['title', 'target_emissions', 'current_emissions', 'target_year', 'status'])
-                empty_goals.to_excel(writer, sheet_name='Goals & Targets', index=False)
-
-            # Company info
-            company_info = {
-                'Field': ['Company Name', 'Reporting Officer', 'Email', 'Report Generated'],
-                'Value': [
-                    getattr(company, 'name', 'Your Company') if company else "Your Company",
-                    getattr(current_user, 'full_name', current_user.email),
-                    current_user.email,
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                ]
-            }
-            pd.DataFrame(company_info).to_excel(writer, sheet_name='Company Info', index=False)
+    # Writing the workbook is CPU-bound, keep it off the event loop
+    return await run_in_threadpool(
+        build_comprehensive_workbook, config, current_user, company, summary, water_data, waste_data,
+        trends_obj, category_rows, activities_query, ai_recommendations, goals
+    )
 
-            # Get the workbook to add charts
-            workbook = writer.book
 
-            # Add charts to appropriate sheets
-            try:
-                # Chart 1: Emissions by Scope (Pie Chart) - Add to Summary sheet
-                summary_sheet = workbook['Summary']
-                
-                # Create pie chart for emissions breakdown
-                pie_chart = PieChart()
-                pie_chart.title = "Emissions by Scope"
-                pie_chart.dataLabels = DataLabelList()
-                pie_chart.dataLabels.showPercent = True
-                
-                # Data for pie chart (from Emissions Breakdown sheet)
-                emissions_sheet = workbook['Emissions Breakdown']
-                # Reference to emissions values (skip header row)
-                data = Reference(emissions_sheet, min_col=2, min_row=2, max_row=4)
-                labels = Reference(emissions_sheet, min_col=1, min_row=2, max_row=4)
-                pie_chart.add_data(data, titles_from_data=False)
-                pie_chart.set_categories(labels)
-                pie_chart.width = 10
-                pie_chart.height = 7
-                summary_sheet.add_chart(pie_chart, "D2")
-
-                # Chart 2: Emissions Trend (Line Chart) - Add to Trends sheet if data exists
-                if trends_data:
-                    trends_sheet = workbook['Trends']
-                    line_chart = LineChart()
-                    line_chart.title = "Emissions Trend Over Time"
-                    line_chart.style = 10
-                    line_chart.y_axis.title = 'Emissions (kg CO2e)'
-                    line_chart.x_axis.title = 'Period'
-                    
-                    data = Reference(trends_sheet, min_col=2, min_row=2, max_row=len(trends_data) + 1)
-                    categories = Reference(trends_sheet, min_col=1, min_row=2, max_row=len(trends_data) + 1)
-                    line_chart.add_data(data, titles_from_data=False)
-                    line_chart.set_categories(categories)
-                    line_chart.width = 15
-                    line_chart.height = 7
-                    trends_sheet.add_chart(line_chart, "E2")
-
-                # Chart 3: Category Breakdown (Bar Chart) - Add to Category Breakdown sheet
-                if category_breakdown:
-                    category_sheet = workbook['Category Breakdown']
-                    bar_chart = BarChart()
-                    bar_chart.type = "col"
-                    bar_chart.style = 10
-                    bar_chart.title = "Emissions by Category"
-                    bar_chart.y_axis.title = 'Emissions (tons CO2e)'
-                    bar_chart.x_axis.title = 'Category'
-                    
-                    data = Reference(category_sheet, min_col=3, min_row=2, max_row=min(len(category_breakdown) + 1, 20))
-                    categories = Reference(category_sheet, min_col=1, min_row=2, max_row=min(len(category_breakdown) + 1, 20))
-                    bar_chart.add_data(data, titles_from_data=False)
-                    bar_chart.set_categories(categories)
-                    bar_chart.width = 15
-                    bar_chart.height = 7
-                    category_sheet.add_chart(bar_chart, "F2")
-
-                # Chart 4: Scope Breakdown (Bar Chart) - Add to Emissions Breakdown sheet
-                scope_bar = BarChart()
-                scope_bar.type = "col"
-                scope_bar.style = 10
-                scope_bar.title = "Emissions by Scope"
-                scope_bar.y_axis.title = 'Emissions (kg CO2e)'
-                scope_bar.x_axis.title = 'Scope'
-                
-                data = Reference(emissions_sheet, min_col=2, min_row=2, max_row=4)
-                categories = Reference(emissions_sheet, min_col=1, min_row=2, max_row=4)
-                scope_bar.add_data(data, titles_from_data=False)
-                scope_bar.set_categories(categories)
-                scope_bar.width = 10
-                scope_bar.height = 7
-                emissions_sheet.add_chart(scope_bar, "E2")
-
-            except Exception as chart_error:
-                print(f"⚠️ Error adding charts to Excel: {chart_error}")
-                import traceback
-                print(traceback.format_exc())
-
-            # Style the sheets
-            try:
-                from openpyxl.styles import Font, PatternFill, Alignment
-                
-                # Style header rows
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                header_font = Font(bold=True, color="FFFFFF")
-                
-                for sheet_name in workbook.sheetnames:
-                    sheet = workbook[sheet_name]
-                    if sheet.max_row > 0:
-                        # Style header row
-                        for cell in sheet[1]:
-                            cell.fill = header_fill
-                            cell.font = header_font
-                            cell.alignment = Alignment(horizontal="center", vertical="center")
-                        
-                        # Auto-adjust column widths
-                        for column in sheet.columns:
-                            max_length = 0
-                            column_letter = get_column_letter(column[0].column)
-                            for cell in column:
-                                try:
-                                    if len(str(cell.value)) > max_length:
-                                        max_length = len(str(cell.value))
-                                except:
-                                    pass
-                            adjusted_width = min(max_length + 2, 50)
-                            sheet.column_dimensions[column_letter].width = adjusted_width
-            except Exception as style_error:
-                print(f"⚠️ Error styling Excel sheets: {style_error}")
-
-        output.seek(0)
-
-        filename = f"sustainability_report_{datetime.now().strftime('%Y%m%d')}.xlsx"
+@router.post("/generate-comprehensive-excel")
+async def generate_comprehensive_excel_report(
+        config: ReportConfig,
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    """Generate comprehensive Excel report with all metrics"""
+
+    try:
+        output = await build_comprehensive_excel(config, current_user, db)
+
+        filename = f"sustainability_report_{report_date_tag()}.xlsx"
 
         return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+            iter_report_chunks(output),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -2381,12 +2798,106 @@ async def generate_comprehensive_excel_report(
         raise HTTPException(status_code=500, detail=f"Error generating Excel report: {str(e)}")
 
 
+# ==================== BACKGROUND EXCEL EXPORTS ====================
+
+# Large workbooks can be built after the request returns: the client gets a
+# task id, polls /exports/{task_id} and downloads the file once it is ready.
+# Jobs live in this process only and are dropped after EXPORT_JOB_TTL seconds.
+EXPORT_JOB_TTL = 3600
+_export_jobs = TTLCache(maxsize=256, ttl=EXPORT_JOB_TTL)
+_export_jobs_lock = threading.Lock()
+
+
+def _update_export_job(task_id: str, **fields):
+    with _export_jobs_lock:
+        job = _export_jobs.get(task_id)
+        if job is not None:
+            job.update(fields)
+
+
+async def run_excel_export_job(task_id: str, config: ReportConfig, user_id: int):
+    """Build a comprehensive Excel report for a queued export (own session, the request's is closed)"""
+    db = SessionLocal()
+    try:
+        user = db.query(User).options(raiseload('*')).filter(User.id == user_id).first()
+        output = await build_comprehensive_excel(config, user, db)
+        _update_export_job(task_id, status="completed", buffer=output)
+        logger.info("Excel export %s ready", task_id)
+    except Exception as e:
+        logger.exception("Excel export %s failed", task_id)
+        _update_export_job(task_id, status="failed", error=str(e))
+    finally:
+        db.close()
+
+
+def _get_export_job(task_id: str, current_user: User) -> Dict[str, Any]:
+    with _export_jobs_lock:
+        job = _export_jobs.get(task_id)
+    if job is None or job["user_id"] != current_user.id:
+        raise HTTPException(status_code=404, detail="Export not found or expired")
+    return job
+
+
+@router.post("/generate-comprehensive-excel/async")
+async def queue_comprehensive_excel_report(
+        config: ReportConfig,
+        background_tasks: BackgroundTasks,
+        current_user: User = Depends(get_current_user)
+):
+    """Queue the comprehensive Excel report and return a task id to poll"""
+    task_id = uuid.uuid4().hex
+    with _export_jobs_lock:
+        _export_jobs[task_id] = {
+            "status": "pending",
+            "user_id": current_user.id,
+            "filename": f"sustainability_report_{report_date_tag()}.xlsx",
+            "buffer": None,
+            "error": None
+        }
+    background_tasks.add_task(run_excel_export_job, task_id, config, current_user.id)
+
+    return {
+        "task_id": task_id,
+        "status": "pending",
+        "status_url": f"{router.prefix}/exports/{task_id}"
+    }
+
+
+@router.get("/exports/{task_id}")
+async def get_export_status(task_id: str, current_user: User = Depends(get_current_user)):
+    """Status of a queued export; download_url is set once it has completed"""
+    job = _get_export_job(task_id, current_user)
+    return {
+        "task_id": task_id,
+        "status": job["status"],
+        "error": job["error"],
+        "download_url": f"{router.prefix}/exports/{task_id}/download" if job["status"] == "completed" else None
+    }
+
+
+@router.get("/exports/{task_id}/download")
+async def download_export(task_id: str, current_user: User = Depends(get_current_user)):
+    """Stream a completed export (one download; the job is removed afterwards)"""
+    job = _get_export_job(task_id, current_user)
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Export is {job['status']}")
+
+    with _export_jobs_lock:
+        _export_jobs.pop(task_id, None)
+
+    return StreamingResponse(
+        iter_report_chunks(job["buffer"]),
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"Content-Disposition": f"attachment; filename={job['filename']}"}
+    )
+
+
 @router.get("/test-csv-endpoint")
 async def test_csv_endpoint():
     """Test endpoint to verify CSV route is registered"""
     return {"message": "CSV endpoint is accessible", "status": "ok"}
 
-@router.get("/company-profile")
+@router.get("/company-profile", response_model=CompanyProfile)
 async def get_company_profile(
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
@@ -2394,7 +2905,7 @@ async def get_company_profile(
     """Get company profile"""
 
     try:
-        company = db.query(Company).filter(Company.id == current_user.company_id).first()
+        company = load_company_profile_fields(db, current_user.company_id)
 
         if not company:
             # Return default profile if company not found
@@ -2410,13 +2921,13 @@ async def get_company_profile(
             return profile
 
         profile = CompanyProfile(
-            company_name=getattr(company, 'name', 'Your Company'),
-            address=getattr(company, 'address', 'Address not set'),
-            industry=getattr(company, 'industry', 'Industry not set'),
+            company_name=company['name'],
+            address=company['address'],
+            industry=company['industry'],
             reporting_officer=getattr(current_user, 'full_name', current_user.email),
             email=current_user.email,
-            phone=getattr(company, 'phone', 'N/A'),
-            website=getattr(company, 'website', None)
+            phone=company['phone'],
+            website=company['website']
         )
 
         return profile
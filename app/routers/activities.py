@@ -8,80 +8,172 @@ WITH authentication and company data isolation
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, case, func, String
+from sqlalchemy import or_, and_, func, String, DateTime
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+import base64
+import binascii
+import logging
+import numpy as np
+import orjson
 
 from app.database import get_db
-from app.models import EmissionActivity, Company, User
+from app.models import (
+    EmissionActivity, User, EMISSION_ACTIVITY_DICT_COLUMNS, emission_activity_row_to_dict,
+    EMISSION_ACTIVITY_EFFECTIVE_DATE, bulk_insert_activities
+)
 from app.calculators.unified_emission_engine import get_engine
 from app.ai.scope_classifier import classify_scope_and_category
 from app.routers.auth import get_current_user, get_current_admin_user
+from app.services.company_profile import load_company_profile_fields
 
 router = APIRouter(
     prefix="/api/companies/{company_id}/activities",
     tags=["Activity Management"]
 )
 
+logger = logging.getLogger(__name__)
+
+# Emission calculation and scope classification are independent and both may
+# wait on the OpenAI API, so classifications run on this pool while the request
+# thread calculates.
+CLASSIFICATION_WORKERS = 16
+_classification_executor = ThreadPoolExecutor(
+    max_workers=CLASSIFICATION_WORKERS, thread_name_prefix="activity-classify"
+)
+
+# Bulk requests classify on their own, smaller pool so a 100-row upload cannot
+# queue ahead of single creates; its size bounds concurrent bulk OpenAI calls.
+BULK_CLASSIFICATION_WORKERS = 8
+_bulk_classification_executor = ThreadPoolExecutor(
+    max_workers=BULK_CLASSIFICATION_WORKERS, thread_name_prefix="activity-classify-bulk"
+)
+
 
 # ============================================================================
 # SECURITY HELPER
 # ============================================================================
 
-def verify_company_access(company_id: int, current_user: User, db: Session):
+def verify_company_membership(company_id: int, current_user: User):
+    """
+    Verify user belongs to the company - no database round trip
+
+    Raises HTTPException (403) if the user belongs to another company.
+    Single-activity endpoints rely on this alone: their activity query is
+    already filtered by company_id, so a missing company surfaces as 404.
+    """
+    if current_user.company_id != company_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: You don't have permission to access this company's data"
+        )
+
+
+def verify_company_access(company_id: int, current_user: User, db: Session) -> dict:
     """
-    Verify user has access to company data
+    Verify user has access to company data and return the company's profile
+    fields (name, address, ...), served from the short-lived profile cache
 
     Raises HTTPException if:
+    - User doesn't belong to this company (checked first, without a query)
     - Company doesn't exist
-    - User doesn't belong to this company
     """
+    verify_company_membership(company_id, current_user)
+
     # Check company exists
-    company = db.query(Company).filter(Company.id == company_id).first()
+    company = load_company_profile_fields(db, company_id)
     if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Company not found"
         )
 
-    # Check user belongs to this company
-    if current_user.company_id != company_id:
+    return company
+
+
+def paginate_with_total(query, skip: int, limit: int):
+    """
+    Return (page of rows, total matching rows) in one round trip: count(*) OVER ()
+    is computed before OFFSET/LIMIT, so every row carries the full total as its
+    last column. Only a page past the end (no rows to read it from) falls back to
+    a COUNT query.
+    """
+    rows = query.add_columns(func.count().over().label('total')).offset(skip).limit(limit).all()
+    if rows:
+        return rows, rows[0].total
+    return [], (query.order_by(None).count() if skip else 0)
+
+
+def encode_activity_cursor(sort_by: str, sort_order: str, values) -> str:
+    """Opaque keyset cursor: the sort settings plus the last row's sort key values"""
+    payload = orjson.dumps({"sort_by": sort_by, "sort_order": sort_order, "keys": list(values)})
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_activity_cursor(cursor: str, sort_by: str, sort_order: str, sort_keys) -> list:
+    """
+    Sort key values from a cursor made by encode_activity_cursor.
+    Raises HTTPException (400) if it is malformed or was made for another sort.
+    """
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        values = payload["keys"]
+        if (payload["sort_by"], payload["sort_order"]) != (sort_by, sort_order) or len(values) != len(sort_keys):
+            raise ValueError("cursor does not match the requested sort")
+        return [
+            datetime.fromisoformat(value) if value is not None and isinstance(expr.type, DateTime) else value
+            for (expr, _), value in zip(sort_keys, values)
+        ]
+    except (ValueError, TypeError, KeyError, UnicodeEncodeError, binascii.Error, orjson.JSONDecodeError):
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied: You don't have permission to access this company's data"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
         )
 
-    return company
+
+def keyset_after(sort_keys, values):
+    """
+    Rows strictly after `values` in the (expression, descending) ordering:
+    k1 past v1, or k1 = v1 and k2 past v2, ... (works for mixed directions)
+    """
+    clauses = []
+    for index, (expr, descending) in enumerate(sort_keys):
+        ties = [key == value for (key, _), value in zip(sort_keys[:index], values[:index])]
+        clauses.append(and_(*ties, expr < values[index] if descending else expr > values[index]))
+    return or_(*clauses)
 
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
 # ============================================================================
 
+def blank_to_none(value):
+    """Treat an empty or whitespace-only form value as not provided"""
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
 class ActivityCreateRequest(BaseModel):
     """Request to create new emission activity"""
     activity_type: str = Field(..., description="Type of activity (e.g., 'diesel', 'electricity', 'flight')")
     activity_name: Optional[str] = Field(None, description="User-friendly name")
     quantity: float = Field(..., gt=0, description="Amount consumed")
     unit: str = Field(..., description="Unit (e.g., 'litre', 'kwh', 'km')")
-    activity_date: Optional[str] = Field(None, description="Date of activity (YYYY-MM-DD)")
+    activity_date: Optional[datetime] = Field(None, description="Date of activity (YYYY-MM-DD)")
     description: Optional[str] = Field(None, description="Additional details")
     location: Optional[str] = Field(None, description="Location (e.g., 'Mumbai office')")
     from_location: Optional[str] = Field(None, description="Origin (for travel)")
     to_location: Optional[str] = Field(None, description="Destination (for travel)")
     source_document: Optional[str] = Field(None, description="Source file name")
 
-    @field_validator('activity_date')
+    @field_validator('activity_date', mode='before')
     @classmethod
-    def validate_date(cls, v):
-        if v:
-            try:
-                datetime.fromisoformat(v)
-                return v
-            except ValueError:
-                raise ValueError('Date must be in YYYY-MM-DD format')
-        return v
+    def activity_date_blank(cls, v):
+        # A cleared date input is sent as "" (means "today", set on create)
+        return blank_to_none(v)
 
     model_config = {
         "json_schema_extra": {
@@ -103,11 +195,16 @@ class ActivityUpdateRequest(BaseModel):
     activity_name: Optional[str] = None
     quantity: Optional[float] = Field(None, gt=0)
     unit: Optional[str] = None
-    activity_date: Optional[str] = None
+    activity_date: Optional[datetime] = None
     description: Optional[str] = None
     is_verified: Optional[bool] = None
     notes: Optional[str] = None
 
+    @field_validator('activity_date', mode='before')
+    @classmethod
+    def activity_date_blank(cls, v):
+        return blank_to_none(v)
+
 
 class ActivityResponse(BaseModel):
     """Response with activity details"""
@@ -131,7 +228,7 @@ class BulkActivityResponse(BaseModel):
 # ============================================================================
 
 @router.post("", response_model=ActivityResponse)
-async def create_activity(
+def create_activity(
         company_id: int,
         request: ActivityCreateRequest,
         current_user: User = Depends(get_current_user),  # ← AUTHENTICATION REQUIRED
@@ -155,18 +252,24 @@ async def create_activity(
     - Data quality indicators
     """
 
-    print(f"\n{'=' * 70}")
-    print(f"📝 CREATE ACTIVITY - Company {company_id}")
-    print(f"👤 User: {current_user.username} (ID: {current_user.id})")
-    print(f"{'=' * 70}")
+    # Hot ingestion path: lazy %-style debug logging instead of stdout banners
+    logger.debug("Create activity: company_id=%s, user=%s (id=%s)",
+                 company_id, current_user.username, current_user.id)
 
     # SECURITY CHECK: Verify user can access this company
     company = verify_company_access(company_id, current_user, db)
-    print(f"✅ Access granted to: {company.name}")
 
     try:
+        # STEP 2 (started first): classify scope and category in the background
+        classification_future = _classification_executor.submit(
+            classify_scope_and_category,
+            activity_description=request.description or request.activity_type,
+            category=request.activity_type,
+            quantity=request.quantity,
+            unit=request.unit
+        )
+
         # STEP 1: Calculate emissions
-        print(f"\n1️⃣ Calculating emissions...")
         engine = get_engine()
 
         calculation = engine.calculate_emissions(
@@ -179,26 +282,20 @@ async def create_activity(
         )
 
         if not calculation.success:
+            classification_future.cancel()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Emission calculation failed: {calculation.error}"
             )
 
-        print(f"   ✅ Emissions: {calculation.co2e_kg:.2f} kg CO2e")
+        logger.debug("Emissions: %.2f kg CO2e", calculation.co2e_kg)
 
-        # STEP 2: Classify scope and category
-        print(f"\n2️⃣ Classifying scope...")
-        classification = classify_scope_and_category(
-            activity_description=request.description or request.activity_type,
-            category=request.activity_type,
-            quantity=request.quantity,
-            unit=request.unit
-        )
+        # STEP 2: Collect the scope classification
+        classification = classification_future.result()
 
-        print(f"   ✅ {classification['scope']} - {classification['category_name']}")
+        logger.debug("Classified: %s - %s", classification['scope'], classification['category_name'])
 
         # STEP 3: Create activity record
-        print(f"\n3️⃣ Saving to database...")
 
         activity = EmissionActivity(
             company_id=company_id,
@@ -218,8 +315,7 @@ async def create_activity(
             scope_number=int(classification['scope'].split()[1]),
             category=classification['category_name'],
             subcategory=classification['sub_category'],
-            activity_date=datetime.fromisoformat(request.activity_date) if request.activity_date else datetime.now(
-                timezone.utc),
+            activity_date=request.activity_date or datetime.now(timezone.utc),
             location=request.location,
             from_location=request.from_location,
             to_location=request.to_location,
@@ -233,19 +329,14 @@ async def create_activity(
         db.commit()
         db.refresh(activity)
 
-        print(f"   ✅ Saved - Activity ID: {activity.id}")
+        logger.debug("Saved activity %s for company %s", activity.id, company["name"])
 
         # STEP 4: Update company summary (if function exists)
-        print(f"\n4️⃣ Updating summary...")
         try:
             from app.models import calculate_summary_for_company
             calculate_summary_for_company(db, company_id, reporting_period="Current")
         except ImportError:
-            print("   ⚠️  Summary calculation not available")
-
-        print(f"\n{'=' * 70}")
-        print(f"✅ ACTIVITY CREATED SUCCESSFULLY")
-        print(f"{'=' * 70}\n")
+            logger.debug("Summary calculation not available")
 
         return {
             "success": True,
@@ -277,9 +368,7 @@ async def create_activity(
         raise
     except Exception as e:
         db.rollback()
-        print(f"\n❌ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Create activity failed for company %s", company_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create activity: {str(e)}"
@@ -291,7 +380,7 @@ async def create_activity(
 # ============================================================================
 
 @router.get("", response_model=dict)
-async def get_activities(
+def get_activities(
         company_id: int,
         current_user: User = Depends(get_current_user),  # ← AUTHENTICATION REQUIRED
         scope: Optional[str] = Query(None, description="Filter by scope(s) - comma-separated (1,2,3)"),
@@ -304,6 +393,8 @@ async def get_activities(
         sort_order: Optional[str] = Query("desc", description="Sort order: asc or desc"),
         skip: int = Query(0, ge=0, description="Number of records to skip"),
         limit: int = Query(50, ge=1, le=1000, description="Number of records to return"),
+        cursor: Optional[str] = Query(None, description="next_cursor from the previous page (keyset pagination, replaces skip)"),
+        include_total: bool = Query(False, description="With cursor: also count all matching records"),
         db: Session = Depends(get_db)
 ):
     """
@@ -322,13 +413,19 @@ async def get_activities(
     **Sorting:**
     - sort_by: activity_date, emissions_kgco2e, activity_name, created_at
     - sort_order: asc or desc
+
+    **Pagination:**
+    - skip/limit: offset pages, total always included
+    - cursor/limit: keyset pages that seek past the previous page's last row
+      instead of skipping rows; pass each response's next_cursor (null on the
+      last page). total is only counted with include_total=true
     """
 
     # SECURITY CHECK
     company = verify_company_access(company_id, current_user, db)
 
-    # Build query - ONLY for this company
-    query = db.query(EmissionActivity).filter(
+    # Build query - ONLY for this company (only the columns the response needs)
+    query = db.query(*EMISSION_ACTIVITY_DICT_COLUMNS).filter(
         EmissionActivity.company_id == company_id  # ← Company isolation
     )
 
@@ -368,12 +465,7 @@ async def get_activities(
         try:
             start_dt = datetime.fromisoformat(start_date)
             # Use activity_date if available, otherwise use created_at
-            query = query.filter(
-                or_(
-                    and_(EmissionActivity.activity_date.isnot(None), EmissionActivity.activity_date >= start_dt),
-                    and_(EmissionActivity.activity_date.is_(None), EmissionActivity.created_at >= start_dt)
-                )
-            )
+            query = query.filter(EMISSION_ACTIVITY_EFFECTIVE_DATE >= start_dt)
         except ValueError:
             pass  # Invalid date format, skip filter
 
@@ -383,18 +475,10 @@ async def get_activities(
             # Include time component to cover entire day
             end_dt = end_dt.replace(hour=23, minute=59, second=59)
             # Use activity_date if available, otherwise use created_at
-            query = query.filter(
-                or_(
-                    and_(EmissionActivity.activity_date.isnot(None), EmissionActivity.activity_date <= end_dt),
-                    and_(EmissionActivity.activity_date.is_(None), EmissionActivity.created_at <= end_dt)
-                )
-            )
+            query = query.filter(EMISSION_ACTIVITY_EFFECTIVE_DATE <= end_dt)
         except ValueError:
             pass  # Invalid date format, skip filter
 
-    # Get total count BEFORE sorting/pagination
-    total = query.count()
-
     # Apply sorting
     valid_sort_fields = {
         "activity_date": EmissionActivity.activity_date,
@@ -411,62 +495,67 @@ async def get_activities(
     
     sort_field = valid_sort_fields[sort_by]
 
-    # Build order_by with proper null handling for each field type
+    # Build the ordering as (expression, descending) keys with proper null
+    # handling for each field type; id breaks ties so keyset cursors are exact
     if sort_by == "activity_date":
         # For activity_date, use created_at as fallback for null values
-        order_by_field = case(
-            (EmissionActivity.activity_date.isnot(None), EmissionActivity.activity_date),
-            else_=EmissionActivity.created_at
-        )
-        # Apply sorting
-        if sort_order_lower == "asc":
-            query = query.order_by(order_by_field.asc(), EmissionActivity.created_at.desc())
-        else:
-            query = query.order_by(order_by_field.desc(), EmissionActivity.created_at.desc())
-            
+        # (the same expression as ix_emission_activity_company_effective_date)
+        sort_keys = [(EMISSION_ACTIVITY_EFFECTIVE_DATE, sort_order_lower != "asc"), (EmissionActivity.created_at, True)]
+
     elif sort_by == "emissions_kgco2e":
         # For emissions, null values should go last in both ascending and descending
         # Use COALESCE with a very large number for asc (nulls last) or -1 for desc (nulls last)
         if sort_order_lower == "asc":
             # For asc: use a very large number so nulls go to the end
-            query = query.order_by(
-                func.coalesce(EmissionActivity.emissions_kgco2e, 999999999).asc(),
-                EmissionActivity.created_at.desc()
-            )
+            sort_keys = [(func.coalesce(EmissionActivity.emissions_kgco2e, 999999999), False)]
         else:
             # For desc: use -1 so nulls (coalesced to -1) go last (after all positive values)
-            query = query.order_by(
-                func.coalesce(EmissionActivity.emissions_kgco2e, -1).desc(),
-                EmissionActivity.created_at.desc()
-            )
-            
+            sort_keys = [(func.coalesce(EmissionActivity.emissions_kgco2e, -1), True)]
+        sort_keys.append((EmissionActivity.created_at, True))
+
     elif sort_by == "activity_name":
         # For activity_name, use COALESCE to handle nulls
         # Simple fallback: use activity_type if activity_name is null
         fallback_name = func.coalesce(EmissionActivity.activity_name, EmissionActivity.activity_type, '')
-        if sort_order_lower == "asc":
-            query = query.order_by(fallback_name.asc(), EmissionActivity.created_at.desc())
-        else:
-            query = query.order_by(fallback_name.desc(), EmissionActivity.created_at.desc())
-            
+        sort_keys = [(fallback_name, sort_order_lower != "asc"), (EmissionActivity.created_at, True)]
+
     else:
         # For created_at and other fields, use directly (shouldn't be null normally)
-        if sort_order_lower == "asc":
-            query = query.order_by(sort_field.asc(), EmissionActivity.id.desc())
-        else:
-            query = query.order_by(sort_field.desc(), EmissionActivity.id.desc())
-
-    # Apply pagination
-    activities = query.offset(skip).limit(limit).all()
+        sort_keys = [(sort_field, sort_order_lower != "asc")]
+    sort_keys.append((EmissionActivity.id, True))
+
+    query = query.order_by(*[expr.desc() if descending else expr.asc() for expr, descending in sort_keys])
+    # The last row's key values become next_cursor
+    query = query.add_columns(*[expr.label(f"sort_key_{index}") for index, (expr, _) in enumerate(sort_keys)])
+
+    if cursor:
+        # Keyset pagination: seek past the previous page's last row, one extra row tells if there is more
+        after = decode_activity_cursor(cursor, sort_by, sort_order_lower, sort_keys)
+        total = query.order_by(None).count() if include_total else None
+        activities = query.filter(keyset_after(sort_keys, after)).limit(limit + 1).all()
+        has_more = len(activities) > limit
+        activities = activities[:limit]
+    else:
+        # Apply pagination (the total match count comes back with the page)
+        activities, total = paginate_with_total(query, skip, limit)
+        has_more = skip + len(activities) < total
+
+    next_cursor = None
+    if has_more and activities:
+        last = activities[-1]
+        next_cursor = encode_activity_cursor(
+            sort_by, sort_order_lower, [getattr(last, f"sort_key_{index}") for index in range(len(sort_keys))]
+        )
 
     return {
         "success": True,
         "company_id": company_id,
-        "company_name": company.name,
+        "company_name": company["name"],
         "total": total,
         "count": len(activities),
         "skip": skip,
         "limit": limit,
+        "next_cursor": next_cursor,
         "sort_by": sort_by,
         "sort_order": sort_order_lower,
         "filters_applied": {
@@ -477,7 +566,7 @@ async def get_activities(
             "start_date": start_date,
             "end_date": end_date
         },
-        "activities": [a.to_dict() for a in activities]
+        "activities": [emission_activity_row_to_dict(row) for row in activities]
     }
 
 
@@ -486,7 +575,7 @@ async def get_activities(
 # ============================================================================
 
 @router.get("/{activity_id}", response_model=dict)
-async def get_activity(
+def get_activity(
         company_id: int,
         activity_id: int,
         current_user: User = Depends(get_current_user),  # ← AUTHENTICATION REQUIRED
@@ -500,7 +589,7 @@ async def get_activity(
     """
 
     # SECURITY CHECK
-    verify_company_access(company_id, current_user, db)
+    verify_company_membership(company_id, current_user)
 
     # Query with company_id filter
     activity = db.query(EmissionActivity).filter(
@@ -525,7 +614,7 @@ async def get_activity(
 # ============================================================================
 
 @router.put("/{activity_id}", response_model=ActivityResponse)
-async def update_activity(
+def update_activity(
         company_id: int,
         activity_id: int,
         request: ActivityUpdateRequest,
@@ -542,7 +631,7 @@ async def update_activity(
     """
 
     # SECURITY CHECK
-    verify_company_access(company_id, current_user, db)
+    verify_company_membership(company_id, current_user)
 
     # Query with company_id filter
     activity = db.query(EmissionActivity).filter(
@@ -573,7 +662,7 @@ async def update_activity(
             needs_recalc = True
 
         if request.activity_date:
-            activity.activity_date = datetime.fromisoformat(request.activity_date)
+            activity.activity_date = request.activity_date
 
         if request.description:
             activity.description = request.description
@@ -586,7 +675,7 @@ async def update_activity(
 
         # Recalculate if needed
         if needs_recalc:
-            print(f"🔄 Recalculating emissions...")
+            logger.debug("Recalculating emissions for activity %s", activity_id)
             engine = get_engine()
             calculation = engine.calculate_emissions(
                 activity_type=activity.activity_type,
@@ -606,7 +695,7 @@ async def update_activity(
         db.commit()
         db.refresh(activity)
 
-        print(f"✅ Activity {activity_id} updated by {current_user.username}")
+        logger.info("Activity %s updated by %s", activity_id, current_user.username)
 
         return {
             "success": True,
@@ -627,7 +716,7 @@ async def update_activity(
 # ============================================================================
 
 @router.delete("/{activity_id}")
-async def delete_activity(
+def delete_activity(
         company_id: int,
         activity_id: int,
         current_user: User = Depends(get_current_user),  # ← AUTHENTICATION REQUIRED
@@ -641,7 +730,7 @@ async def delete_activity(
     """
 
     # SECURITY CHECK
-    verify_company_access(company_id, current_user, db)
+    verify_company_membership(company_id, current_user)
 
     # Query with company_id filter
     activity = db.query(EmissionActivity).filter(
@@ -658,7 +747,7 @@ async def delete_activity(
     db.delete(activity)
     db.commit()
 
-    print(f"🗑️ Activity {activity_id} deleted by {current_user.username}")
+    logger.info("Activity %s deleted by %s", activity_id, current_user.username)
 
     return {
         "success": True,
@@ -671,7 +760,7 @@ async def delete_activity(
 # ============================================================================
 
 @router.post("/bulk", response_model=BulkActivityResponse)
-async def create_activities_bulk(
+def create_activities_bulk(
         company_id: int,
         activities: List[ActivityCreateRequest],
         current_user: User = Depends(get_current_user),  # ← AUTHENTICATION REQUIRED
@@ -695,26 +784,36 @@ async def create_activities_bulk(
     # SECURITY CHECK
     company = verify_company_access(company_id, current_user, db)
 
-    print(f"\n📦 BULK CREATE - {len(activities)} activities")
-    print(f"👤 User: {current_user.username}")
-    print(f"🏢 Company: {company.name}")
+    logger.debug("Bulk create: %s activities, user=%s, company=%s",
+                 len(activities), current_user.username, company["name"])
 
+    # Rows are collected as plain mappings and inserted in one batch below
     created_activities = []
     errors = []
 
-    for idx, activity_req in enumerate(activities, 1):
-        try:
-            print(f"\n   Processing {idx}/{len(activities)}...")
-
-            # Calculate emissions
-            engine = get_engine()
-            calculation = engine.calculate_emissions(
-                activity_type=activity_req.activity_type,
-                quantity=activity_req.quantity,
-                unit=activity_req.unit,
-                region=activity_req.location or "India"
-            )
+    # Calculate emissions for the whole batch (one factor lookup per activity/unit/region)
+    calculations = get_engine().calculate_emissions_batch(
+        activity_types=[a.activity_type for a in activities],
+        quantities=np.fromiter((a.quantity for a in activities), dtype=np.float64, count=len(activities)),
+        units=[a.unit for a in activities],
+        regions=[a.location or "India" for a in activities]
+    )
 
+    # Classify only the rows whose emissions calculated, on the bulk pool
+    classification_futures = [
+        _bulk_classification_executor.submit(
+            classify_scope_and_category,
+            activity_description=a.description or a.activity_type,
+            category=a.activity_type,
+            quantity=a.quantity,
+            unit=a.unit
+        ) if calculation.success else None
+        for a, calculation in zip(activities, calculations)
+    ]
+
+    for idx, (activity_req, calculation, classification_future) in enumerate(
+            zip(activities, calculations, classification_futures), 1):
+        try:
             if not calculation.success:
                 errors.append({
                     "index": idx,
@@ -724,15 +823,10 @@ async def create_activities_bulk(
                 continue
 
             # Classify
-            classification = classify_scope_and_category(
-                activity_description=activity_req.description or activity_req.activity_type,
-                category=activity_req.activity_type,
-                quantity=activity_req.quantity,
-                unit=activity_req.unit
-            )
+            classification = classification_future.result()
 
             # Create activity
-            activity = EmissionActivity(
+            created_activities.append(dict(
                 company_id=company_id,  # ← Locked to user's company
                 activity_type=activity_req.activity_type,
                 activity_name=activity_req.activity_name or f"{activity_req.activity_type} - {activity_req.quantity} {activity_req.unit}",
@@ -747,15 +841,11 @@ async def create_activities_bulk(
                 scope=classification['scope'],
                 scope_number=int(classification['scope'].split()[1]),
                 category=classification['category_name'],
-                activity_date=datetime.fromisoformat(
-                    activity_req.activity_date) if activity_req.activity_date else datetime.now(timezone.utc),
+                activity_date=activity_req.activity_date or datetime.now(timezone.utc),
                 location=activity_req.location,
                 created_by=f"{current_user.username}_BULK",  # ← Track creator
                 created_at=datetime.now(timezone.utc)
-            )
-
-            db.add(activity)
-            created_activities.append(activity)
+            ))
 
         except Exception as e:
             errors.append({
@@ -764,10 +854,12 @@ async def create_activities_bulk(
                 "error": str(e)
             })
 
-    # Commit all
+    # Insert all in one batch, commit once
     try:
+        bulk_insert_activities(db, created_activities)
         db.commit()
-        print(f"\n✅ Created {len(created_activities)} activities")
+        logger.info("Bulk create for company %s: %d activities, %d created, %d failed",
+                    company_id, len(activities), len(created_activities), len(errors))
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -782,9 +874,9 @@ async def create_activities_bulk(
         "failed": len(errors),
         "activities": [
             {
-                "id": a.id,
-                "activity_name": a.activity_name,
-                "emissions_kgco2e": a.emissions_kgco2e
+                "id": a["id"],
+                "activity_name": a["activity_name"],
+                "emissions_kgco2e": a["emissions_kgco2e"]
             } for a in created_activities
         ],
         "errors": errors if errors else None
@@ -796,7 +888,7 @@ async def create_activities_bulk(
 # ============================================================================
 
 @router.get("/admin/all-activities")
-async def get_all_activities_admin(
+def get_all_activities_admin(
         current_user: User = Depends(get_current_admin_user),  # ← ADMIN ONLY
         skip: int = Query(0, ge=0),
         limit: int = Query(50, ge=1, le=1000),
@@ -809,20 +901,16 @@ async def get_all_activities_admin(
     **Authorization:** Admin role required
     """
 
-    print(f"🔐 Admin access by: {current_user.username}")
+    logger.info("Admin activity listing by %s", current_user.username)
 
     # Admin can see all activities
-    query = db.query(EmissionActivity)
-    total = query.count()
-
-    activities = query.order_by(
-        EmissionActivity.created_at.desc()
-    ).offset(skip).limit(limit).all()
+    query = db.query(*EMISSION_ACTIVITY_DICT_COLUMNS).order_by(EmissionActivity.created_at.desc())
+    activities, total = paginate_with_total(query, skip, limit)
 
     return {
         "success": True,
         "admin_view": True,
         "total": total,
         "count": len(activities),
-        "activities": [a.to_dict() for a in activities]
+        "activities": [emission_activity_row_to_dict(row) for row in activities]
     }
\ No newline at end of file
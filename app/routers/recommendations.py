@@ -320,7 +320,7 @@ def format_cached_response(db: Session, cached_recommendation: AIRecommendation,
 
     # Add unique IDs to each recommendation for frontend tracking
     recommendations_with_ids = []
-    for i, rec in enumerate(cached_recommendation.recommendations_json):
+    for i, rec in enumerate(cached_recommendation.normalized_recommendations):
         rec_copy = dict(rec)
         unique_id = f"{cached_recommendation.recommendation_id}_rec_{i}"
         rec_copy['recommendation_unique_id'] = unique_id
@@ -366,7 +366,7 @@ def format_cached_response(db: Session, cached_recommendation: AIRecommendation,
         "detailed_analysis": cached_recommendation.detailed_analysis,
         "recommendations": recommendations_with_ids,
         "summary": {
-            "total_recommendations": len(cached_recommendation.recommendations_json),
+            "total_recommendations": len(cached_recommendation.normalized_recommendations),
             "total_potential_savings_kg": cached_recommendation.total_potential_savings_kg,
             "total_potential_savings_tonnes": cached_recommendation.total_potential_savings_tonnes,
             "potential_reduction_percentage": cached_recommendation.potential_reduction_percentage,
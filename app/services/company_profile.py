@@ -0,0 +1,41 @@
+# app/services/company_profile.py
+"""
+Company Profile Cache
+=====================
+Short-lived cache of the company profile fields read by the report
+profile endpoint and the activity endpoints' company access check
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+from sqlalchemy.orm import Session
+
+from app.models import Company
+
+# Company profile fields change rarely and are read on every profile poll and
+# activity request, so they are kept for a short TTL (no version check, so an
+# edit shows up once the entry expires). Missing companies are not cached: a
+# company committed right after a failed lookup is found on the next request.
+COMPANY_PROFILE_CACHE_TTL = 60
+_company_profile_cache = TTLCache(maxsize=1024, ttl=COMPANY_PROFILE_CACHE_TTL)
+_company_profile_cache_lock = threading.Lock()
+
+_COMPANY_PROFILE_COLUMNS = (Company.name, Company.address, Company.industry, Company.phone, Company.website)
+
+
+def load_company_profile_fields(db: Session, company_id: int) -> Optional[Dict[str, Any]]:
+    """name/address/industry/phone/website of a company, cached briefly (None, uncached, if it does not exist)"""
+    with _company_profile_cache_lock:
+        if company_id in _company_profile_cache:
+            return _company_profile_cache[company_id]
+
+    row = db.query(*_COMPANY_PROFILE_COLUMNS).filter(Company.id == company_id).first()
+    if row is None:
+        return None
+    fields = dict(row._mapping)
+
+    with _company_profile_cache_lock:
+        _company_profile_cache[company_id] = fields
+    return fields
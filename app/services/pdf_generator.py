@@ -29,6 +29,323 @@ from datetime import datetime
 from pathlib import Path
 
 
+# ══════════════════════════════════════════════════════════════════
+# CHART RENDERING
+# Module-level so the report builder can run them in worker processes
+# (matplotlib's pyplot state is not thread-safe). Each returns PNG bytes.
+# ══════════════════════════════════════════════════════════════════
+
+def chart_image(png: Optional[bytes], width: float, height: float) -> Optional[Image]:
+    """Wrap rendered chart PNG bytes in a centred ReportLab Image"""
+    if not png:
+        return None
+    img = Image(BytesIO(png), width=width, height=height)
+    img.hAlign = 'CENTER'
+    return img
+
+
+def render_scope_pie_png(emissions: Dict) -> Optional[bytes]:
+    """Create high-quality pie chart for scope breakdown (PNG bytes)"""
+    try:
+        # Use a compatible style
+        try:
+            plt.style.use('seaborn-v0_8-darkgrid')
+        except:
+            try:
+                plt.style.use('seaborn-darkgrid')
+            except:
+                try:
+                    plt.style.use('seaborn')
+                except:
+                    plt.style.use('default')
+        # Set figure background to white
+        plt.rcParams['figure.facecolor'] = 'white'
+        plt.rcParams['axes.facecolor'] = 'white'
+        fig, ax = plt.subplots(figsize=(7, 5))
+        
+        scopes = ['Scope 1', 'Scope 2', 'Scope 3']
+        values = [
+            emissions.get('scope1', 0) / 1000,
+            emissions.get('scope2', 0) / 1000,
+            emissions.get('scope3', 0) / 1000
+        ]
+        colors_list = ['#ef4444', '#f59e0b', '#8b5cf6']
+        
+        # Create pie chart with better styling
+        wedges, texts, autotexts = ax.pie(
+            values, 
+            labels=scopes, 
+            autopct='%1.1f%%', 
+            colors=colors_list, 
+            startangle=90,
+            explode=(0.05, 0.05, 0.05),
+            shadow=True,
+            textprops={'fontsize': 11, 'fontweight': 'bold'}
+        )
+        
+        # Enhance autopct text
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontweight('bold')
+        
+        ax.set_title('Emissions by Scope', fontsize=16, fontweight='bold', pad=20)
+        
+        # Add total emissions text
+        total = sum(values)
+        ax.text(0, -1.3, f'Total: {total:.2f} tonnes CO₂e', 
+               ha='center', fontsize=12, fontweight='bold', 
+               bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+        
+        plt.tight_layout()
+        
+        buf = BytesIO()
+        plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
+        plt.close()
+        
+        return buf.getvalue()
+    except Exception as e:
+        print(f"Error creating pie chart: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+def render_scope_bar_png(emissions: Dict) -> Optional[bytes]:
+    """Create bar chart for scope breakdown (PNG bytes)"""
+    try:
+        # Use a compatible style
+        try:
+            plt.style.use('seaborn-v0_8-darkgrid')
+        except:
+            try:
+                plt.style.use('seaborn-darkgrid')
+            except:
+                try:
+                    plt.style.use('seaborn')
+                except:
+                    plt.style.use('default')
+        # Set figure background to white
+        plt.rcParams['figure.facecolor'] = 'white'
+        plt.rcParams['axes.facecolor'] = 'white'
+        fig, ax = plt.subplots(figsize=(7, 5))
+        
+        scopes = ['Scope 1', 'Scope 2', 'Scope 3']
+        values = [
+            emissions.get('scope1', 0) / 1000,
+            emissions.get('scope2', 0) / 1000,
+            emissions.get('scope3', 0) / 1000
+        ]
+        colors_list = ['#ef4444', '#f59e0b', '#8b5cf6']
+        
+        bars = ax.bar(scopes, values, color=colors_list, edgecolor='black', linewidth=1.5, alpha=0.8)
+        
+        # Add value labels on bars
+        for bar, val in zip(bars, values):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                   f'{val:.2f}\nt CO₂e',
+                   ha='center', va='bottom', fontsize=10, fontweight='bold')
+        
+        ax.set_ylabel('Emissions (tonnes CO₂e)', fontsize=12, fontweight='bold')
+        ax.set_title('Emissions Breakdown by Scope', fontsize=16, fontweight='bold', pad=20)
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+        ax.set_axisbelow(True)
+        
+        plt.tight_layout()
+        
+        buf = BytesIO()
+        plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
+        plt.close()
+        
+        return buf.getvalue()
+    except Exception as e:
+        print(f"Error creating bar chart: {e}")
+        return None
+
+
+def render_trend_line_png(trends: List[Dict]) -> Optional[bytes]:
+    """Create line chart for emissions trends (PNG bytes)"""
+    try:
+        if not trends or len(trends) == 0:
+            return None
+            
+        # Use a compatible style
+        try:
+            plt.style.use('seaborn-v0_8-darkgrid')
+        except:
+            try:
+                plt.style.use('seaborn-darkgrid')
+            except:
+                try:
+                    plt.style.use('seaborn')
+                except:
+                    plt.style.use('default')
+        # Set figure background to white
+        plt.rcParams['figure.facecolor'] = 'white'
+        plt.rcParams['axes.facecolor'] = 'white'
+        fig, ax = plt.subplots(figsize=(8, 5))
+        
+        periods = [t.get('period', '') for t in trends]
+        emissions = [t.get('emissions_kg', 0) / 1000 for t in trends]
+        
+        ax.plot(periods, emissions, marker='o', linewidth=2.5, markersize=8, 
+               color='#667eea', markerfacecolor='#764ba2', markeredgecolor='white', 
+               markeredgewidth=2, label='Total Emissions')
+        
+        # Fill area under curve
+        ax.fill_between(periods, emissions, alpha=0.3, color='#667eea')
+        
+        # Add value labels
+        for i, (period, emission) in enumerate(zip(periods, emissions)):
+            if i % max(1, len(periods) // 5) == 0:  # Label every 5th point or all if < 5
+                ax.annotate(f'{emission:.1f}t', 
+                          (period, emission),
+                          textcoords="offset points", 
+                          xytext=(0,10), 
+                          ha='center', fontsize=9, fontweight='bold')
+        
+        ax.set_xlabel('Period', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Emissions (tonnes CO₂e)', fontsize=12, fontweight='bold')
+        ax.set_title('Emissions Trend Over Time', fontsize=16, fontweight='bold', pad=20)
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.legend(loc='best', fontsize=10)
+        
+        # Rotate x-axis labels if needed
+        plt.xticks(rotation=45, ha='right')
+        
+        plt.tight_layout()
+        
+        buf = BytesIO()
+        plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
+        plt.close()
+        
+        return buf.getvalue()
+    except Exception as e:
+        print(f"Error creating trend chart: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+def render_category_bar_png(category_data: List[Dict]) -> Optional[bytes]:
+    """Create horizontal bar chart for category breakdown (PNG bytes)"""
+    try:
+        if not category_data or len(category_data) == 0:
+            return None
+            
+        # Use a compatible style
+        try:
+            plt.style.use('seaborn-v0_8-darkgrid')
+        except:
+            try:
+                plt.style.use('seaborn-darkgrid')
+            except:
+                try:
+                    plt.style.use('seaborn')
+                except:
+                    plt.style.use('default')
+        # Set figure background to white
+        plt.rcParams['figure.facecolor'] = 'white'
+        plt.rcParams['axes.facecolor'] = 'white'
+        fig, ax = plt.subplots(figsize=(8, 6))
+        
+        # Sort by emissions and take top 10
+        sorted_data = sorted(category_data, key=lambda x: x.get('emissions_kg', 0), reverse=True)[:10]
+        
+        categories = [d.get('category', 'Uncategorized')[:30] for d in sorted_data]
+        emissions = [d.get('emissions_kg', 0) / 1000 for d in sorted_data]
+        
+        # Create color gradient
+        colors_list = plt.cm.viridis(np.linspace(0, 1, len(categories)))
+        
+        bars = ax.barh(categories, emissions, color=colors_list, edgecolor='black', linewidth=1, alpha=0.8)
+        
+        # Add value labels
+        for i, (bar, val) in enumerate(zip(bars, emissions)):
+            width = bar.get_width()
+            ax.text(width, bar.get_y() + bar.get_height()/2.,
+                   f' {val:.2f} t',
+                   ha='left', va='center', fontsize=9, fontweight='bold')
+        
+        ax.set_xlabel('Emissions (tonnes CO₂e)', fontsize=12, fontweight='bold')
+        ax.set_title('Top Emission Categories', fontsize=16, fontweight='bold', pad=20)
+        ax.grid(axis='x', alpha=0.3, linestyle='--')
+        ax.set_axisbelow(True)
+        
+        plt.tight_layout()
+        
+        buf = BytesIO()
+        plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
+        plt.close()
+        
+        return buf.getvalue()
+    except Exception as e:
+        print(f"Error creating category chart: {e}")
+        return None
+
+
+def render_top_emitters_png(top_emitters: List[Dict]) -> Optional[bytes]:
+    """Create bar chart for top emission sources (PNG bytes)"""
+    try:
+        if not top_emitters or len(top_emitters) == 0:
+            return None
+            
+        # Use a compatible style
+        try:
+            plt.style.use('seaborn-v0_8-darkgrid')
+        except:
+            try:
+                plt.style.use('seaborn-darkgrid')
+            except:
+                try:
+                    plt.style.use('seaborn')
+                except:
+                    plt.style.use('default')
+        # Set figure background to white
+        plt.rcParams['figure.facecolor'] = 'white'
+        plt.rcParams['axes.facecolor'] = 'white'
+        fig, ax = plt.subplots(figsize=(8, 5))
+        
+        # Take top 8
+        top_data = top_emitters[:8]
+        activities = [d.get('activity', 'N/A')[:25] for d in top_data]
+        emissions = [d.get('total_emissions_kg', 0) / 1000 for d in top_data]
+        
+        colors_list = plt.cm.plasma(np.linspace(0, 1, len(activities)))
+        
+        bars = ax.bar(range(len(activities)), emissions, color=colors_list, 
+                     edgecolor='black', linewidth=1.5, alpha=0.8)
+        
+        # Add value labels
+        for bar, val in zip(bars, emissions):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                   f'{val:.2f}t',
+                   ha='center', va='bottom', fontsize=9, fontweight='bold')
+        
+        ax.set_xticks(range(len(activities)))
+        ax.set_xticklabels(activities, rotation=45, ha='right', fontsize=9)
+        ax.set_ylabel('Emissions (tonnes CO₂e)', fontsize=12, fontweight='bold')
+        ax.set_title('Top Emission Sources', fontsize=16, fontweight='bold', pad=20)
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+        ax.set_axisbelow(True)
+        
+        plt.tight_layout()
+        
+        buf = BytesIO()
+        plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
+        plt.close()
+        
+        return buf.getvalue()
+    except Exception as e:
+        print(f"Error creating top emitters chart: {e}")
+        return None
+
+
+# Branding entries that hold hex colors
+BRANDING_COLOR_KEYS = ('primary_color', 'secondary_color', 'accent_color', 'text_color', 'light_gray')
+
+
 class PDFReportGenerator:
     """
     Generate professional PDF reports with branding and visualizations
@@ -36,6 +353,11 @@ class PDFReportGenerator:
 
     def __init__(self, branding: Optional[Dict] = None):
         self.branding = branding or self._get_default_branding()
+        # Branding hex strings parsed once; styles, tables and the per-page header reuse them
+        self.brand_colors = {
+            key: colors.HexColor(self.branding[key])
+            for key in BRANDING_COLOR_KEYS if self.branding.get(key)
+        }
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
 
@@ -64,7 +386,7 @@ class PDFReportGenerator:
             name='CoverTitle',
             parent=self.styles['Heading1'],
             fontSize=36,
-            textColor=colors.HexColor(self.branding['primary_color']),
+            textColor=self.brand_colors['primary_color'],
             spaceAfter=12,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
@@ -75,7 +397,7 @@ class PDFReportGenerator:
             name='CoverSubtitle',
             parent=self.styles['Normal'],
             fontSize=18,
-            textColor=colors.HexColor(self.branding['text_color']),
+            textColor=self.brand_colors['text_color'],
             spaceAfter=30,
             alignment=TA_CENTER
         ))
@@ -85,12 +407,12 @@ class PDFReportGenerator:
             name='SectionHeader',
             parent=self.styles['Heading1'],
             fontSize=24,
-            textColor=colors.HexColor(self.branding['primary_color']),
+            textColor=self.brand_colors['primary_color'],
             spaceAfter=12,
             spaceBefore=20,
             fontName='Helvetica-Bold',
             borderPadding=10,
-            borderColor=colors.HexColor(self.branding['primary_color']),
+            borderColor=self.brand_colors['primary_color'],
             borderWidth=2,
             borderRadius=5
         ))
@@ -100,7 +422,7 @@ class PDFReportGenerator:
             name='SubsectionHeader',
             parent=self.styles['Heading2'],
             fontSize=16,
-            textColor=colors.HexColor(self.branding['text_color']),
+            textColor=self.brand_colors['text_color'],
             spaceAfter=8,
             spaceBefore=12,
             fontName='Helvetica-Bold'
@@ -112,7 +434,7 @@ class PDFReportGenerator:
                 name='BodyText',
                 parent=self.styles['Normal'],
                 fontSize=11,
-                textColor=colors.HexColor(self.branding['text_color']),
+                textColor=self.brand_colors['text_color'],
                 spaceAfter=6,
                 alignment=TA_JUSTIFY,
                 leading=14
@@ -121,7 +443,7 @@ class PDFReportGenerator:
             # Update existing style
             body_style = self.styles['BodyText']
             body_style.fontSize = 11
-            body_style.textColor = colors.HexColor(self.branding['text_color'])
+            body_style.textColor = self.brand_colors['text_color']
             body_style.spaceAfter = 6
             body_style.alignment = TA_JUSTIFY
             body_style.leading = 14
@@ -131,8 +453,8 @@ class PDFReportGenerator:
             name='HighlightBox',
             parent=self.styles['Normal'],
             fontSize=12,
-            textColor=colors.HexColor(self.branding['text_color']),
-            backColor=colors.HexColor(self.branding['light_gray']),
+            textColor=self.brand_colors['text_color'],
+            backColor=self.brand_colors['light_gray'],
             borderPadding=10,
             spaceAfter=12,
             alignment=TA_LEFT
@@ -256,7 +578,7 @@ class PDFReportGenerator:
         # Create table
         toc_table = Table(toc_data, colWidths=[5 * inch, 1 * inch])
         toc_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.branding['primary_color'])),
+            ('BACKGROUND', (0, 0), (-1, 0), self.brand_colors['primary_color']),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
@@ -265,7 +587,7 @@ class PDFReportGenerator:
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
             ('TOPPADDING', (0, 0), (-1, 0), 12),
             ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(self.branding['light_gray'])])
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, self.brand_colors['light_gray']])
         ]))
 
         elements.append(toc_table)
@@ -390,7 +712,7 @@ class PDFReportGenerator:
         # Create table
         table = Table(data)
         table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.branding['primary_color'])),
+            ('BACKGROUND', (0, 0), (-1, 0), self.brand_colors['primary_color']),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
@@ -398,318 +720,30 @@ class PDFReportGenerator:
             ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
             ('TOPPADDING', (0, 0), (-1, 0), 10),
             ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(self.branding['light_gray'])])
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, self.brand_colors['light_gray']])
         ]))
 
         return table
 
     def _create_scope_pie_chart(self, emissions: Dict) -> Optional[Image]:
         """Create high-quality pie chart for scope breakdown"""
-        try:
-            # Use a compatible style
-            try:
-                plt.style.use('seaborn-v0_8-darkgrid')
-            except:
-                try:
-                    plt.style.use('seaborn-darkgrid')
-                except:
-                    try:
-                        plt.style.use('seaborn')
-                    except:
-                        plt.style.use('default')
-            # Set figure background to white
-            plt.rcParams['figure.facecolor'] = 'white'
-            plt.rcParams['axes.facecolor'] = 'white'
-            fig, ax = plt.subplots(figsize=(7, 5))
-            
-            scopes = ['Scope 1', 'Scope 2', 'Scope 3']
-            values = [
-                emissions.get('scope1', 0) / 1000,
-                emissions.get('scope2', 0) / 1000,
-                emissions.get('scope3', 0) / 1000
-            ]
-            colors_list = ['#ef4444', '#f59e0b', '#8b5cf6']
-            
-            # Create pie chart with better styling
-            wedges, texts, autotexts = ax.pie(
-                values, 
-                labels=scopes, 
-                autopct='%1.1f%%', 
-                colors=colors_list, 
-                startangle=90,
-                explode=(0.05, 0.05, 0.05),
-                shadow=True,
-                textprops={'fontsize': 11, 'fontweight': 'bold'}
-            )
-            
-            # Enhance autopct text
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-            
-            ax.set_title('Emissions by Scope', fontsize=16, fontweight='bold', pad=20)
-            
-            # Add total emissions text
-            total = sum(values)
-            ax.text(0, -1.3, f'Total: {total:.2f} tonnes CO₂e', 
-                   ha='center', fontsize=12, fontweight='bold', 
-                   bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-            
-            plt.tight_layout()
-            
-            buf = BytesIO()
-            plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
-            buf.seek(0)
-            plt.close()
-            
-            img = Image(buf, width=5.5 * inch, height=4 * inch)
-            img.hAlign = 'CENTER'
-            return img
-        except Exception as e:
-            print(f"Error creating pie chart: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        return chart_image(render_scope_pie_png(emissions), 5.5 * inch, 4 * inch)
 
     def _create_scope_bar_chart(self, emissions: Dict) -> Optional[Image]:
         """Create bar chart for scope breakdown"""
-        try:
-            # Use a compatible style
-            try:
-                plt.style.use('seaborn-v0_8-darkgrid')
-            except:
-                try:
-                    plt.style.use('seaborn-darkgrid')
-                except:
-                    try:
-                        plt.style.use('seaborn')
-                    except:
-                        plt.style.use('default')
-            # Set figure background to white
-            plt.rcParams['figure.facecolor'] = 'white'
-            plt.rcParams['axes.facecolor'] = 'white'
-            fig, ax = plt.subplots(figsize=(7, 5))
-            
-            scopes = ['Scope 1', 'Scope 2', 'Scope 3']
-            values = [
-                emissions.get('scope1', 0) / 1000,
-                emissions.get('scope2', 0) / 1000,
-                emissions.get('scope3', 0) / 1000
-            ]
-            colors_list = ['#ef4444', '#f59e0b', '#8b5cf6']
-            
-            bars = ax.bar(scopes, values, color=colors_list, edgecolor='black', linewidth=1.5, alpha=0.8)
-            
-            # Add value labels on bars
-            for bar, val in zip(bars, values):
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{val:.2f}\nt CO₂e',
-                       ha='center', va='bottom', fontsize=10, fontweight='bold')
-            
-            ax.set_ylabel('Emissions (tonnes CO₂e)', fontsize=12, fontweight='bold')
-            ax.set_title('Emissions Breakdown by Scope', fontsize=16, fontweight='bold', pad=20)
-            ax.grid(axis='y', alpha=0.3, linestyle='--')
-            ax.set_axisbelow(True)
-            
-            plt.tight_layout()
-            
-            buf = BytesIO()
-            plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
-            buf.seek(0)
-            plt.close()
-            
-            img = Image(buf, width=5.5 * inch, height=4 * inch)
-            img.hAlign = 'CENTER'
-            return img
-        except Exception as e:
-            print(f"Error creating bar chart: {e}")
-            return None
+        return chart_image(render_scope_bar_png(emissions), 5.5 * inch, 4 * inch)
 
     def _create_trend_line_chart(self, trends: List[Dict]) -> Optional[Image]:
         """Create line chart for emissions trends"""
-        try:
-            if not trends or len(trends) == 0:
-                return None
-                
-            # Use a compatible style
-            try:
-                plt.style.use('seaborn-v0_8-darkgrid')
-            except:
-                try:
-                    plt.style.use('seaborn-darkgrid')
-                except:
-                    try:
-                        plt.style.use('seaborn')
-                    except:
-                        plt.style.use('default')
-            # Set figure background to white
-            plt.rcParams['figure.facecolor'] = 'white'
-            plt.rcParams['axes.facecolor'] = 'white'
-            fig, ax = plt.subplots(figsize=(8, 5))
-            
-            periods = [t.get('period', '') for t in trends]
-            emissions = [t.get('emissions_kg', 0) / 1000 for t in trends]
-            
-            ax.plot(periods, emissions, marker='o', linewidth=2.5, markersize=8, 
-                   color='#667eea', markerfacecolor='#764ba2', markeredgecolor='white', 
-                   markeredgewidth=2, label='Total Emissions')
-            
-            # Fill area under curve
-            ax.fill_between(periods, emissions, alpha=0.3, color='#667eea')
-            
-            # Add value labels
-            for i, (period, emission) in enumerate(zip(periods, emissions)):
-                if i % max(1, len(periods) // 5) == 0:  # Label every 5th point or all if < 5
-                    ax.annotate(f'{emission:.1f}t', 
-                              (period, emission),
-                              textcoords="offset points", 
-                              xytext=(0,10), 
-                              ha='center', fontsize=9, fontweight='bold')
-            
-            ax.set_xlabel('Period', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Emissions (tonnes CO₂e)', fontsize=12, fontweight='bold')
-            ax.set_title('Emissions Trend Over Time', fontsize=16, fontweight='bold', pad=20)
-            ax.grid(True, alpha=0.3, linestyle='--')
-            ax.legend(loc='best', fontsize=10)
-            
-            # Rotate x-axis labels if needed
-            plt.xticks(rotation=45, ha='right')
-            
-            plt.tight_layout()
-            
-            buf = BytesIO()
-            plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
-            buf.seek(0)
-            plt.close()
-            
-            img = Image(buf, width=6 * inch, height=4 * inch)
-            img.hAlign = 'CENTER'
-            return img
-        except Exception as e:
-            print(f"Error creating trend chart: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        return chart_image(render_trend_line_png(trends), 6 * inch, 4 * inch)
 
     def _create_category_bar_chart(self, category_data: List[Dict]) -> Optional[Image]:
         """Create horizontal bar chart for category breakdown"""
-        try:
-            if not category_data or len(category_data) == 0:
-                return None
-                
-            # Use a compatible style
-            try:
-                plt.style.use('seaborn-v0_8-darkgrid')
-            except:
-                try:
-                    plt.style.use('seaborn-darkgrid')
-                except:
-                    try:
-                        plt.style.use('seaborn')
-                    except:
-                        plt.style.use('default')
-            # Set figure background to white
-            plt.rcParams['figure.facecolor'] = 'white'
-            plt.rcParams['axes.facecolor'] = 'white'
-            fig, ax = plt.subplots(figsize=(8, 6))
-            
-            # Sort by emissions and take top 10
-            sorted_data = sorted(category_data, key=lambda x: x.get('emissions_kg', 0), reverse=True)[:10]
-            
-            categories = [d.get('category', 'Uncategorized')[:30] for d in sorted_data]
-            emissions = [d.get('emissions_kg', 0) / 1000 for d in sorted_data]
-            
-            # Create color gradient
-            colors_list = plt.cm.viridis(np.linspace(0, 1, len(categories)))
-            
-            bars = ax.barh(categories, emissions, color=colors_list, edgecolor='black', linewidth=1, alpha=0.8)
-            
-            # Add value labels
-            for i, (bar, val) in enumerate(zip(bars, emissions)):
-                width = bar.get_width()
-                ax.text(width, bar.get_y() + bar.get_height()/2.,
-                       f' {val:.2f} t',
-                       ha='left', va='center', fontsize=9, fontweight='bold')
-            
-            ax.set_xlabel('Emissions (tonnes CO₂e)', fontsize=12, fontweight='bold')
-            ax.set_title('Top Emission Categories', fontsize=16, fontweight='bold', pad=20)
-            ax.grid(axis='x', alpha=0.3, linestyle='--')
-            ax.set_axisbelow(True)
-            
-            plt.tight_layout()
-            
-            buf = BytesIO()
-            plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
-            buf.seek(0)
-            plt.close()
-            
-            img = Image(buf, width=6 * inch, height=4.5 * inch)
-            img.hAlign = 'CENTER'
-            return img
-        except Exception as e:
-            print(f"Error creating category chart: {e}")
-            return None
+        return chart_image(render_category_bar_png(category_data), 6 * inch, 4.5 * inch)
 
     def _create_top_emitters_chart(self, top_emitters: List[Dict]) -> Optional[Image]:
         """Create bar chart for top emission sources"""
-        try:
-            if not top_emitters or len(top_emitters) == 0:
-                return None
-                
-            # Use a compatible style
-            try:
-                plt.style.use('seaborn-v0_8-darkgrid')
-            except:
-                try:
-                    plt.style.use('seaborn-darkgrid')
-                except:
-                    try:
-                        plt.style.use('seaborn')
-                    except:
-                        plt.style.use('default')
-            # Set figure background to white
-            plt.rcParams['figure.facecolor'] = 'white'
-            plt.rcParams['axes.facecolor'] = 'white'
-            fig, ax = plt.subplots(figsize=(8, 5))
-            
-            # Take top 8
-            top_data = top_emitters[:8]
-            activities = [d.get('activity', 'N/A')[:25] for d in top_data]
-            emissions = [d.get('total_emissions_kg', 0) / 1000 for d in top_data]
-            
-            colors_list = plt.cm.plasma(np.linspace(0, 1, len(activities)))
-            
-            bars = ax.bar(range(len(activities)), emissions, color=colors_list, 
-                         edgecolor='black', linewidth=1.5, alpha=0.8)
-            
-            # Add value labels
-            for bar, val in zip(bars, emissions):
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{val:.2f}t',
-                       ha='center', va='bottom', fontsize=9, fontweight='bold')
-            
-            ax.set_xticks(range(len(activities)))
-            ax.set_xticklabels(activities, rotation=45, ha='right', fontsize=9)
-            ax.set_ylabel('Emissions (tonnes CO₂e)', fontsize=12, fontweight='bold')
-            ax.set_title('Top Emission Sources', fontsize=16, fontweight='bold', pad=20)
-            ax.grid(axis='y', alpha=0.3, linestyle='--')
-            ax.set_axisbelow(True)
-            
-            plt.tight_layout()
-            
-            buf = BytesIO()
-            plt.savefig(buf, format='png', dpi=200, bbox_inches='tight', facecolor='white')
-            buf.seek(0)
-            plt.close()
-            
-            img = Image(buf, width=6 * inch, height=4 * inch)
-            img.hAlign = 'CENTER'
-            return img
-        except Exception as e:
-            print(f"Error creating top emitters chart: {e}")
-            return None
+        return chart_image(render_top_emitters_png(top_emitters), 6 * inch, 4 * inch)
 
     def _create_lifecycle_chart(self, lifecycle_data: Dict) -> Optional[Image]:
         """Create stacked bar chart for lifecycle phases"""
@@ -793,7 +827,7 @@ class PDFReportGenerator:
         canvas.saveState()
 
         # Header
-        canvas.setFillColor(colors.HexColor(self.branding['primary_color']))
+        canvas.setFillColor(self.brand_colors['primary_color'])
         canvas.rect(0, doc.height + doc.topMargin + 0.5 * inch, doc.width + doc.leftMargin + doc.rightMargin,
                     0.5 * inch, fill=1, stroke=0)
 
@@ -0,0 +1,88 @@
+"""Activity endpoints: a cleared date input is sent as "" and must not be rejected"""
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, get_db
+from app.models import Company, EmissionActivity, User
+from app.routers import activities
+from app.routers.auth import get_current_user
+
+
+@pytest.fixture
+def client(monkeypatch):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    TestingSession = sessionmaker(bind=engine)
+
+    with TestingSession() as db:
+        db.add(Company(id=1, name="Acme"))
+        db.add(User(id=1, username="user", email="user@example.com", hashed_password="x", company_id=1))
+        db.add(EmissionActivity(
+            id=1, company_id=1, activity_type="diesel", activity_name="Generator fuel",
+            quantity=10, unit="litre", emissions_kgco2e=26.8, scope="Scope 1", scope_number=1,
+            activity_date=datetime(2024, 5, 1)
+        ))
+        db.commit()
+
+    def override_get_db():
+        db = TestingSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def override_get_current_user():
+        with TestingSession() as db:
+            user = db.get(User, 1)
+            db.expunge(user)
+            return user
+
+    # Scope classification calls the OpenAI API
+    monkeypatch.setattr(activities, "classify_scope_and_category", lambda **kwargs: {
+        "scope": "Scope 1", "category_name": "Stationary Combustion", "sub_category": "1.1"
+    })
+
+    app = FastAPI()
+    app.include_router(activities.router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+    with TestClient(app) as test_client:
+        yield test_client
+    engine.dispose()
+
+
+def test_create_activity_with_blank_date_defaults_to_today(client):
+    response = client.post("/api/companies/1/activities", json={
+        "activity_type": "diesel", "quantity": 150, "unit": "litre", "activity_date": ""
+    })
+
+    assert response.status_code == 200, response.text
+    activity_date = response.json()["activity"]["activity_date"]
+    assert activity_date.startswith(datetime.now(timezone.utc).date().isoformat())
+
+
+def test_update_activity_with_blank_date_keeps_existing_date(client):
+    response = client.put("/api/companies/1/activities/1", json={"activity_date": ""})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["activity"]["activity_date"].startswith("2024-05-01")
+
+
+def test_activity_request_models_map_blank_date_to_none():
+    create = activities.ActivityCreateRequest(activity_type="diesel", quantity=1, unit="litre", activity_date="")
+    update = activities.ActivityUpdateRequest(activity_date="  ")
+
+    assert create.activity_date is None
+    assert update.activity_date is None